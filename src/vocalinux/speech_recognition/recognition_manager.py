@@ -920,6 +920,8 @@ class SpeechRecognitionManager:
         self.language = language
         self.stop_sound_guard_ms = kwargs.get("stop_sound_guard_ms", 200)
         self.state = RecognitionState.IDLE
+        # Notified on every _update_state() so callers can wait for a state
+        self._state_changed = threading.Condition()
         self.audio_thread = None
         self.recognition_thread = None
         self.model = None
@@ -2397,10 +2399,27 @@ class SpeechRecognitionManager:
         Args:
             new_state: The new recognition state
         """
-        self.state = new_state
+        with self._state_changed:
+            self.state = new_state
+            self._state_changed.notify_all()
         for callback in self.state_callbacks:
             callback(new_state)
 
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until recognition is idle.
+
+        Args:
+            timeout: Maximum number of seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the engine is idle, False if the timeout expired first
+        """
+        with self._state_changed:
+            return self._state_changed.wait_for(
+                lambda: self.state == RecognitionState.IDLE, timeout
+            )
+
     @property
     def model_ready(self) -> bool:
         """Check if the model is initialized and ready for recognition."""
@@ -3120,7 +3139,9 @@ class SpeechRecognitionManager:
             "whispercpp_n_threads",
             "whispercpp_gpu_device",
         ):
-            if param_name in kwargs:
+            # These are baked into the whisper.cpp model when it is created,
+            # so only an actual change needs a reload
+            if param_name in kwargs and kwargs[param_name] != getattr(self, param_name):
                 setattr(self, param_name, kwargs[param_name])
                 restart_needed = True
 
@@ -120,6 +120,8 @@ class ConfigManager:
     def __init__(self):
         """Initialize the configuration manager."""
         self.config = copy.deepcopy(DEFAULT_CONFIG)
+        # mtime (ns) of the config file as last read or written by this instance
+        self._loaded_mtime: Optional[int] = None
         self._ensure_config_dir()
         self.load_config()
 
@@ -138,8 +140,10 @@ class ConfigManager:
             return
 
         try:
+            mtime = self._config_file_mtime()
             with open(CONFIG_FILE, "r") as f:
                 user_config = json.load(f)
+            self._loaded_mtime = mtime
 
             # Check if migration is needed BEFORE merging with defaults
             needs_migration = self._check_needs_migration(user_config)
@@ -157,6 +161,27 @@ class ConfigManager:
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to load config: {e}")
 
+    def load_config_if_stale(self) -> bool:
+        """
+        Reload the config file only if it changed since this instance last saw it.
+
+        Returns:
+            True if the file was re-read, False if the in-memory config is current
+        """
+        mtime = self._config_file_mtime()
+        if mtime is None or mtime == self._loaded_mtime:
+            return False
+        self.load_config()
+        return True
+
+    @staticmethod
+    def _config_file_mtime() -> Optional[int]:
+        """Return the config file's mtime in nanoseconds, or None if it is missing."""
+        try:
+            return os.stat(CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return None
+
     def _check_needs_migration(self, user_config: dict) -> bool:
         """Check if the user config needs migration to add per-engine model sizes."""
         sr_config = user_config.get("speech_recognition", {})
@@ -231,6 +256,8 @@ class ConfigManager:
             self._ensure_config_dir()
             with open(CONFIG_FILE, "w") as f:
                 json.dump(self.config, f, indent=4)
+            # Our own write is already reflected in memory
+            self._loaded_mtime = self._config_file_mtime()
 
             logger.info(f"Saved configuration to {CONFIG_FILE}")
             return True
@@ -674,6 +674,11 @@ class LoggingDialog(Gtk.Dialog):
     def _copy_logs_to_clipboard(self):
         """Copy all visible logs to clipboard."""
         try:
+            # An empty buffer needs no copy of its contents to be rejected
+            if self.text_buffer.get_char_count() == 0:
+                self._show_toast("No logs to copy")
+                return
+
             # Get all text from the text buffer
             start_iter = self.text_buffer.get_start_iter()
             end_iter = self.text_buffer.get_end_iter()
@@ -775,7 +780,7 @@ class LoggingDialog(Gtk.Dialog):
             GLib.timeout_add(200, lambda: (content_area.remove(revealer), False)[1])
             return False
 
-        GLib.timeout_add(2000, hide_toast)
+        GLib.timeout_add_seconds(2, hide_toast)
 
     def _show_message(
         self, title: str, message: str, message_type: Gtk.MessageType = Gtk.MessageType.INFO
@@ -17,9 +17,12 @@ UX Design Notes:
 - Modal dialog for model downloads (explicit confirmation for large downloads)
 """
 
+import contextlib
+import functools
 import logging
 import os
 import re
+import subprocess
 import threading
 import time
 from typing import TYPE_CHECKING, Optional
@@ -77,6 +80,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# GTK/Pango enum values used throughout widget construction, resolved once
+_ALIGN_CENTER = Gtk.Align.CENTER
+_ORIENT_H = Gtk.Orientation.HORIZONTAL
+_ORIENT_V = Gtk.Orientation.VERTICAL
+_WRAP_WORD_CHAR = Pango.WrapMode.WORD_CHAR
+
 
 def _raw_audio_device_name(device_name: Optional[str]) -> Optional[str]:
     """Return the persisted device name without UI-only suffixes."""
@@ -107,6 +116,30 @@ def _resolve_audio_device_selection(
     return None
 
 
+# Enumerating input devices goes through PortAudio and can take a noticeable
+# moment, so a recent result is reused when the dialog is reopened.
+_AUDIO_DEVICE_CACHE_SECONDS = 5.0
+_audio_device_cache = None  # (time.monotonic() stamp, devices)
+
+
+def _recent_audio_input_devices() -> Optional[list]:
+    """Return the last device enumeration if it is still fresh, else None."""
+    cached = _audio_device_cache
+    if cached is None or time.monotonic() - cached[0] >= _AUDIO_DEVICE_CACHE_SECONDS:
+        return None
+    return cached[1]
+
+
+def _enumerate_audio_input_devices() -> list:
+    """Enumerate audio input devices (blocking) and remember the result."""
+    global _audio_device_cache
+    from ..speech_recognition.recognition_manager import get_audio_input_devices
+
+    devices = get_audio_input_devices()
+    _audio_device_cache = (time.monotonic(), devices)
+    return devices
+
+
 # Define available models for each engine
 ENGINE_MODELS = {
     "vosk": [
@@ -134,19 +167,20 @@ ENGINE_DISPLAY_NAMES = {
     "whisper_cpp": "whisper.cpp",
     "remote_api": "Remote API",
 }
+_ENGINE_IDS_BY_DISPLAY_NAME = {name: engine for engine, name in ENGINE_DISPLAY_NAMES.items()}
 
 
+@functools.lru_cache(maxsize=16)
 def _engine_display_name(engine: str) -> str:
     """Get the display name of the engine."""
-    return ENGINE_DISPLAY_NAMES.get(engine, engine.capitalize())
+    # Only capitalize engines missing from the table, not on every lookup
+    return ENGINE_DISPLAY_NAMES.get(engine) or engine.capitalize()
 
 
 def _engine_from_display(display_name: str) -> str:
     """Reverse lookup engine ID from display name."""
-    for engine_id, name in ENGINE_DISPLAY_NAMES.items():
-        if name == display_name:
-            return engine_id
-    return display_name.lower()
+    engine_id = _ENGINE_IDS_BY_DISPLAY_NAME.get(display_name)
+    return engine_id if engine_id is not None else display_name.lower()
 
 
 def _model_display_name(model_name: str) -> str:
@@ -242,9 +276,128 @@ def _default_whispercpp_variant_for_size(model_size: str, language_id: str) -> O
     return variants[0]
 
 
+def _build_shortcut_combo_rows() -> tuple:
+    """Return (id, text) rows for the shortcut picker: grouped presets, then Custom."""
+    rows = []
+    for group_label, shortcut_ids in SHORTCUT_GROUPS.items():
+        # Group separator shown as a label entry (not selectable as a shortcut)
+        separator_id = f"__separator_{group_label}__"
+        rows.append((separator_id, f"── {group_label} ──"))
+        for shortcut_id in shortcut_ids:
+            rows.append((shortcut_id, SHORTCUT_DISPLAY_NAMES.get(shortcut_id, shortcut_id)))
+    rows.append(("__custom__", "Custom Shortcut"))
+    return tuple(rows)
+
+
+# Static picker rows, built once per process rather than per dialog
+_SHORTCUT_COMBO_ROWS = _build_shortcut_combo_rows()
+
+# Languages with a VOSK model as (code, name); the download marker is added per dialog
+_VOSK_LANGUAGES = tuple(
+    (code, info["name"])
+    for code, info in SUPPORTED_LANGUAGES.items()
+    if info["vosk"] is not None and code != "auto"
+)
+# Whisper-family language rows; auto-detect is flagged as less reliable
+_WHISPER_LANGUAGE_ROWS = tuple(
+    (code, info["name"] + " ⚠" if code == "auto" else info["name"])
+    for code, info in SUPPORTED_LANGUAGES.items()
+)
+_WHISPER_ENGLISH_LANGUAGE_ROWS = tuple(
+    row for row in _WHISPER_LANGUAGE_ROWS if _language_is_english(row[0])
+)
+
 # Uniform width for right-hand row controls so they align down a page
 _CONTROL_WIDTH = 230
 
+# Quiet period before edits are saved and the engine reconfigured, so that
+# dragging a spin button or flicking through a combo applies only once
+_AUTO_APPLY_DELAY_MS = 250
+
+# Arrowing through the engine picker rebuilds the model pickers only for the
+# engine it settles on
+_ENGINE_CHANGE_DELAY_MS = 150
+
+# Toggles and pickers that only change the config share one delayed write
+_CONFIG_SAVE_DELAY_MS = 500
+
+# Settings the engine's audio loop reads live; changing only these needs no stop
+_RUNTIME_SETTINGS = frozenset({"vad_sensitivity", "silence_timeout"})
+
+# The dictation test output keeps only the most recent text
+_TEST_OUTPUT_MAX_CHARS = 4096
+
+# Footer label for each recognition state reported by the engine
+_RECOGNITION_STATE_NAMES = {
+    RecognitionState.IDLE: "Idle",
+    RecognitionState.LISTENING: "Listening",
+    RecognitionState.PROCESSING: "Processing",
+    RecognitionState.ERROR: "Error",
+}
+
+# Status strip CSS class for each recognition state shown in the footer
+_RECOGNITION_STATE_CLASSES = {
+    "Idle": "recognition-idle",
+    "Listening": "recognition-listening",
+    "Processing": "recognition-processing",
+    "Error": "recognition-error",
+}
+
+# How long the dictation test listens before stopping on its own
+_TEST_DURATION_SECONDS = 3
+
+# Download progress is redrawn at most this often (~30 Hz), however small the chunks
+_PROGRESS_INTERVAL_MS = 33
+
+# Legend for the status markers shown next to model picker entries
+_MODEL_LEGEND_ENTRIES = ("✓ Downloaded", "↓ Will download", "★ Recommended")
+_MODEL_LEGEND_TEXT = "    ".join(_MODEL_LEGEND_ENTRIES)
+
+# Markup for the model info card and shortcut feedback, filled in with str.format()
+_MARKUP_MODEL_TITLE = "<b>{name}</b>: {desc}"
+_MARKUP_MODEL_DOWNLOADED = "<span foreground='#26a269'>✓ Downloaded and ready</span>"
+_MARKUP_MODEL_WILL_DOWNLOAD = "<span foreground='#e5a50a'>↓ Will download ~{size}</span>"
+_MARKUP_MODEL_DETECTING = "<i>Detecting the best model for your system…</i>"
+_MARKUP_MODEL_RECOMMENDED = (
+    "<span foreground='#26a269'>★ Recommended for your system ({reason})</span>"
+)
+_MARKUP_MODEL_TIP = "Tip: <b>{name}</b> is recommended for your system ({reason})"
+_MARKUP_SHORTCUT_CUSTOM_HINT = (
+    "<i>Record or type a custom shortcut (e.g. alt+r), then click Set.</i>"
+)
+_MARKUP_SHORTCUT_ACTIVE = (
+    "<span foreground='#26a269'>Shortcut updated to <b>{name}</b>. Active now!</span>"
+)
+_MARKUP_SHORTCUT_NEEDS_RESTART = (
+    "<i>Shortcut updated to <b>{name}</b>. "
+    "Restart the app for the change to take full effect.</i>"
+)
+
+# Footer status line per recognition state. The label is shared with the
+# microphone test's own markup, so colors stay inline rather than in a class.
+_MARKUP_PROGRESS_LISTENING = "<span foreground='#26a269'>● Listening...</span>"
+_MARKUP_PROGRESS_PROCESSING = "<span foreground='#e5a50a'>● Processing speech...</span>"
+_MARKUP_PROGRESS_ERROR = "<span foreground='#c01c28'>✗ Error: {info}</span>"
+
+# Secondary text of the "Whisper Not Installed" dialog
+_WHISPER_INSTALL_TEXT = """Whisper AI is not installed. To use Whisper for speech recognition, you need to install it first.
+
+Installation Options:
+
+1. Using the installation script:
+   ./install.sh --with-whisper
+
+2. Manual installation in virtual environment:
+   source venv/bin/activate
+   pip install openai-whisper torch torchaudio
+
+3. If you have SSL issues, try:
+   pip install openai-whisper torch torchaudio --trusted-host pypi.org --trusted-host pypi.python.org --trusted-host files.pythonhosted.org
+
+Note: Whisper requires significant disk space (~1-3GB) and may take time to download.
+
+For now, the engine has been reverted to VOSK."""
+
 MODEL_SIZE_TOOLTIP = (
     "Choose the largest model your computer can run comfortably. Tiny/Base are fastest, "
     "Small is balanced, and Medium/Large can be more accurate but need more memory."
@@ -370,6 +523,7 @@ SYSTEM_MODELS_DIRS = [
     "/usr/local/share/vocalinux/models",
     "/usr/share/vocalinux/models",
 ]
+_ALL_MODEL_DIRS = (MODELS_DIR, *SYSTEM_MODELS_DIRS)
 
 # CSS for modern styling
 SETTINGS_CSS = """
@@ -646,15 +800,199 @@ spinbutton {
 """
 
 
+_SETTINGS_CSS_BYTES = SETTINGS_CSS.encode("utf-8")
+
+# Screen-wide provider installed by the first settings dialog
+_css_provider = None
+
+
 def _setup_css():
-    """Set up CSS styling for the settings dialog."""
+    """Set up CSS styling for the settings dialog.
+
+    The provider is registered for the whole screen, so it only needs to be
+    parsed and added once; later dialogs reuse it instead of stacking
+    duplicate providers.
+    """
+    global _css_provider
+    if _css_provider is not None:
+        return
+
     css_provider = Gtk.CssProvider()
-    css_provider.load_from_data(SETTINGS_CSS.encode())
+    css_provider.load_from_data(_SETTINGS_CSS_BYTES)
     Gtk.StyleContext.add_provider_for_screen(
         Gdk.Screen.get_default(),
         css_provider,
         Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
     )
+    _css_provider = css_provider
+
+
+# Whether _get_screen_geometry() has subscribed to monitor layout changes
+_screen_geometry_hooked = False
+
+
+def _reset_screen_geometry(*_args) -> None:
+    """Forget the cached screen geometry (connected to monitors-changed)."""
+    _get_screen_geometry.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_screen_geometry() -> tuple:
+    """
+    Get the (width, height) of the primary monitor, cached across dialog opens.
+
+    Falls back to 1920x1080 when no display or monitor is available. The cache
+    is reset whenever the monitor layout changes.
+    """
+    display = Gdk.Display.get_default()
+    if not display:
+        return 1920, 1080  # Default fallback
+
+    global _screen_geometry_hooked
+    if not _screen_geometry_hooked:
+        screen = Gdk.Screen.get_default()
+        if screen is not None:
+            screen.connect("monitors-changed", _reset_screen_geometry)
+            _screen_geometry_hooked = True
+
+    monitor = display.get_primary_monitor()
+    if not monitor and display.get_n_monitors() > 0:
+        monitor = display.get_monitor(0)
+    if not monitor:
+        return 1920, 1080  # Default fallback
+
+    geometry = monitor.get_geometry()
+    return geometry.width, geometry.height
+
+
+def _add_classes(widget: Gtk.Widget, *class_names: str) -> None:
+    """Add CSS style classes to a widget, fetching its style context once."""
+    context = widget.get_style_context()
+    for class_name in class_names:
+        context.add_class(class_name)
+
+
+def _set_markup_if_changed(label: Gtk.Label, markup: str) -> None:
+    """Set a label's markup, skipping the Pango re-parse when it is unchanged."""
+    if label.get_use_markup() and label.get_label() == markup:
+        return
+    label.set_markup(markup)
+
+
+def _set_text_if_changed(label: Gtk.Label, text: str) -> None:
+    """Set a label's plain text, skipping the relayout when it is unchanged."""
+    if not label.get_use_markup() and label.get_label() == text:
+        return
+    label.set_text(text)
+
+
+def _coalesce_idle(func, delay_ms: int = 0, priority: Optional[int] = None):
+    """
+    Wrap ``func`` so calls from any thread share one pending GLib idle callback.
+
+    Only the most recent arguments reach ``func``; updates that arrive before
+    the main loop gets to the pending callback replace each other instead of
+    queueing one idle source apiece. With ``delay_ms`` the callback runs from
+    a timeout instead, capping deliveries at one per ``delay_ms``. ``priority``
+    overrides the idle source priority, e.g. to let other idle work go first.
+    """
+    lock = threading.Lock()
+    pending = []  # at most one args tuple
+
+    def flush():
+        with lock:
+            args = pending.pop()
+        func(*args)
+        return False
+
+    def post(*args):
+        with lock:
+            scheduled = bool(pending)
+            pending[:] = [args]
+        if not scheduled:
+            if delay_ms:
+                GLib.timeout_add(delay_ms, flush)
+            elif priority is None:
+                GLib.idle_add(flush)
+            else:
+                GLib.idle_add(flush, priority=priority)
+
+    return post
+
+
+def _batch_idle(func):
+    """
+    Wrap ``func`` so items posted from any thread reach it in batches.
+
+    Items that arrive before the main loop gets to the pending idle callback
+    are handed to ``func`` together as one list, in the order they were
+    posted, instead of scheduling one idle source apiece. An item posted on
+    the main thread with nothing queued ahead of it is delivered directly.
+    """
+    lock = threading.Lock()
+    pending = []
+
+    def flush():
+        with lock:
+            items = pending[:]
+            pending.clear()
+        func(items)
+        return False
+
+    def post(item):
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        with lock:
+            scheduled = bool(pending)
+            if scheduled or not on_main_thread:
+                pending.append(item)
+        if scheduled:
+            return
+        if on_main_thread:
+            func([item])
+        else:
+            GLib.idle_add(flush)
+
+    return post
+
+
+@contextlib.contextmanager
+def _handler_blocked(widget, handler_id: Optional[int]):
+    """
+    Block one signal handler on ``widget`` while it is repopulated.
+
+    Property notifications are frozen for the same span so they go out as
+    one batch. ``handler_id`` is None before the dialog wires its signals,
+    in which case only the notifications are batched.
+    """
+    widget.freeze_notify()
+    if handler_id is not None:
+        widget.handler_block(handler_id)
+    try:
+        yield
+    finally:
+        if handler_id is not None:
+            widget.handler_unblock(handler_id)
+        widget.thaw_notify()
+
+
+def _set_combo_rows(combo: Gtk.ComboBoxText, rows) -> None:
+    """
+    Replace the entries of a ComboBoxText with ``(id, text)`` rows.
+
+    The rows go into a detached Gtk.ListStore laid out like the combo's own
+    model (text column, id column), which is then attached in one
+    set_model() call. Compared to remove_all() plus one append() per row,
+    the combo sees a single model change instead of a signal per row.
+    Refilling a combo with the rows it already shows is skipped entirely.
+    """
+    rows = tuple(rows)
+    if getattr(combo, "_combo_rows", None) == rows:
+        return
+    store = Gtk.ListStore(str, str)
+    for row_id, text in rows:
+        store.append((text, row_id))
+    combo.set_model(store)
+    combo._combo_rows = rows
 
 
 def _prevent_scroll_on_hover(widget: Gtk.Widget):
@@ -683,50 +1021,131 @@ def _get_whisper_cache_dir() -> str:
     return os.path.join(MODELS_DIR, "whisper")
 
 
+@functools.lru_cache(maxsize=8)
+def _dir_entries(path: str) -> frozenset:
+    """
+    List the entry names of a directory with a single scandir() call.
+
+    Model pickers check many candidate files against the same few
+    directories, so the listing is cached; call _clear_model_dir_caches()
+    after a download adds new files.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=1)
+def _whisper_cache_dirs() -> tuple:
+    """Return the Whisper model cache directories that exist."""
+    # Our own cache first, then the default whisper cache
+    candidates = (_get_whisper_cache_dir(), os.path.expanduser("~/.cache/whisper"))
+    return tuple(path for path in candidates if os.path.isdir(path))
+
+
+def _clear_model_dir_caches() -> None:
+    """Forget cached model directory state, e.g. after a download."""
+    _dir_entries.cache_clear()
+    _whisper_cache_dirs.cache_clear()
+
+
 def _is_whisper_model_downloaded(model_name: str) -> bool:
     """Check if a Whisper model is downloaded."""
-    cache_dir = _get_whisper_cache_dir()
-    model_file = os.path.join(cache_dir, f"{model_name}.pt")
-    if os.path.exists(model_file):
-        return True
-    # Also check default whisper cache
-    default_cache = os.path.expanduser("~/.cache/whisper")
-    return os.path.exists(os.path.join(default_cache, f"{model_name}.pt"))
+    model_file = f"{model_name}.pt"
+    return any(model_file in _dir_entries(cache_dir) for cache_dir in _whisper_cache_dirs())
 
 
+@functools.lru_cache(maxsize=32)
 def _format_size(size_mb: int) -> str:
     """Format size in MB to human readable string."""
     if size_mb >= 1000:
         return f"{size_mb / 1000:.1f} GB"
-    return f"{size_mb} MB"
+    return "%d MB" % size_mb
+
+
+def _build_model_rows(engine: str, model_info: dict) -> tuple:
+    """Return (size, "Name (size)") rows for an engine's model picker.
+
+    The config's lowercase size doubles as the row id, so the selected id can
+    be saved and compared without recasing it.
+    """
+    return tuple(
+        (
+            size,
+            f"{_model_display_name(size)} "
+            f"({_format_size(model_info.get(size, {}).get('size_mb', 0))})",
+        )
+        for size in ENGINE_MODELS[engine]
+    )
+
+
+# Model picker labels are static; only the ✓/↓/★ markers are added per dialog
+_MODEL_ROWS = {
+    "whisper": _build_model_rows("whisper", WHISPER_MODEL_INFO),
+    "vosk": _build_model_rows("vosk", VOSK_MODEL_INFO),
+}
+_WHISPERCPP_SIZE_LABELS = {size: _model_display_name(size) for size in ENGINE_MODELS["whisper_cpp"]}
+_WHISPERCPP_VARIANT_LABELS = {
+    model_name: (
+        f"{_model_specialization_display_name(model_name)} ({_format_size(info['size_mb'])})"
+    )
+    for model_name, info in WHISPERCPP_MODEL_INFO.items()
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_cuda_memory_gb() -> int:
+    """
+    Get the total memory of the first NVIDIA GPU in whole GB, or 0 if none.
+
+    Asks NVML or nvidia-smi directly instead of importing torch, which would
+    load the whole CUDA runtime just to answer this question. The GPU
+    inventory does not change during a session, so the result is cached.
+    """
+    try:
+        import pynvml
+
+        pynvml.nvmlInit()
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            return pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024**3)
+        finally:
+            pynvml.nvmlShutdown()
+    except Exception:
+        pass
+
+    # Without the kernel driver there is no point spawning nvidia-smi
+    if not os.path.exists("/proc/driver/nvidia/version"):
+        return 0
+
+    try:
+        result = subprocess.run(
+            ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            memory_mib = int(result.stdout.splitlines()[0].strip())
+            return memory_mib // 1024
+    except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+        logger.debug(f"CUDA memory detection failed: {e}")
+    return 0
 
 
 def _get_recommended_whisper_model() -> tuple:
     """Get recommended model based on system configuration."""
-    import warnings
-
     try:
         import psutil
 
         ram_gb = psutil.virtual_memory().total // (1024**3)
+        cuda_memory_gb = _detect_cuda_memory_gb()
 
-        # Check for CUDA - suppress warnings during detection
-        has_cuda = False
-        cuda_memory_gb = 0
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                import torch
-
-                if torch.cuda.is_available():
-                    has_cuda = True
-                    cuda_memory_gb = torch.cuda.get_device_properties(0).total_memory // (1024**3)
-        except Exception:
-            pass
-
-        if has_cuda and cuda_memory_gb >= 8:
+        if cuda_memory_gb >= 8:
             return "medium", f"GPU with {cuda_memory_gb}GB VRAM"
-        elif has_cuda and cuda_memory_gb >= 4:
+        elif cuda_memory_gb >= 4:
             return "small", f"GPU with {cuda_memory_gb}GB VRAM"
         elif ram_gb >= 8:
             return "small", f"{ram_gb}GB RAM - good balance"
@@ -749,18 +1168,8 @@ def _is_vosk_model_downloaded(size: str, language: str) -> bool:
 
     model_name = VOSK_MODEL_INFO[size]["languages"][language]
 
-    # Check user's local models directory
-    user_model_path = os.path.join(MODELS_DIR, model_name)
-    if os.path.exists(user_model_path):
-        return True
-
-    # Check system-wide installation directories
-    for system_dir in SYSTEM_MODELS_DIRS:
-        system_model_path = os.path.join(system_dir, model_name)
-        if os.path.exists(system_model_path):
-            return True
-
-    return False
+    # Check user's local models directory, then system-wide installations
+    return any(model_name in _dir_entries(base_dir) for base_dir in _ALL_MODEL_DIRS)
 
 
 def _get_recommended_vosk_model() -> tuple:
@@ -865,8 +1274,8 @@ class PreferencesGroup(Gtk.Box):
         keywords=(),
         header_icon: Optional[Gtk.Widget] = None,
     ):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        self.get_style_context().add_class("preferences-group")
+        super().__init__(orientation=_ORIENT_V, spacing=0)
+        _add_classes(self, "preferences-group")
         self.title = title
         self.description = description
         self.keywords = tuple(keywords)
@@ -874,28 +1283,28 @@ class PreferencesGroup(Gtk.Box):
 
         # Header with title (optional icon aligned to the top-right)
         if title:
-            text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+            text_box = Gtk.Box(orientation=_ORIENT_V, spacing=2)
 
             title_label = Gtk.Label(label=title, xalign=0)
-            title_label.get_style_context().add_class("preferences-group-title")
+            _add_classes(title_label, "preferences-group-title")
             text_box.pack_start(title_label, False, False, 0)
 
             if description:
                 desc_label = Gtk.Label(label=description, xalign=0, wrap=True)
-                desc_label.get_style_context().add_class("preference-row-subtitle")
+                _add_classes(desc_label, "preference-row-subtitle")
                 # Align with the title, which carries 16px CSS padding.
                 desc_label.set_margin_start(16)
                 desc_label.set_margin_end(16)
                 text_box.pack_start(desc_label, False, False, 0)
 
             if header_icon is not None:
-                header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+                header_box = Gtk.Box(orientation=_ORIENT_H, spacing=12)
                 header_box.set_margin_top(12)
                 header_box.set_margin_bottom(4)
                 header_box.set_margin_start(16)
                 header_box.set_margin_end(16)
                 header_box.pack_start(text_box, True, True, 0)
-                header_icon.set_valign(Gtk.Align.CENTER)
+                header_icon.set_valign(_ALIGN_CENTER)
                 header_box.pack_end(header_icon, False, False, 0)
             else:
                 header_box = text_box
@@ -931,40 +1340,47 @@ class PreferenceRow(Gtk.ListBoxRow):
     ):
         super().__init__()
         self.set_activatable(activatable)
-        self.get_style_context().add_class("preference-row")
+        _add_classes(self, "preference-row")
         self.title = title
         self.subtitle = subtitle
         self.keywords = tuple(keywords)
 
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        hbox.set_margin_top(12)
-        hbox.set_margin_bottom(12)
-        hbox.set_margin_start(16)
-        hbox.set_margin_end(16)
+        # Rows are built by the dozen, so pass properties at construction
+        # time rather than through one setter call each.
+        hbox = Gtk.Box(
+            orientation=_ORIENT_H,
+            spacing=12,
+            margin_top=12,
+            margin_bottom=12,
+            margin_start=16,
+            margin_end=16,
+        )
 
         # Text container (title + subtitle)
-        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        text_box.set_valign(Gtk.Align.CENTER)
+        text_box = Gtk.Box(orientation=_ORIENT_V, spacing=2, valign=_ALIGN_CENTER)
 
         title_label = Gtk.Label(label=title, xalign=0)
-        title_label.get_style_context().add_class("preference-row-title")
+        _add_classes(title_label, "preference-row-title")
         text_box.pack_start(title_label, False, False, 0)
 
         # Store subtitle label reference for later updates
         self.subtitle_label = None
         if subtitle:
-            self.subtitle_label = Gtk.Label(label=subtitle, xalign=0, wrap=True)
-            self.subtitle_label.get_style_context().add_class("preference-row-subtitle")
-            self.subtitle_label.set_max_width_chars(55)
-            self.subtitle_label.set_line_wrap(True)
-            self.subtitle_label.set_line_wrap_mode(Pango.WrapMode.WORD_CHAR)
+            self.subtitle_label = Gtk.Label(
+                label=subtitle,
+                xalign=0,
+                wrap=True,
+                wrap_mode=_WRAP_WORD_CHAR,
+                max_width_chars=55,
+            )
+            _add_classes(self.subtitle_label, "preference-row-subtitle")
             text_box.pack_start(self.subtitle_label, False, False, 0)
 
         hbox.pack_start(text_box, True, True, 0)
 
         # Control widget on the right
         if widget:
-            widget.set_valign(Gtk.Align.CENTER)
+            widget.set_valign(_ALIGN_CENTER)
             hbox.pack_end(widget, False, False, 0)
 
         self.add(hbox)
@@ -998,7 +1414,7 @@ class SettingsPage:
         self.match_count_label = None
         self.update_badge_label = None
 
-        self.box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        self.box = Gtk.Box(orientation=_ORIENT_V, spacing=12)
         self.box.set_margin_top(16)
         self.box.set_margin_bottom(16)
         self.box.set_margin_start(16)
@@ -1040,6 +1456,7 @@ class ModelDownloadDialog(Gtk.Dialog):
         model_size_mb: int,
         engine: str = "whisper",
         language: str = "en-us",
+        on_cancel=None,
     ):
         super().__init__(
             title=f"Downloading {_model_display_name(model_name)} Model",
@@ -1049,11 +1466,18 @@ class ModelDownloadDialog(Gtk.Dialog):
         self.set_default_size(450, 200)
         self.set_deletable(False)  # Prevent closing during download
 
-        self.cancelled = False
+        # Set from the cancel button; read by the download thread as well
+        self.cancel_event = threading.Event()
+        # Called from the cancel button, so the download worker is told right
+        # away instead of the dialog being polled for its state.
+        self._on_cancel = on_cancel
+        self._post_progress = _coalesce_idle(self.update_progress, _PROGRESS_INTERVAL_MS)
         self.engine = engine
         self.model_name = model_name
+        # Set once real progress arrives (or the download ends) to stop pulsing
+        self._pulse_cleared = False
 
-        engine_display = engine.upper() if engine == "vosk" else engine.capitalize()
+        engine_display = _engine_display_name(engine)
 
         box = self.get_content_area()
         box.set_spacing(16)
@@ -1082,13 +1506,13 @@ class ModelDownloadDialog(Gtk.Dialog):
         # Status label (shows speed and ETA)
         self.status_label = Gtk.Label(label="")
         self.status_label.set_markup("<i>Please wait...</i>")
-        self.status_label.get_style_context().add_class("status-info")
+        _add_classes(self.status_label, "status-info")
         box.pack_start(self.status_label, False, False, 0)
 
         # Cancel button
         self.cancel_button = Gtk.Button(label="Cancel")
         self.cancel_button.connect("clicked", self._on_cancel_clicked)
-        self.cancel_button.set_halign(Gtk.Align.CENTER)
+        self.cancel_button.set_halign(_ALIGN_CENTER)
         self.cancel_button.set_margin_top(12)
         box.pack_start(self.cancel_button, False, False, 0)
 
@@ -1100,29 +1524,57 @@ class ModelDownloadDialog(Gtk.Dialog):
         else:
             self._pulse_timeout = None
 
+    @property
+    def cancelled(self) -> bool:
+        """Whether the user asked to cancel the download."""
+        return self.cancel_event.is_set()
+
     def _pulse_progress(self):
         """Pulse the progress bar while downloading (for Whisper)."""
-        if self.cancelled:
+        if self.cancelled or self._pulse_cleared:
+            # Returning False destroys the source; forget its id so it is
+            # not removed a second time.
+            self._pulse_timeout = None
             return False
         self.progress_bar.pulse()
         return True  # Continue pulsing
 
+    def _stop_pulsing(self):
+        """Stop the indeterminate pulse animation, if it is running."""
+        self._pulse_cleared = True
+        if self._pulse_timeout:
+            GLib.source_remove(self._pulse_timeout)
+            self._pulse_timeout = None
+
     def _on_cancel_clicked(self, widget):
         """Handle cancel button click."""
-        self.cancelled = True
+        self.cancel_event.set()
         self.cancel_button.set_sensitive(False)
         self.cancel_button.set_label("Cancelling...")
         self.status_label.set_markup("<i>Cancelling download...</i>")
+        if self._on_cancel is not None:
+            self._on_cancel()
+
+    def report_progress(self, fraction: float, speed_mbps: float, status_text: str):
+        """
+        Forward download progress from the download thread.
+
+        The engine clears its cancel flag when a download starts, so a cancel
+        clicked before that point is re-sent here, at chunk granularity.
+        """
+        if self.cancel_event.is_set():
+            if self._on_cancel is not None:
+                self._on_cancel()
+            return
+        self._post_progress(fraction, speed_mbps, status_text)
 
     def update_progress(self, fraction: float, speed_mbps: float, status_text: str):
         """Update the progress bar with actual download progress."""
         if self.cancelled:
             return
 
-        # Stop pulsing if we were pulsing
-        if self._pulse_timeout:
-            GLib.source_remove(self._pulse_timeout)
-            self._pulse_timeout = None
+        # Real progress is available, so stop pulsing
+        self._stop_pulsing()
 
         self.progress_bar.set_fraction(fraction)
         self.progress_bar.set_text(f"{fraction * 100:.0f}%")
@@ -1130,9 +1582,7 @@ class ModelDownloadDialog(Gtk.Dialog):
 
     def set_complete(self, success: bool, message: str = ""):
         """Mark download as complete."""
-        if self._pulse_timeout:
-            GLib.source_remove(self._pulse_timeout)
-            self._pulse_timeout = None
+        self._stop_pulsing()
 
         # Hide cancel button
         self.cancel_button.hide()
@@ -1183,13 +1633,26 @@ class SettingsDialog(Gtk.Dialog):
         self.shortcut_update_callback = shortcut_update_callback
         self.update_status_callback = update_status_callback
         self._test_active = False
-        self._test_result = ""
+        self._test_has_text = False  # test output holds recognized text
+        self.test_textview = None  # built with the test output on the first test
+        self.test_buffer = None
+        self._test_end_mark = None  # stays at the end of test_buffer
+        self._test_timeout_id = None
+        self._recognition_state_class = None  # state CSS class on the status label
+        self._whisper_install_dialog = None
+        self._apply_error_dialog = None  # reused "Error Applying Settings" dialog
+        self._config_save_id = None
         self._initializing = True  # Flag to prevent auto-apply during initialization
-        self._populating_models = False  # Flag to prevent model change handler during population
-        self._processing_language_change = (
-            False  # Flag to prevent recursive language change handling
-        )
+        # "changed" handler ids, blocked while the code itself refills a combo
+        self._engine_changed_id = None
+        self._model_changed_id = None
+        self._model_variant_changed_id = None
+        self._language_changed_id = None
+        self._audio_device_changed_id = None
         self._applying_settings = False  # Flag to prevent recursive settings application
+        self._background_apply = False  # engine reconfigure running on a worker thread
+        self._reapply_after_background = False  # settings changed during that apply
+        self._test_after_background = False  # dictation test waiting for that apply
         self._advanced_prompt_dirty = False
         self._about_release_url = ""
         self._update_check_in_progress = False
@@ -1197,31 +1660,45 @@ class SettingsDialog(Gtk.Dialog):
         self._update_auto_checked = False
         self._initial_page = initial_page
         self._pending_update = pending_update
+        # Filled in by _detect_system_capabilities() once the hardware probes finish
+        self._recommended_models = {}  # engine -> (model, reason)
+        self._backend_display = None  # whisper.cpp compute backend, e.g. "Vulkan"
+        # Pages built on first visit (or first search) instead of at open time
+        self._page_builders = {"about": self._build_about_page}
+        # Per-dialog lookups reused across the populate/update/apply helpers
+        self._available_engines = None  # get_available_engines() result
+        self._download_cache = {}  # (engine, model, language) -> bool
+        self._apply_timeout_id = None  # pending _auto_apply_settings_now source
+        self._engine_change_id = None  # pending _apply_engine_change source
+        # Audio levels arrive per audio chunk; only the latest one is drawn, at
+        # low priority so recognition state changes queued behind it go first
+        self._post_audio_level = _coalesce_idle(
+            self._update_audio_level, priority=GLib.PRIORITY_LOW
+        )
+        # Test transcripts that arrive together are appended in one go
+        self._post_test_text = _batch_idle(lambda texts: self._append_test_result(" ".join(texts)))
 
         # Setup CSS styling
         _setup_css()
 
+        # Hardware probes for model recommendations and the whisper.cpp backend
+        # can take a while (psutil, GPU tools), so run them while the widgets
+        # are being built.
+        threading.Thread(target=self._detect_system_capabilities, daemon=True).start()
+        # Probing the engine packages imports them (Whisper pulls in torch), so
+        # the engine list is filled in once that finishes.
+        threading.Thread(target=self._detect_available_engines, daemon=True).start()
+
+        # Models may have been added or removed since the dialog was last open
+        _clear_model_dir_caches()
+
         # Dialog configuration - Close button lives in the sidebar footer (see #323)
         # Calculate dialog size
-        display = Gdk.Display.get_default()
-        if display:
-            monitor = display.get_primary_monitor()
-            if not monitor and display.get_n_monitors() > 0:
-                monitor = display.get_monitor(0)
-            if monitor:
-                geometry = monitor.get_geometry()
-                screen_height = geometry.height
-                screen_width = geometry.width
-            else:
-                screen_height = 1080  # Default fallback
-                screen_width = 1920
-        else:
-            screen_height = 1080  # Default fallback
-            screen_width = 1920
+        screen_width, screen_height = _get_screen_geometry()
         dialog_height = min(760, int(screen_height * 0.8))
         dialog_width = min(880, int(screen_width * 0.85))
         self.set_default_size(dialog_width, dialog_height)
-        self.get_style_context().add_class("settings-dialog")
+        _add_classes(self, "settings-dialog")
 
         # Topic-based pages (GNOME HIG: group by topic, navigate via sidebar)
         # Icons stick to the stock Adwaita symbolic set so they resolve on
@@ -1268,13 +1745,13 @@ class SettingsDialog(Gtk.Dialog):
         self.settings_stack.add_named(self._build_search_empty_page(), "search-empty")
         self.settings_stack.connect("notify::visible-child", self._on_settings_page_changed)
 
-        sidebar_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        sidebar_box.get_style_context().add_class("settings-sidebar")
+        sidebar_box = Gtk.Box(orientation=_ORIENT_V, spacing=0)
+        _add_classes(sidebar_box, "settings-sidebar")
         sidebar_box.set_size_request(200, -1)
 
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_placeholder_text("Search settings…")
-        self.search_entry.get_style_context().add_class("settings-search")
+        _add_classes(self.search_entry, "settings-search")
         self.search_entry.connect("search-changed", self._on_search_changed)
         sidebar_box.pack_start(self.search_entry, False, False, 0)
 
@@ -1285,7 +1762,7 @@ class SettingsDialog(Gtk.Dialog):
         self.sidebar_listbox.connect("row-selected", self._on_sidebar_row_selected)
         sidebar_box.pack_start(self.sidebar_listbox, True, True, 0)
 
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
+        main_box = Gtk.Box(orientation=_ORIENT_H, spacing=0)
         main_box.pack_start(sidebar_box, False, False, 0)
         main_box.pack_start(self.settings_stack, True, True, 0)
         self.get_content_area().pack_start(main_box, True, True, 0)
@@ -1308,27 +1785,25 @@ class SettingsDialog(Gtk.Dialog):
         self._build_gpu_section()
         self._build_general_section()
         self._build_advanced_section()
-        self._build_about_section()
         self._build_sidebar_footer(sidebar_box)
 
         # Record searchable groups vs. loose extras per page
         for page in self._pages:
             page.collect_children()
 
-        # Load settings and populate UI
+        # Load settings and populate UI, then start listening for user edits
+        # so populating the widgets doesn't run any change handlers.
         self._load_and_apply_settings()
+        self._wire_signals()
 
         self.connect("response", self._on_settings_dialog_response)
         self.connect("key-press-event", self._on_dialog_key_press)
+        self.connect("destroy", self._on_dialog_destroy)
 
         # Show everything first
         self.show_all()
-        # Release notes stay hidden until a successful update check.
-        self.release_notes_group.hide()
         # Re-hide the About "New" badge if show_all revealed it without a pending update.
         self._set_about_update_badge(self._pending_update is not None)
-        # Seed About from a tray background check (opens with notes already filled).
-        self._seed_pending_update_ui()
         if self._initial_page:
             self.navigate_to_page(self._initial_page)
         else:
@@ -1346,6 +1821,40 @@ class SettingsDialog(Gtk.Dialog):
         # Initialization complete - enable auto-apply
         self._initializing = False
 
+    def refresh(
+        self,
+        initial_page: Optional[str] = None,
+        pending_update: Optional[ReleaseInfo] = None,
+    ) -> None:
+        """Re-sync a hidden, reused dialog with the config before it is shown again.
+
+        Widgets are kept; only their values are reloaded, the same way
+        __init__ fills them after building the pages.
+        """
+        self._initializing = True
+        try:
+            self.search_entry.set_text("")
+            self._restore_search_baseline()
+
+            # Models may have been added or removed while the dialog was hidden
+            self._forget_model_downloads()
+            self._load_and_apply_settings()
+            self._update_engine_specific_ui()
+
+            self._pending_update = pending_update
+            self._update_auto_checked = False
+            self._set_about_update_badge(pending_update is not None)
+            if "about" not in self._page_builders:
+                self._seed_pending_update_ui()
+
+            if initial_page:
+                self.navigate_to_page(initial_page)
+            self.update_recognition_progress("Idle")
+        finally:
+            self._initializing = False
+
+        self.connect_to_recognition_manager()
+
     # ------------------------------------------------------------------
     # Navigation: sidebar, stack, and settings search
     # ------------------------------------------------------------------
@@ -1361,7 +1870,7 @@ class SettingsDialog(Gtk.Dialog):
     def _build_sidebar_row(self, page: SettingsPage) -> Gtk.ListBoxRow:
         """Build one sidebar navigation row (icon + title + match badge)."""
         row = Gtk.ListBoxRow()
-        row.get_style_context().add_class("sidebar-row")
+        _add_classes(row, "sidebar-row")
         row.page_name = page.name
 
         hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -1372,13 +1881,13 @@ class SettingsDialog(Gtk.Dialog):
         hbox.pack_start(label, True, True, 0)
 
         update_badge = Gtk.Label(label="New")
-        update_badge.get_style_context().add_class("sidebar-update-badge")
+        _add_classes(update_badge, "sidebar-update-badge")
         update_badge.set_no_show_all(True)
         update_badge.hide()
         hbox.pack_end(update_badge, False, False, 0)
 
         match_label = Gtk.Label(label="")
-        match_label.get_style_context().add_class("sidebar-match-count")
+        _add_classes(match_label, "sidebar-match-count")
         match_label.set_no_show_all(True)
         hbox.pack_end(match_label, False, False, 0)
 
@@ -1401,11 +1910,11 @@ class SettingsDialog(Gtk.Dialog):
         box.pack_start(icon, False, False, 0)
 
         title = Gtk.Label(label="No matching settings")
-        title.get_style_context().add_class("search-empty-title")
+        _add_classes(title, "search-empty-title")
         box.pack_start(title, False, False, 0)
 
         self.search_empty_label = Gtk.Label(label="Try a different search term.")
-        self.search_empty_label.get_style_context().add_class("preference-row-subtitle")
+        _add_classes(self.search_empty_label, "preference-row-subtitle")
         box.pack_start(self.search_empty_label, False, False, 0)
         return box
 
@@ -1414,9 +1923,19 @@ class SettingsDialog(Gtk.Dialog):
         if row is not None:
             self.settings_stack.set_visible_child_name(row.page_name)
 
+    def _ensure_page_built(self, page_name: str) -> None:
+        """Run the deferred builder for ``page_name`` the first time it is needed."""
+        builder = self._page_builders.pop(page_name, None)
+        if builder is None:
+            return
+        builder()
+        page = next(page for page in self._pages if page.name == page_name)
+        page.collect_children()
+
     def _on_settings_page_changed(self, stack, pspec):
         """Persist deferred edits when the visible settings page changes."""
         visible = stack.get_visible_child_name()
+        self._ensure_page_built(visible)
         if visible != "advanced":
             self._flush_advanced_prompt_if_dirty()
         if visible == "about" and not self._update_auto_checked:
@@ -1517,6 +2036,9 @@ class SettingsDialog(Gtk.Dialog):
             return
 
         if self._search_baseline is None:
+            # Search covers every page, so finish any deferred ones first.
+            for page_name in list(self._page_builders):
+                self._ensure_page_built(page_name)
             self._snapshot_search_baseline()
 
         baseline = self._search_baseline
@@ -1585,7 +2107,7 @@ class SettingsDialog(Gtk.Dialog):
 
         refresh_btn = Gtk.Button.new_from_icon_name("view-refresh-symbolic", Gtk.IconSize.BUTTON)
         refresh_btn.set_tooltip_text("Refresh device list")
-        refresh_btn.get_style_context().add_class("flat-button")
+        _add_classes(refresh_btn, "flat-button")
         refresh_btn.connect("clicked", self._on_refresh_audio_devices)
         device_box.pack_start(refresh_btn, False, False, 0)
 
@@ -1625,11 +2147,9 @@ class SettingsDialog(Gtk.Dialog):
         )
         sound_group.add_row(sound_row)
         self.audio_tab.pack_start(sound_group, False, False, 0)
-        self.sound_effects_switch.connect("state-set", self._on_sound_effects_toggled)
 
         # Populate devices
         self._populate_audio_devices()
-        self.audio_device_combo.connect("changed", self._on_audio_device_changed)
 
     def _build_general_section(self):
         """Build the Application page: general behavior."""
@@ -1664,10 +2184,6 @@ class SettingsDialog(Gtk.Dialog):
 
         self.general_tab.pack_start(group, False, False, 0)
 
-        self.autostart_switch.connect("state-set", self._on_autostart_toggled)
-        self.start_minimized_switch.connect("state-set", self._on_start_minimized_toggled)
-        self.missing_tray_warning_switch.connect("state-set", self._on_missing_tray_warning_toggled)
-
     def _build_auto_pause_section(self):
         """Build Auto-Pause settings: enable toggle + process name list."""
         group = PreferencesGroup(
@@ -1736,7 +2252,7 @@ class SettingsDialog(Gtk.Dialog):
             wrap=True,
             justify=Gtk.Justification.CENTER,
         )
-        self.auto_pause_empty_label.get_style_context().add_class("preference-row-subtitle")
+        _add_classes(self.auto_pause_empty_label, "preference-row-subtitle")
         self.auto_pause_empty_label.set_margin_top(12)
         self.auto_pause_empty_label.set_margin_bottom(12)
         self.auto_pause_empty_label.set_margin_start(16)
@@ -1760,8 +2276,6 @@ class SettingsDialog(Gtk.Dialog):
 
         self.power_tab.pack_start(group, False, False, 0)
 
-        self.auto_pause_switch.connect("state-set", self._on_auto_pause_enabled_toggled)
-
     def _update_auto_pause_sensitivity(self, enabled: bool) -> None:
         """Gray out the app-list controls while auto-pause is disabled."""
         for widget in (
@@ -1790,7 +2304,7 @@ class SettingsDialog(Gtk.Dialog):
             seen.add(key)
             cleaned.append(name.strip())
         self.config_manager.set("auto_pause", "apps", cleaned)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         self._refresh_auto_pause_list()
 
     def _refresh_auto_pause_list(self) -> None:
@@ -1832,7 +2346,7 @@ class SettingsDialog(Gtk.Dialog):
             return False
         logger.info("Auto-pause enabled toggled: %s", enabled)
         self.config_manager.set("auto_pause", "enabled", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         return False
 
     def _on_auto_pause_add_clicked(self, widget):
@@ -1958,14 +2472,16 @@ class SettingsDialog(Gtk.Dialog):
         self.model_keepalive_timeout_combo = Gtk.ComboBoxText()
         self.model_keepalive_timeout_combo.set_size_request(_CONTROL_WIDTH, -1)
         # id = seconds as string
-        for seconds, label in (
-            (60, "1 minute"),
-            (300, "5 minutes"),
-            (600, "10 minutes"),
-            (900, "15 minutes"),
-            (1800, "30 minutes"),
-        ):
-            self.model_keepalive_timeout_combo.append(str(seconds), label)
+        _set_combo_rows(
+            self.model_keepalive_timeout_combo,
+            (
+                ("60", "1 minute"),
+                ("300", "5 minutes"),
+                ("600", "10 minutes"),
+                ("900", "15 minutes"),
+                ("1800", "30 minutes"),
+            ),
+        )
         self.model_keepalive_timeout_combo.set_tooltip_text(
             "How long to wait after the last dictation before unloading the model"
         )
@@ -1979,11 +2495,6 @@ class SettingsDialog(Gtk.Dialog):
 
         self.power_tab.pack_start(group, False, False, 0)
 
-        self.model_keepalive_switch.connect("state-set", self._on_model_keepalive_enabled_toggled)
-        self.model_keepalive_timeout_combo.connect(
-            "changed", self._on_model_keepalive_timeout_changed
-        )
-
     def _update_model_keepalive_sensitivity(self, enabled: bool) -> None:
         """Gray out the idle timeout selector while idle unload is disabled."""
         self.model_keepalive_timeout_combo.set_sensitive(enabled)
@@ -1995,7 +2506,7 @@ class SettingsDialog(Gtk.Dialog):
             return False
         logger.info("Model keep-alive enabled toggled: %s", enabled)
         self.config_manager.set("model_keepalive", "enabled", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         return False
 
     def _on_model_keepalive_timeout_changed(self, widget):
@@ -2010,7 +2521,7 @@ class SettingsDialog(Gtk.Dialog):
             return
         logger.info("Model keep-alive timeout set to %s seconds", seconds)
         self.config_manager.set("model_keepalive", "idle_timeout_seconds", seconds)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
 
     def _on_autostart_toggled(self, widget, state):
         """Handle toggle of the autostart switch."""
@@ -2024,7 +2535,7 @@ class SettingsDialog(Gtk.Dialog):
 
         if autostart_manager.set_autostart(enabled):
             self.config_manager.set("general", "autostart", enabled)
-            self.config_manager.save_settings()
+            self._schedule_config_save()
             logger.info(f"Autostart {'enabled' if enabled else 'disabled'}")
             return False
 
@@ -2038,7 +2549,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Start minimized toggled: {enabled}")
         self.config_manager.set("ui", "start_minimized", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         logger.info(f"Start minimized {'enabled' if enabled else 'disabled'}")
         return False
 
@@ -2050,7 +2561,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Missing tray warning toggled: {enabled}")
         self.config_manager.set("ui", "show_missing_tray_warning", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         return False
 
     def _on_copy_to_clipboard_toggled(self, widget, state):
@@ -2061,7 +2572,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Copy to clipboard toggled: {enabled}")
         self.config_manager.set("text_injection", "copy_to_clipboard", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         logger.info(f"Copy to clipboard {'enabled' if enabled else 'disabled'}")
         return False
 
@@ -2073,7 +2584,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Auto-capitalize toggled: {enabled}")
         self.config_manager.set("text_injection", "auto_capitalize", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         logger.info(f"Auto-capitalize {'enabled' if enabled else 'disabled'}")
         return False
 
@@ -2085,7 +2596,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Append trailing space toggled: {enabled}")
         self.config_manager.set("text_injection", "append_trailing_space", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         logger.info(f"Append trailing space {'enabled' if enabled else 'disabled'}")
         return False
 
@@ -2096,7 +2607,7 @@ class SettingsDialog(Gtk.Dialog):
         enabled = bool(state)
         logger.info(f"Sound effects toggled: {enabled}")
         self.config_manager.set_sound_effects_enabled(enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         logger.info(f"Sound effects {'enabled' if enabled else 'disabled'}")
         return False
 
@@ -2104,14 +2615,20 @@ class SettingsDialog(Gtk.Dialog):
         """Build the Speech Engine section."""
         group = PreferencesGroup(title="Speech Engine")
 
-        # Engine selection
+        # Engine selection, with a spinner while installed engines are detected
         self.engine_combo = Gtk.ComboBoxText()
         self.engine_combo.set_size_request(_CONTROL_WIDTH, -1)
         _prevent_scroll_on_hover(self.engine_combo)
+        self.engine_spinner = Gtk.Spinner()
+        self.engine_spinner.set_no_show_all(True)
+        self.engine_spinner.set_tooltip_text("Checking which speech engines are installed…")
+        engine_box = Gtk.Box(orientation=_ORIENT_H, spacing=6)
+        engine_box.pack_start(self.engine_spinner, False, False, 0)
+        engine_box.pack_start(self.engine_combo, False, False, 0)
         engine_row = PreferenceRow(
             title="Engine",
             subtitle="Speech recognition backend",
-            widget=self.engine_combo,
+            widget=engine_box,
         )
         group.add_row(engine_row)
 
@@ -2139,6 +2656,8 @@ class SettingsDialog(Gtk.Dialog):
             widget=self.model_variant_combo,
         )
         self.model_variant_row.set_tooltip_text(MODEL_SPECIALIZATION_TOOLTIP)
+        # Only shown for whisper.cpp, see _set_engine_widget_visible()
+        self.model_variant_row.set_no_show_all(True)
         group.add_row(self.model_variant_row)
 
         # Language selection
@@ -2158,50 +2677,49 @@ class SettingsDialog(Gtk.Dialog):
 
         # Model info card (shown below the group)
         self.model_info_card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        self.model_info_card.get_style_context().add_class("model-info-card")
+        _add_classes(self.model_info_card, "model-info-card")
         self.model_info_card.set_margin_start(4)
         self.model_info_card.set_margin_end(4)
 
         self.model_info_title = Gtk.Label(xalign=0)
-        self.model_info_title.get_style_context().add_class("model-info-title")
+        _add_classes(self.model_info_title, "model-info-title")
         self.model_info_card.pack_start(self.model_info_title, False, False, 0)
 
         self.model_info_subtitle = Gtk.Label(xalign=0, wrap=True)
-        self.model_info_subtitle.get_style_context().add_class("model-info-subtitle")
+        _add_classes(self.model_info_subtitle, "model-info-subtitle")
         self.model_info_card.pack_start(self.model_info_subtitle, False, False, 0)
 
         self.model_recommendation = Gtk.Label(xalign=0, wrap=True)
-        self.model_recommendation.get_style_context().add_class("tip-label")
+        _add_classes(self.model_recommendation, "tip-label")
         self.model_info_card.pack_start(self.model_recommendation, False, False, 0)
 
         # Language warning (e.g. auto-detect, English-only models) lives in
         # the card so there is a single explanation surface below the group.
         self.language_warning = Gtk.Label(label="", use_markup=True, xalign=0, wrap=True)
-        self.language_warning.get_style_context().add_class("status-warning")
+        _add_classes(self.language_warning, "status-warning")
         self.language_warning.set_no_show_all(True)
         self.model_info_card.pack_start(self.language_warning, False, False, 0)
 
         # Symbol legend as a muted caption inside the card
-        legend = Gtk.Label(
-            label="✓ Downloaded    ↓ Will download    ★ Recommended",
-            xalign=0,
-        )
-        legend.get_style_context().add_class("tip-label")
+        legend = Gtk.Label(label=_MODEL_LEGEND_TEXT, xalign=0)
+        _add_classes(legend, "tip-label")
         self.model_info_card.pack_start(legend, False, False, 0)
 
         self.content_box.pack_start(self.model_info_card, False, False, 0)
 
-        # Connect signals
-        self.engine_combo.connect("changed", self._on_engine_changed)
-        self.model_combo.connect("changed", self._on_model_changed)
-        self.model_variant_combo.connect("changed", self._on_model_variant_changed)
-        self.language_combo.connect("changed", self._on_language_changed)
-
     def _on_remote_api_settings_changed(self, widget):
         """Handle remote API URL/Key/endpoint changes."""
         if self._initializing or self._applying_settings:
             return
 
+        # Auto apply only if remote engine is currently active
+        engine_text = self.engine_combo.get_active_text()
+        engine = _engine_from_display(engine_text) if engine_text else "vosk"
+        if engine == "remote_api":
+            # Auto-apply saves the fields; writing them first would make them look unchanged
+            self._auto_apply_settings()
+            return
+
         url = self.remote_api_url_entry.get_text().strip()
         key = self.remote_api_key_entry.get_text().strip()
         endpoint = self.remote_api_endpoint_combo.get_active_id() or "/inference"
@@ -2211,13 +2729,7 @@ class SettingsDialog(Gtk.Dialog):
         self.config_manager.set("speech_recognition", "remote_api_key", key)
         self.config_manager.set("speech_recognition", "remote_api_endpoint", endpoint)
         self.config_manager.set("speech_recognition", "remote_api_model", model)
-        self.config_manager.save_settings()
-
-        # Auto apply only if remote engine is currently active
-        engine_text = self.engine_combo.get_active_text()
-        engine = _engine_from_display(engine_text) if engine_text else "vosk"
-        if engine == "remote_api":
-            self._auto_apply_settings()
+        self._schedule_config_save()
 
     def _on_test_remote_connection(self, widget):
         """Test remote server connection."""
@@ -2382,15 +2894,10 @@ class SettingsDialog(Gtk.Dialog):
         output_group.add_row(append_trailing_space_row)
 
         self.recognition_settings_tab.pack_start(output_group, False, False, 0)
-        self.copy_to_clipboard_switch.connect("state-set", self._on_copy_to_clipboard_toggled)
-        self.auto_capitalize_switch.connect("state-set", self._on_auto_capitalize_toggled)
-        self.append_trailing_space_switch.connect(
-            "state-set", self._on_append_trailing_space_toggled
-        )
 
         if not silero_active:
             vad_info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-            vad_info_box.get_style_context().add_class("info-box")
+            _add_classes(vad_info_box, "info-box")
             vad_info_box.set_margin_start(4)
             vad_info_box.set_margin_end(4)
             vad_info_box.set_margin_top(4)
@@ -2410,17 +2917,11 @@ class SettingsDialog(Gtk.Dialog):
                 wrap=True,
                 selectable=True,
             )
-            vad_info_label.get_style_context().add_class("tip-label")
+            _add_classes(vad_info_label, "tip-label")
             vad_info_box.pack_start(vad_info_label, True, True, 0)
 
             self.recognition_settings_tab.pack_start(vad_info_box, False, False, 0)
 
-        # Connect signals
-        self.vad_spin.connect("value-changed", self._on_vad_changed)
-        self.silence_spin.connect("value-changed", self._on_silence_changed)
-        self.voice_commands_switch.connect("state-set", self._on_voice_commands_toggled)
-        self.auto_capitalize_switch.connect("state-set", self._on_auto_capitalize_toggled)
-
     def _build_shortcuts_section(self):
         """Build the Keyboard Shortcuts section."""
         group = PreferencesGroup(
@@ -2437,8 +2938,7 @@ class SettingsDialog(Gtk.Dialog):
         _prevent_scroll_on_hover(self.shortcut_mode_combo)
 
         # Populate mode options
-        for mode_id, display_name in SHORTCUT_MODES.items():
-            self.shortcut_mode_combo.append(mode_id, display_name)
+        _set_combo_rows(self.shortcut_mode_combo, SHORTCUT_MODES.items())
 
         # Load current mode from config
         current_mode = self.config_manager.get_str("shortcuts", "mode", DEFAULT_SHORTCUT_MODE)
@@ -2460,14 +2960,7 @@ class SettingsDialog(Gtk.Dialog):
 
         # Populate shortcut options grouped by side, then a Custom sentinel.
         # Preset and custom are mutually exclusive: only one is active at a time.
-        for group_label, shortcut_ids in SHORTCUT_GROUPS.items():
-            # Add group separator as a disabled label entry
-            separator_id = f"__separator_{group_label}__"
-            self.shortcut_combo.append(separator_id, f"── {group_label} ──")
-            for shortcut_id in shortcut_ids:
-                display_name = SHORTCUT_DISPLAY_NAMES.get(shortcut_id, shortcut_id)
-                self.shortcut_combo.append(shortcut_id, display_name)
-        self.shortcut_combo.append("__custom__", "Custom Shortcut")
+        _set_combo_rows(self.shortcut_combo, _SHORTCUT_COMBO_ROWS)
 
         # Load current shortcut from config
         current_shortcut = self.config_manager.get_str(
@@ -2521,7 +3014,7 @@ class SettingsDialog(Gtk.Dialog):
 
         # Info box about the shortcut
         info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        info_box.get_style_context().add_class("info-box")
+        _add_classes(info_box, "info-box")
         info_box.set_margin_start(4)
         info_box.set_margin_end(4)
         info_box.set_margin_top(4)
@@ -2534,7 +3027,7 @@ class SettingsDialog(Gtk.Dialog):
             xalign=0,
             wrap=True,
         )
-        self.shortcut_info_label.get_style_context().add_class("tip-label")
+        _add_classes(self.shortcut_info_label, "tip-label")
         info_box.pack_start(self.shortcut_info_label, True, True, 0)
 
         self.shortcuts_tab.pack_start(info_box, False, False, 0)
@@ -2542,10 +3035,6 @@ class SettingsDialog(Gtk.Dialog):
         # Reflect active shortcut in combo + custom entry (preset vs custom).
         self._sync_shortcut_selection_ui(current_shortcut)
 
-        # Connect signals
-        self.shortcut_combo.connect("changed", self._on_shortcut_changed)
-        self.shortcut_mode_combo.connect("changed", self._on_shortcut_mode_changed)
-
         # Update UI based on initial mode
         self._update_shortcut_ui_for_mode(current_mode)
 
@@ -2601,16 +3090,8 @@ class SettingsDialog(Gtk.Dialog):
 
     def _report_shortcut_apply_result(self, display_name: str, applied: bool) -> None:
         """Show success/restart feedback after a shortcut change."""
-        if applied:
-            self.shortcut_info_label.set_markup(
-                f"<span foreground='#26a269'>Shortcut updated to <b>{display_name}</b>. "
-                "Active now!</span>"
-            )
-        else:
-            self.shortcut_info_label.set_markup(
-                f"<i>Shortcut updated to <b>{display_name}</b>. "
-                "Restart the app for the change to take full effect.</i>"
-            )
+        template = _MARKUP_SHORTCUT_ACTIVE if applied else _MARKUP_SHORTCUT_NEEDS_RESTART
+        _set_markup_if_changed(self.shortcut_info_label, template.format(name=display_name))
 
     def _apply_custom_shortcut(self, shortcut: str) -> None:
         """Validate, persist, and live-apply a custom shortcut string."""
@@ -2626,7 +3107,7 @@ class SettingsDialog(Gtk.Dialog):
         # If the user typed/recorded a preset id, treat it as selecting that preset.
         if self._is_preset_shortcut(shortcut):
             self.config_manager.set("shortcuts", "toggle_recognition", shortcut)
-            self.config_manager.save_settings()
+            self._schedule_config_save()
             self._sync_shortcut_selection_ui(shortcut)
             mode_id = self.shortcut_mode_combo.get_active_id()
             display_name = SHORTCUT_DISPLAY_NAMES.get(shortcut, shortcut)
@@ -2638,7 +3119,7 @@ class SettingsDialog(Gtk.Dialog):
             return
 
         self.config_manager.set("shortcuts", "toggle_recognition", shortcut)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         # Dropdown should show Custom, not a leftover preset.
         self._sync_shortcut_selection_ui(shortcut)
 
@@ -2756,7 +3237,7 @@ class SettingsDialog(Gtk.Dialog):
 
         # Save to config
         self.config_manager.set("shortcuts", "mode", mode_id)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
 
         mode_name = SHORTCUT_MODES.get(mode_id, mode_id)
         logger.info(f"Keyboard shortcut mode changed to: {mode_name}")
@@ -2824,16 +3305,14 @@ class SettingsDialog(Gtk.Dialog):
                 self.custom_shortcut_entry.set_text(current)
             self._set_custom_shortcut_row_visible(True)
             self.custom_shortcut_entry.grab_focus()
-            self.shortcut_info_label.set_markup(
-                "<i>Record or type a custom shortcut (e.g. alt+r), then click Set.</i>"
-            )
+            self.shortcut_info_label.set_markup(_MARKUP_SHORTCUT_CUSTOM_HINT)
             return
 
         # Preset selected: clear any leftover custom entry so UI matches config.
         self.custom_shortcut_entry.set_text("")
         self._set_custom_shortcut_row_visible(False)
         self.config_manager.set("shortcuts", "toggle_recognition", shortcut_id)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
 
         display_name = SHORTCUT_DISPLAY_NAMES.get(shortcut_id, shortcut_id)
         logger.info(f"Keyboard shortcut changed to: {display_name}")
@@ -2858,7 +3337,7 @@ class SettingsDialog(Gtk.Dialog):
         sidebar_box.pack_start(separator, False, False, 0)
 
         footer = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        footer.get_style_context().add_class("sidebar-footer")
+        _add_classes(footer, "sidebar-footer")
 
         status_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
 
@@ -2869,7 +3348,9 @@ class SettingsDialog(Gtk.Dialog):
         status_row.pack_start(self.recognition_indicator, False, False, 0)
 
         self.recognition_status_label = Gtk.Label(label="Idle", xalign=0)
-        self.recognition_status_label.get_style_context().add_class("status-strip-state")
+        _add_classes(self.recognition_status_label, "status-strip-state")
+        # Kept for the per-state class swaps in update_recognition_progress
+        self._recognition_status_context = self.recognition_status_label.get_style_context()
         status_row.pack_start(self.recognition_status_label, False, False, 0)
         footer.pack_start(status_row, False, False, 0)
 
@@ -2892,30 +3373,15 @@ class SettingsDialog(Gtk.Dialog):
 
         # One shared status line (audio test results and recognition info)
         self.progress_info_label = Gtk.Label(label="", use_markup=True, xalign=0)
-        self.progress_info_label.get_style_context().add_class("status-info")
+        _add_classes(self.progress_info_label, "status-info")
         self.progress_info_label.set_line_wrap(True)
         self.audio_test_status = self.progress_info_label
         footer.pack_start(self.progress_info_label, False, False, 0)
 
-        # Test transcription output, revealed while testing
+        # Test transcription output, revealed while testing; its contents are
+        # built by _ensure_test_output() on the first test.
         self.test_output_revealer = Gtk.Revealer()
         self.test_output_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
-
-        scrolled_window = Gtk.ScrolledWindow()
-        scrolled_window.set_min_content_height(60)
-        scrolled_window.set_max_content_height(100)
-        scrolled_window.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        scrolled_window.get_style_context().add_class("test-area")
-
-        self.test_textview = Gtk.TextView()
-        self.test_textview.set_editable(False)
-        self.test_textview.set_cursor_visible(False)
-        self.test_textview.set_wrap_mode(Gtk.WrapMode.WORD)
-        self.test_textview.get_style_context().add_class("test-textview")
-        self.test_buffer = self.test_textview.get_buffer()
-        scrolled_window.add(self.test_textview)
-        self.test_output_revealer.add(scrolled_window)
-
         footer.pack_start(self.test_output_revealer, False, False, 0)
 
         # In-window Close so the dialog can always be dismissed, even on WMs
@@ -2927,6 +3393,34 @@ class SettingsDialog(Gtk.Dialog):
 
         sidebar_box.pack_start(footer, False, False, 0)
 
+    def _ensure_test_output(self):
+        """Build the dictation test output area the first time it is needed."""
+        if self.test_buffer is not None:
+            return
+
+        # Pass properties at construction so each widget is set up in one g_object_new
+        scrolled_window = Gtk.ScrolledWindow(
+            min_content_height=60,
+            max_content_height=100,
+            hscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+            vscrollbar_policy=Gtk.PolicyType.AUTOMATIC,
+        )
+        _add_classes(scrolled_window, "test-area")
+
+        self.test_textview = Gtk.TextView(
+            editable=False, cursor_visible=False, wrap_mode=Gtk.WrapMode.WORD
+        )
+        _add_classes(self.test_textview, "test-textview")
+        self.test_buffer = self.test_textview.get_buffer()
+        # Right gravity keeps the mark after each insert, so appends scroll to it
+        # without fetching the cursor mark (which a click could also move)
+        self._test_end_mark = self.test_buffer.create_mark(
+            None, self.test_buffer.get_end_iter(), False
+        )
+        scrolled_window.add(self.test_textview)
+        self.test_output_revealer.add(scrolled_window)
+        scrolled_window.show_all()
+
     def _on_close_clicked(self, button):
         """Close the dialog through the normal response path (same as title-bar X)."""
         self.response(Gtk.ResponseType.CLOSE)
@@ -3067,7 +3561,7 @@ class SettingsDialog(Gtk.Dialog):
         group.add_row(initial_prompt_row)
 
         info_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        info_box.get_style_context().add_class("info-box")
+        _add_classes(info_box, "info-box")
         info_box.set_margin_start(4)
         info_box.set_margin_end(4)
         info_box.set_margin_bottom(4)
@@ -3080,7 +3574,7 @@ class SettingsDialog(Gtk.Dialog):
             xalign=0,
             wrap=True,
         )
-        self.advanced_info_label.get_style_context().add_class("tip-label")
+        _add_classes(self.advanced_info_label, "tip-label")
         info_box.pack_start(self.advanced_info_label, True, True, 0)
 
         controls_box.pack_start(info_box, False, False, 0)
@@ -3100,18 +3594,21 @@ class SettingsDialog(Gtk.Dialog):
         self.advanced_revealer.add(controls_box)
         self.advanced_tab.pack_start(self.advanced_revealer, False, False, 0)
 
-        self.advanced_no_timestamps_switch.connect("state-set", self._on_advanced_param_changed)
-        self.advanced_no_context_switch.connect("state-set", self._on_advanced_param_changed)
-        self.advanced_temperature_spin.connect("value-changed", self._on_advanced_param_changed)
-        self.advanced_temperature_inc_spin.connect("value-changed", self._on_advanced_param_changed)
-        self.advanced_entropy_thold_spin.connect("value-changed", self._on_advanced_param_changed)
-        self.advanced_logprob_thold_spin.connect("value-changed", self._on_advanced_param_changed)
-        self.advanced_no_speech_thold_spin.connect("value-changed", self._on_advanced_param_changed)
-
         self.advanced_initial_prompt_buffer = self.advanced_initial_prompt_textview.get_buffer()
-        self.advanced_initial_prompt_buffer.connect("changed", self._on_advanced_prompt_changed)
 
-        self.power_user_switch.connect("state-set", self._on_power_user_toggled)
+    def _build_about_page(self):
+        """Build the About page on first visit and bring it up to date.
+
+        Nothing else in the dialog depends on the About widgets, so they are
+        only created when the page is opened or searched.
+        """
+        self._build_about_section()
+        self.about_tab.show_all()
+        # Release notes stay hidden until a successful update check.
+        self.release_notes_group.hide()
+        self.update_channel_combo.connect("changed", self._on_update_channel_changed)
+        # Seed About from a tray background check (opens with notes already filled).
+        self._seed_pending_update_ui()
 
     def _build_about_section(self):
         """Build the About page using the same PreferenceRow cards as other pages."""
@@ -3123,9 +3620,9 @@ class SettingsDialog(Gtk.Dialog):
         logo_path = ResourceManager().get_icon_path("vocalinux")
         if os.path.exists(logo_path):
             try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file(logo_path)
-                scaled = pixbuf.scale_simple(48, 48, GdkPixbuf.InterpType.BILINEAR)
-                about_icon = Gtk.Image.new_from_pixbuf(scaled)
+                # Rasterize the SVG straight at 48 px instead of at full size, then scaling
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(logo_path, 48, 48)
+                about_icon = Gtk.Image.new_from_pixbuf(pixbuf)
                 about_icon.set_pixel_size(48)
             except Exception as exc:
                 logger.warning("Failed to load About icon: %s", exc)
@@ -3139,7 +3636,7 @@ class SettingsDialog(Gtk.Dialog):
 
         self.about_version_label = Gtk.Label(label=__version__)
         self.about_version_label.set_selectable(True)
-        self.about_version_label.get_style_context().add_class("preference-row-subtitle")
+        _add_classes(self.about_version_label, "preference-row-subtitle")
         version_row = PreferenceRow(
             title="Version",
             subtitle="Currently installed Vocalinux build",
@@ -3176,8 +3673,7 @@ class SettingsDialog(Gtk.Dialog):
 
         self.update_channel_combo = Gtk.ComboBoxText()
         self.update_channel_combo.set_size_request(_CONTROL_WIDTH, -1)
-        self.update_channel_combo.append("stable", "Stable")
-        self.update_channel_combo.append("nightly", "Nightly")
+        _set_combo_rows(self.update_channel_combo, (("stable", "Stable"), ("nightly", "Nightly")))
         self.update_channel_combo.set_tooltip_text(
             "Stable uses the latest numbered release. Nightly uses the newest nightly-YYYY-MM-DD build."
         )
@@ -3224,8 +3720,6 @@ class SettingsDialog(Gtk.Dialog):
         updates_group.add_row(self.latest_release_row)
         self.about_tab.pack_start(updates_group, False, False, 0)
 
-        self.update_channel_combo.connect("changed", self._on_update_channel_changed)
-
         self.release_notes_group = PreferencesGroup(
             title="What's New",
             keywords=("changelog", "what's new", "release notes"),
@@ -3277,7 +3771,7 @@ class SettingsDialog(Gtk.Dialog):
             return
         channel = self._current_update_channel()
         self.config_manager.set("updates", "channel", channel)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         self._start_update_check()
 
     def _on_check_updates_clicked(self, widget):
@@ -3435,8 +3929,6 @@ class SettingsDialog(Gtk.Dialog):
         gpu_group.add_row(gpu_row)
         self.power_tab.pack_start(gpu_group, False, False, 0)
 
-        self.gpu_device_combo.connect("changed", self._on_advanced_param_changed)
-
     def _build_remote_server_section(self):
         """Build the Remote Server configuration section (shown when Remote API engine is selected)."""
         self.remote_server_group = PreferencesGroup(
@@ -3481,10 +3973,13 @@ class SettingsDialog(Gtk.Dialog):
         self.remote_api_endpoint_combo.set_tooltip_text(
             "Select the API format of the remote server (API Endpoint Format)"
         )
-        self.remote_api_endpoint_combo.append(
-            "/v1/audio/transcriptions", "OpenAI/FunASR (/v1/audio/transcriptions)"
+        _set_combo_rows(
+            self.remote_api_endpoint_combo,
+            (
+                ("/v1/audio/transcriptions", "OpenAI/FunASR (/v1/audio/transcriptions)"),
+                ("/inference", "Whisper.cpp (/inference)"),
+            ),
         )
-        self.remote_api_endpoint_combo.append("/inference", "Whisper.cpp (/inference)")
         _prevent_scroll_on_hover(self.remote_api_endpoint_combo)
         remote_endpoint_row = PreferenceRow(
             title="API Endpoint",
@@ -3524,7 +4019,7 @@ class SettingsDialog(Gtk.Dialog):
         self.remote_status_label = Gtk.Label(label="", use_markup=True, xalign=0)
         self.remote_status_label.set_margin_start(16)
         self.remote_status_label.set_margin_top(4)
-        self.remote_status_label.get_style_context().add_class("status-info")
+        _add_classes(self.remote_status_label, "status-info")
         self.content_box.pack_start(self.remote_status_label, False, False, 0)
 
         # Load saved values into the widgets
@@ -3541,13 +4036,9 @@ class SettingsDialog(Gtk.Dialog):
         self.remote_api_endpoint_combo.set_active_id(saved_endpoint)
         self.remote_api_model_entry.set_text(saved_model or "whisper-1")
 
-        self.remote_api_url_entry.connect("changed", self._on_remote_api_settings_changed)
-        self.remote_api_key_entry.connect("changed", self._on_remote_api_settings_changed)
-        self.remote_api_endpoint_combo.connect("changed", self._on_remote_api_settings_changed)
-        self.remote_api_model_entry.connect("changed", self._on_remote_api_settings_changed)
-
-        self.remote_server_group.hide()
-        self.remote_status_label.hide()
+        # Only shown for the Remote API engine, see _set_engine_widget_visible()
+        self.remote_server_group.set_no_show_all(True)
+        self.remote_status_label.set_no_show_all(True)
 
     def _on_power_user_toggled(self, widget, state):
         """Handle the power-user opt-in toggle."""
@@ -3572,7 +4063,7 @@ class SettingsDialog(Gtk.Dialog):
                 )
                 dialog.add_button("_Keep it Simple", Gtk.ResponseType.CANCEL)
                 confirm_btn = dialog.add_button("_I Know What I'm Doing", Gtk.ResponseType.YES)
-                confirm_btn.get_style_context().add_class("suggested-action")
+                _add_classes(confirm_btn, "suggested-action")
                 response = dialog.run()
                 dialog.destroy()
             finally:
@@ -3580,7 +4071,7 @@ class SettingsDialog(Gtk.Dialog):
             if response != Gtk.ResponseType.YES:
                 return True
         self.config_manager.set("advanced", "power_user_mode", state)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         self.advanced_revealer.set_reveal_child(state)
         return False
 
@@ -3588,6 +4079,9 @@ class SettingsDialog(Gtk.Dialog):
         """Persist deferred text edits before the settings dialog closes."""
         if response_id in (Gtk.ResponseType.CLOSE, Gtk.ResponseType.DELETE_EVENT):
             self._flush_advanced_prompt_if_dirty()
+            self._flush_pending_engine_change()
+            self._flush_pending_auto_apply()
+            self._flush_pending_config_save()
 
     def _on_advanced_prompt_changed(self, buffer):
         """Track prompt edits without applying settings on every keystroke."""
@@ -3645,9 +4139,12 @@ class SettingsDialog(Gtk.Dialog):
             f"Starting dialog with settings: engine={self.current_engine}, model={self.current_model_size}"
         )
 
-        general_settings = self.config_manager.get_settings().get("general", {})
-        ui_settings = self.config_manager.get_settings().get("ui", {})
-        text_injection_settings = self.config_manager.get_settings().get("text_injection", {})
+        # _get_current_settings() already re-read the file if it was stale, so
+        # the remaining sections come from the same in-memory config
+        config = self.config_manager.get_settings()
+        general_settings = config.get("general", {})
+        ui_settings = config.get("ui", {})
+        text_injection_settings = config.get("text_injection", {})
 
         autostart_enabled = general_settings.get("autostart", False)
         start_minimized = ui_settings.get("start_minimized", False)
@@ -3664,13 +4161,13 @@ class SettingsDialog(Gtk.Dialog):
         self.append_trailing_space_switch.set_active(append_trailing_space)
         self.sound_effects_switch.set_active(self.config_manager.is_sound_effects_enabled())
 
-        auto_pause_settings = self.config_manager.get_settings().get("auto_pause", {})
+        auto_pause_settings = config.get("auto_pause", {})
         auto_pause_enabled = bool(auto_pause_settings.get("enabled", False))
         self.auto_pause_switch.set_active(auto_pause_enabled)
         self._update_auto_pause_sensitivity(auto_pause_enabled)
         self._refresh_auto_pause_list()
 
-        keepalive_settings = self.config_manager.get_settings().get("model_keepalive", {})
+        keepalive_settings = config.get("model_keepalive", {})
         keepalive_enabled = bool(keepalive_settings.get("enabled", False))
         self.model_keepalive_switch.set_active(keepalive_enabled)
         self._update_model_keepalive_sensitivity(keepalive_enabled)
@@ -3678,48 +4175,7 @@ class SettingsDialog(Gtk.Dialog):
         if not self.model_keepalive_timeout_combo.set_active_id(str(timeout_seconds)):
             self.model_keepalive_timeout_combo.set_active_id("300")
 
-        available_engines = get_available_engines()
-        available_count = 0
-
-        for engine in ENGINE_MODELS.keys():
-            if available_engines.get(engine, False):
-                display_name = _engine_display_name(engine)
-                self.engine_combo.append(display_name, display_name)
-                available_count += 1
-
-        if available_count == 0:
-            logger.error("No speech recognition engines available!")
-            # Still add them so the UI works, but log the error
-            for engine in ENGINE_MODELS.keys():
-                display_name = _engine_display_name(engine)
-                self.engine_combo.append(display_name, display_name)
-        else:
-            logger.info(f"Populated {available_count} available engines: {available_engines}")
-
-        if not available_engines.get(self.current_engine, False):
-            logger.warning(
-                f"Current engine '{self.current_engine}' is not available, "
-                "selecting first available"
-            )
-            for engine in ENGINE_MODELS.keys():
-                if available_engines.get(engine, False):
-                    self.current_engine = engine
-                    break
-
-        engine_text = _engine_display_name(self.current_engine)
-        logger.info(f"Setting active engine to: {engine_text}")
-        if not self.engine_combo.set_active_id(engine_text):
-            logger.warning("Could not set engine by ID, trying by index")
-            # Find index of current engine
-            model = self.engine_combo.get_model()
-            for i, row in enumerate(model):
-                if _engine_from_display(row[0]) == self.current_engine:
-                    self.engine_combo.set_active(i)
-                    break
-            else:
-                # Fallback to first available
-                if self.engine_combo.get_model():
-                    self.engine_combo.set_active(0)
+        self._populate_engine_options()
 
         # Populate model and language options for the selected engine
         self._populate_model_options()
@@ -3733,7 +4189,7 @@ class SettingsDialog(Gtk.Dialog):
         voice_commands_enabled = self.config_manager.is_voice_commands_enabled()
         self.voice_commands_switch.set_active(voice_commands_enabled)
 
-        advanced_settings = self.config_manager.get_settings().get("advanced", {})
+        advanced_settings = config.get("advanced", {})
         power_user_mode = advanced_settings.get("power_user_mode", False)
         self.power_user_switch.set_active(power_user_mode)
         self.advanced_revealer.set_reveal_child(power_user_mode)
@@ -3762,9 +4218,115 @@ class SettingsDialog(Gtk.Dialog):
             advanced_settings.get("whispercpp_no_speech_thold", 0.6)
         )
 
+    def _populate_engine_options(self):
+        """Fill the engine picker and select the configured (or first available) engine."""
+        available_engines = self._available_engines
+        if available_engines is None:
+            # Still detecting; offer the configured engine until the scan reports back
+            engine_ids = [self.current_engine]
+            self.engine_combo.set_sensitive(False)
+            self.engine_spinner.show()
+            self.engine_spinner.start()
+        else:
+            self.engine_spinner.stop()
+            self.engine_spinner.hide()
+            self.engine_combo.set_sensitive(True)
+            engine_ids = [
+                engine for engine in ENGINE_MODELS.keys() if available_engines.get(engine, False)
+            ]
+
+            if not engine_ids:
+                logger.error("No speech recognition engines available!")
+                # Still add them so the UI works, but log the error
+                engine_ids = list(ENGINE_MODELS.keys())
+            else:
+                logger.info(f"Populated {len(engine_ids)} available engines: {available_engines}")
+
+            if not available_engines.get(self.current_engine, False):
+                logger.warning(
+                    f"Current engine '{self.current_engine}' is not available, "
+                    "selecting first available"
+                )
+                for engine in ENGINE_MODELS.keys():
+                    if available_engines.get(engine, False):
+                        self.current_engine = engine
+                        break
+        engine_id_to_index = {engine: i for i, engine in enumerate(engine_ids)}
+
+        engine_text = _engine_display_name(self.current_engine)
+        logger.info(f"Setting active engine to: {engine_text}")
+        # Callers refill the model and language pickers themselves
+        with _handler_blocked(self.engine_combo, self._engine_changed_id):
+            _set_combo_rows(
+                self.engine_combo, ((_engine_display_name(engine),) * 2 for engine in engine_ids)
+            )
+            if not self.engine_combo.set_active_id(engine_text):
+                logger.warning("Could not set engine by ID, trying by index")
+                # Current engine's row, else the first available one
+                self.engine_combo.set_active(engine_id_to_index.get(self.current_engine, 0))
+
+    def _wire_signals(self):
+        """Connect value-change handlers once the widgets hold the saved settings."""
+        # Dictation
+        self.shortcut_combo.connect("changed", self._on_shortcut_changed)
+        self.shortcut_mode_combo.connect("changed", self._on_shortcut_mode_changed)
+        self.vad_spin.connect("value-changed", self._on_vad_changed)
+        self.silence_spin.connect("value-changed", self._on_silence_changed)
+        self.voice_commands_switch.connect("state-set", self._on_voice_commands_toggled)
+        self.copy_to_clipboard_switch.connect("state-set", self._on_copy_to_clipboard_toggled)
+        self.auto_capitalize_switch.connect("state-set", self._on_auto_capitalize_toggled)
+        self.append_trailing_space_switch.connect(
+            "state-set", self._on_append_trailing_space_toggled
+        )
+
+        # Speech model
+        self._engine_changed_id = self.engine_combo.connect("changed", self._on_engine_changed)
+        self._model_changed_id = self.model_combo.connect("changed", self._on_model_changed)
+        self._model_variant_changed_id = self.model_variant_combo.connect(
+            "changed", self._on_model_variant_changed
+        )
+        self._language_changed_id = self.language_combo.connect(
+            "changed", self._on_language_changed
+        )
+        self.remote_api_url_entry.connect("changed", self._on_remote_api_settings_changed)
+        self.remote_api_key_entry.connect("changed", self._on_remote_api_settings_changed)
+        self.remote_api_endpoint_combo.connect("changed", self._on_remote_api_settings_changed)
+        self.remote_api_model_entry.connect("changed", self._on_remote_api_settings_changed)
+
+        # Audio
+        self._audio_device_changed_id = self.audio_device_combo.connect(
+            "changed", self._on_audio_device_changed
+        )
+        self.sound_effects_switch.connect("state-set", self._on_sound_effects_toggled)
+
+        # Performance
+        self.auto_pause_switch.connect("state-set", self._on_auto_pause_enabled_toggled)
+        self.model_keepalive_switch.connect("state-set", self._on_model_keepalive_enabled_toggled)
+        self.model_keepalive_timeout_combo.connect(
+            "changed", self._on_model_keepalive_timeout_changed
+        )
+        self.gpu_device_combo.connect("changed", self._on_advanced_param_changed)
+
+        # Application
+        self.autostart_switch.connect("state-set", self._on_autostart_toggled)
+        self.start_minimized_switch.connect("state-set", self._on_start_minimized_toggled)
+        self.missing_tray_warning_switch.connect("state-set", self._on_missing_tray_warning_toggled)
+
+        # Advanced
+        self.power_user_switch.connect("state-set", self._on_power_user_toggled)
+        self.advanced_no_timestamps_switch.connect("state-set", self._on_advanced_param_changed)
+        self.advanced_no_context_switch.connect("state-set", self._on_advanced_param_changed)
+        self.advanced_temperature_spin.connect("value-changed", self._on_advanced_param_changed)
+        self.advanced_temperature_inc_spin.connect("value-changed", self._on_advanced_param_changed)
+        self.advanced_entropy_thold_spin.connect("value-changed", self._on_advanced_param_changed)
+        self.advanced_logprob_thold_spin.connect("value-changed", self._on_advanced_param_changed)
+        self.advanced_no_speech_thold_spin.connect("value-changed", self._on_advanced_param_changed)
+        self.advanced_initial_prompt_buffer.connect("changed", self._on_advanced_prompt_changed)
+
     def _get_current_settings(self):
         """Get current settings from config manager."""
-        self.config_manager.load_config()
+        # Only re-parse the file if something else wrote it since it was read
+        self.config_manager.load_config_if_stale()
         settings = self.config_manager.get_settings()
 
         sr_settings = settings.get("speech_recognition", {})
@@ -3798,14 +4360,84 @@ class SettingsDialog(Gtk.Dialog):
         if variant_id:
             return variant_id
 
-        size_id = self.model_combo.get_active_id()
-        model_size = size_id.lower() if size_id else "small"
+        model_size = self.model_combo.get_active_id() or "small"
         variants = get_whispercpp_model_variants(model_size)
         return variants[0] if variants else "small"
 
-    def _get_recommended_whispercpp_model_for_language(self) -> tuple[str, str]:
+    def _detect_available_engines(self):
+        """Worker thread: find out which speech engine packages are installed."""
+        GLib.idle_add(self._on_available_engines_detected, get_available_engines())
+
+    def _on_available_engines_detected(self, engines: dict):
+        """Fill the engine picker with the detected engines (main loop)."""
+        if not self._dialog_is_alive():
+            return False
+        self._available_engines = engines
+        selected_engine = self._get_selected_engine()
+        self._populate_engine_options()
+        # The configured engine may not be installed after all
+        if self.current_engine != selected_engine:
+            self._populate_model_options()
+            self._sync_language_options_for_selected_model(self.language)
+            self._update_engine_specific_ui()
+            self._update_model_info()
+        return False
+
+    def _detect_system_capabilities(self):
+        """Work out model recommendations and compute backend (worker thread)."""
+        backend, _ = detect_compute_backend()
+        recommendations = {
+            "whisper": _get_recommended_whisper_model(),
+            "vosk": _get_recommended_vosk_model(),
+            "whisper_cpp": get_recommended_whispercpp_model(),
+        }
+        GLib.idle_add(
+            self._on_system_capabilities_detected,
+            recommendations,
+            get_backend_display_name(backend),
+        )
+
+    def _on_system_capabilities_detected(self, recommendations: dict, backend_display: str):
+        """Show the recommendations once hardware detection has finished."""
+        if not self._dialog_is_alive():
+            return False
+        self._recommended_models = recommendations
+        self._backend_display = backend_display
+        # Refresh the ★ markers and the model info card
+        self._populate_model_options()
+        self._update_model_info()
+        return False
+
+    def _is_model_downloaded(self, engine: str, model_name: str, language: str = "") -> bool:
+        """Return whether a model is on disk, remembering the answer for this dialog."""
+        key = (engine, model_name, language)
+        downloaded = self._download_cache.get(key)
+        if downloaded is None:
+            if engine == "whisper":
+                downloaded = _is_whisper_model_downloaded(model_name)
+            elif engine == "whisper_cpp":
+                downloaded = is_whispercpp_model_downloaded(model_name)
+            elif engine == "vosk":
+                downloaded = _is_vosk_model_downloaded(model_name, language)
+            else:
+                downloaded = False
+            self._download_cache[key] = downloaded
+        return downloaded
+
+    def _forget_model_downloads(self) -> None:
+        """Drop remembered download checks after models may have changed on disk."""
+        self._download_cache.clear()
+        _clear_model_dir_caches()
+
+    def _get_recommended_model(self, engine: str) -> tuple:
+        """Return (model, reason) for an engine, or (None, "") while detecting."""
+        return self._recommended_models.get(engine, (None, ""))
+
+    def _get_recommended_whispercpp_model_for_language(self) -> tuple:
         """Return the recommended whisper.cpp variant for the selected language."""
-        recommended_model, reason = get_recommended_whispercpp_model()
+        recommended_model, reason = self._get_recommended_model("whisper_cpp")
+        if recommended_model is None:
+            return None, ""
         language_id = self.language_combo.get_active_id() or self.language
         return _recommended_whispercpp_variant_for_language(
             recommended_model,
@@ -3865,8 +4497,7 @@ class SettingsDialog(Gtk.Dialog):
             preferred_language or self.language_combo.get_active_id() or self.language
         )
 
-        self._processing_language_change = True
-        try:
+        with _handler_blocked(self.language_combo, self._language_changed_id):
             self._populate_language_options()
             if not self._set_combo_active_id_or_first(self.language_combo, language_to_keep):
                 return
@@ -3879,105 +4510,86 @@ class SettingsDialog(Gtk.Dialog):
             self.language = (
                 self.language_combo.get_active_id() or self._default_language_for_engine(engine)
             )
-        finally:
-            self._processing_language_change = False
 
         self._update_language_warning()
         self._update_model_picker_tooltips()
 
     def _populate_model_options(self):
         """Populate model options based on the current engine selection."""
-        self._populating_models = True
-        try:
-            self.model_combo.remove_all()
-            self.model_variant_combo.remove_all()
-
-            engine_text = self.engine_combo.get_active_text()
-            if not engine_text:
-                logger.warning("No engine selected during model options population")
-                return
-
-            engine = _engine_from_display(engine_text)
-            logger.info(f"Populating model options for engine: {engine}")
-
-            # Remote API does not need model options
-            if engine == "remote_api":
-                logger.info("Remote API engine selected, no model options needed")
-                return
-
-            saved_model_for_engine = self.config_manager.get_model_size_for_engine(engine)
-            logger.info(f"Saved model for {engine}: {saved_model_for_engine}")
-
-            if engine == "whisper_cpp":
-                self._populate_whispercpp_model_options(saved_model_for_engine)
-                return
-
-            downloaded_models = []
-            smallest_model = None
-            if engine == "whisper":
-                recommended_model, _ = _get_recommended_whisper_model()
-            else:
-                recommended_model, _ = _get_recommended_vosk_model()
-
-            if engine in ENGINE_MODELS:
-                for size in ENGINE_MODELS[engine]:
-                    if engine == "whisper" and size in WHISPER_MODEL_INFO:
-                        info = WHISPER_MODEL_INFO[size]
-                        is_downloaded = _is_whisper_model_downloaded(size)
-                    elif engine == "vosk" and size in VOSK_MODEL_INFO:
-                        info = VOSK_MODEL_INFO[size]
-                        is_downloaded = _is_vosk_model_downloaded(size, self.language)
-                    else:
-                        is_downloaded = False
-                        info = {"size_mb": 0}
-
-                    model_display_name = _model_display_name(size)
+        with _handler_blocked(self.model_combo, self._model_changed_id):
+            with _handler_blocked(self.model_variant_combo, self._model_variant_changed_id):
+                engine_text = self.engine_combo.get_active_text()
+                if not engine_text:
+                    logger.warning("No engine selected during model options population")
+                    _set_combo_rows(self.model_combo, ())
+                    _set_combo_rows(self.model_variant_combo, ())
+                    return
+
+                engine = _engine_from_display(engine_text)
+                logger.info(f"Populating model options for engine: {engine}")
+                if engine != "whisper_cpp":
+                    # Not cleared for whisper.cpp: it refills the picker below, and
+                    # emptying it first would defeat the unchanged-rows check
+                    _set_combo_rows(self.model_variant_combo, ())
+
+                # Remote API does not need model options
+                if engine == "remote_api":
+                    logger.info("Remote API engine selected, no model options needed")
+                    _set_combo_rows(self.model_combo, ())
+                    return
+
+                saved_model_for_engine = self.config_manager.get_model_size_for_engine(engine)
+                logger.info(f"Saved model for {engine}: {saved_model_for_engine}")
+
+                if engine == "whisper_cpp":
+                    self._populate_whispercpp_model_options(saved_model_for_engine)
+                    return
+
+                rows = []
+                downloaded_models = []
+                smallest_model = None
+                recommended_model, _ = self._get_recommended_model(engine)
+
+                language = self.language if engine == "vosk" else ""
+                for size, label in _MODEL_ROWS.get(engine, ()):
+                    is_downloaded = self._is_model_downloaded(engine, size, language)
                     status = "✓" if is_downloaded else "↓"
                     star = " ★" if size == recommended_model else ""
-                    display_text = (
-                        f"{model_display_name} ({_format_size(info.get('size_mb', 0))}) "
-                        f"{status}{star}"
-                    )
 
                     if is_downloaded:
                         downloaded_models.append(size)
                     if smallest_model is None:
                         smallest_model = size
 
-                    self.model_combo.append(size.capitalize(), display_text)
-
-            # Determine which model to select
-            saved_model = saved_model_for_engine.lower()
-            valid_models = [m.lower() for m in ENGINE_MODELS.get(engine, [])]
+                    rows.append((size, f"{label} {status}{star}"))
 
-            if saved_model in valid_models:
-                model_to_set = saved_model.capitalize()
-            elif downloaded_models:
-                model_to_set = downloaded_models[0].capitalize()
-            else:
-                model_to_set = smallest_model.capitalize() if smallest_model else "Small"
+                _set_combo_rows(self.model_combo, rows)
 
-            logger.info(f"Setting active model to: {model_to_set}")
+                # Determine which model to select
+                saved_model = saved_model_for_engine.lower()
 
-            if not self.model_combo.set_active_id(model_to_set):
-                logger.warning(f"Could not set model by ID '{model_to_set}'")
-                model = self.model_combo.get_model()
-                for i, row in enumerate(model):
-                    if row[0].lower() == model_to_set.lower():
-                        self.model_combo.set_active(i)
-                        break
+                # Picker sizes are already lowercase
+                if saved_model in ENGINE_MODELS.get(engine, ()):
+                    model_key = saved_model
+                elif downloaded_models:
+                    model_key = downloaded_models[0]
                 else:
-                    if len(ENGINE_MODELS.get(engine, [])) > 0:
-                        self.model_combo.set_active(0)
+                    model_key = smallest_model or "small"
+                logger.info(f"Setting active model to: {model_key}")
 
-            logger.info(f"Final selected model: {self.model_combo.get_active_text()}")
-        finally:
-            self._populating_models = False
+                # Row ids are the sizes themselves, so only an unknown size misses
+                if not self.model_combo.set_active_id(model_key) and rows:
+                    logger.warning(f"Could not set model by ID '{model_key}'")
+                    self.model_combo.set_active(0)
+
+                logger.info(f"Final selected model: {self.model_combo.get_active_text()}")
 
     def _populate_whispercpp_model_options(self, saved_model_for_engine: str):
         """Populate whisper.cpp size and specialization selectors."""
         recommended_model, _ = self._get_recommended_whispercpp_model_for_language()
-        recommended_size = get_whispercpp_model_size(recommended_model)
+        recommended_size = (
+            get_whispercpp_model_size(recommended_model) if recommended_model else None
+        )
 
         saved_model = saved_model_for_engine.lower()
         if saved_model not in WHISPERCPP_MODEL_INFO:
@@ -3987,11 +4599,12 @@ class SettingsDialog(Gtk.Dialog):
 
         saved_size = get_whispercpp_model_size(saved_model)
 
-        for model_size in ENGINE_MODELS["whisper_cpp"]:
-            display_text = _model_display_name(model_size)
+        rows = []
+        for model_size, display_text in _WHISPERCPP_SIZE_LABELS.items():
             if model_size == recommended_size:
                 display_text += " ★"
-            self.model_combo.append(model_size, display_text)
+            rows.append((model_size, display_text))
+        _set_combo_rows(self.model_combo, rows)
 
         self._set_combo_active_id_or_first(self.model_combo, saved_size)
         active_size = self.model_combo.get_active_id() or saved_size
@@ -4003,27 +4616,23 @@ class SettingsDialog(Gtk.Dialog):
         selected_model: Optional[str] = None,
     ):
         """Populate the whisper.cpp specialization selector for a size."""
-        self.model_variant_combo.remove_all()
-
-        variants = get_whispercpp_model_variants(model_size.lower())
+        # Sizes come from the size picker's row ids, which are already lowercase
+        variants = get_whispercpp_model_variants(model_size)
         recommended_model, _ = self._get_recommended_whispercpp_model_for_language()
 
+        rows = []
         for model_name in variants:
-            info = WHISPERCPP_MODEL_INFO[model_name]
-            is_downloaded = is_whispercpp_model_downloaded(model_name)
+            is_downloaded = self._is_model_downloaded("whisper_cpp", model_name)
             status = "✓" if is_downloaded else "↓"
             star = " ★" if model_name == recommended_model else ""
-            display_text = (
-                f"{_model_specialization_display_name(model_name)} "
-                f"({_format_size(info['size_mb'])}) {status}{star}"
-            )
-            self.model_variant_combo.append(model_name, display_text)
+            rows.append((model_name, f"{_WHISPERCPP_VARIANT_LABELS[model_name]} {status}{star}"))
+        _set_combo_rows(self.model_variant_combo, rows)
 
         model_to_set = selected_model if selected_model in variants else None
         if not model_to_set and recommended_model in variants:
             model_to_set = recommended_model
         if not model_to_set:
-            model_to_set = self._get_default_whispercpp_variant_for_size(model_size.lower())
+            model_to_set = self._get_default_whispercpp_variant_for_size(model_size)
         if not model_to_set and variants:
             model_to_set = variants[0]
 
@@ -4031,10 +4640,26 @@ class SettingsDialog(Gtk.Dialog):
         self._update_model_picker_tooltips()
 
     def _on_engine_changed(self, widget):
-        """Handle changes in the selected engine."""
+        """Schedule the engine switch, restarting the wait on every new selection."""
+        if self._engine_change_id is not None:
+            GLib.source_remove(self._engine_change_id)
+        self._engine_change_id = GLib.timeout_add(
+            _ENGINE_CHANGE_DELAY_MS, self._apply_engine_change
+        )
+
+    def _flush_pending_engine_change(self):
+        """Run a scheduled engine switch right away so the model pickers match it."""
+        if self._engine_change_id is None:
+            return
+        GLib.source_remove(self._engine_change_id)
+        self._apply_engine_change()
+
+    def _apply_engine_change(self):
+        """Refill the model pickers and engine-specific rows for the selected engine."""
+        self._engine_change_id = None
         engine_text = self.engine_combo.get_active_text()
         if not engine_text:
-            return
+            return False
 
         engine = _engine_from_display(engine_text)
 
@@ -4052,6 +4677,7 @@ class SettingsDialog(Gtk.Dialog):
         self._update_engine_specific_ui()
         self._update_model_info()
         self._update_voice_commands_for_engine()
+        return False
 
     def _update_voice_commands_for_engine(self):
         """Update voice commands switch based on current engine."""
@@ -4066,17 +4692,11 @@ class SettingsDialog(Gtk.Dialog):
 
     def _on_model_changed(self, widget):
         """Handle changes in the selected model."""
-        if self._populating_models:
-            return
-
         if self._get_selected_engine() == "whisper_cpp":
             model_size = self.model_combo.get_active_id()
             if model_size:
-                self._populating_models = True
-                try:
+                with _handler_blocked(self.model_variant_combo, self._model_variant_changed_id):
                     self._populate_whispercpp_variant_options(model_size)
-                finally:
-                    self._populating_models = False
                 self._sync_language_options_for_selected_model()
 
         self._update_model_info()
@@ -4084,9 +4704,6 @@ class SettingsDialog(Gtk.Dialog):
 
     def _on_model_variant_changed(self, widget):
         """Handle changes in the selected whisper.cpp specialization."""
-        if self._populating_models:
-            return
-
         self._sync_language_options_for_selected_model()
         self._update_model_info()
         self._auto_apply_settings()
@@ -4108,7 +4725,7 @@ class SettingsDialog(Gtk.Dialog):
         logger.info(f"Voice commands toggled: {enabled}")
 
         self.config_manager.set("speech_recognition", "voice_commands_enabled", enabled)
-        self.config_manager.save_settings()
+        self._schedule_config_save()
         try:
             self.speech_engine.reconfigure(voice_commands_enabled=enabled, force_download=False)
         except Exception as e:
@@ -4118,33 +4735,31 @@ class SettingsDialog(Gtk.Dialog):
 
     def _populate_language_options(self):
         """Populate language dropdown with supported languages."""
-        self.language_combo.remove_all()
-        engine = self.engine_combo.get_active_text()
-        if not engine:
-            return
-
-        engine = _engine_from_display(engine)
-        english_only_whispercpp = self._is_selected_whispercpp_model_english_only()
-
-        for lang_code, lang_info in SUPPORTED_LANGUAGES.items():
-            display_text = lang_info["name"]
-
-            if engine == "vosk":
-                has_model = lang_info["vosk"] is not None
-                if not has_model or lang_code == "auto":
-                    continue
-                is_downloaded = _is_vosk_model_downloaded("small", lang_code)
-                display_text += " ✓" if is_downloaded else " ↓"
-            elif engine in ["whisper", "whisper_cpp", "remote_api"]:
-                if english_only_whispercpp and lang_info.get("whisper") != "en":
-                    continue
-                # Both Whisper and whisper.cpp support auto-detect
-                if lang_code == "auto":
-                    display_text += " ⚠"
+        engine_text = self.engine_combo.get_active_text()
+        engine = _engine_from_display(engine_text) if engine_text else None
+
+        if engine == "vosk":
+            rows = [
+                (
+                    lang_code,
+                    (
+                        f"{name} ✓"
+                        if self._is_model_downloaded("vosk", "small", lang_code)
+                        else f"{name} ↓"
+                    ),
+                )
+                for lang_code, name in _VOSK_LANGUAGES
+            ]
+        elif engine in ("whisper", "whisper_cpp", "remote_api"):
+            # Both Whisper and whisper.cpp support auto-detect
+            if self._is_selected_whispercpp_model_english_only():
+                rows = _WHISPER_ENGLISH_LANGUAGE_ROWS
             else:
-                continue
+                rows = _WHISPER_LANGUAGE_ROWS
+        else:
+            rows = ()
 
-            self.language_combo.append(lang_code, display_text)
+        _set_combo_rows(self.language_combo, rows)
 
     def _update_language_warning(self):
         """Update language help text for the selected engine/model/language."""
@@ -4169,25 +4784,22 @@ class SettingsDialog(Gtk.Dialog):
 
     def _on_language_changed(self, widget):
         """Handle language selection change."""
-        if self._processing_language_change:
-            return
-
         lang_code = self.language_combo.get_active_id()
         if not lang_code:
             return
 
-        engine = self.engine_combo.get_active_text()
-        if not engine:
+        engine_text = self.engine_combo.get_active_text()
+        if not engine_text:
             return
 
-        self._processing_language_change = True
-        try:
+        with _handler_blocked(self.language_combo, self._language_changed_id):
             self.language = lang_code
-            self._populate_model_options()
+            # Only VOSK download markers and whisper.cpp variant picks depend on
+            # the language; the Whisper and Remote API pickers stay as they are.
+            if _engine_from_display(engine_text) in ("vosk", "whisper_cpp"):
+                self._populate_model_options()
             self._update_language_warning()
             self._auto_apply_settings()
-        finally:
-            self._processing_language_change = False
 
     def _update_engine_specific_ui(self):
         """Show/hide UI elements driven by the active engine."""
@@ -4195,26 +4807,32 @@ class SettingsDialog(Gtk.Dialog):
         engine = _engine_from_display(engine_text) if engine_text else "vosk"
         is_remote = engine == "remote_api"
 
+        self._set_engine_widget_visible(self.model_row, not is_remote)
         if is_remote:
-            self.model_row.hide()
-            self.model_variant_row.hide()
             self.model_info_card.hide()
-            self.remote_server_group.show_all()
-            self.remote_status_label.show()
-        else:
-            self.model_row.show_all()
-            if engine == "whisper_cpp":
-                self.model_variant_row.show_all()
-            else:
-                self.model_variant_row.hide()
-            self.remote_server_group.hide()
-            self.remote_status_label.hide()
+        self._set_engine_widget_visible(self.model_variant_row, engine == "whisper_cpp")
+        self._set_engine_widget_visible(self.remote_server_group, is_remote)
+        self._set_engine_widget_visible(self.remote_status_label, is_remote)
 
         self._update_model_info()
         self._update_language_warning()
         self._update_model_picker_tooltips()
         self._update_advanced_tab_sensitivity()
 
+    def _set_engine_widget_visible(self, widget: Gtk.Widget, visible: bool) -> None:
+        """Show or hide a widget that only applies to some engines.
+
+        These widgets keep ``no_show_all`` set while hidden, so the dialog's
+        ``show_all()`` does not map them only for this method to hide them
+        again. Same pairing as ``_set_custom_shortcut_row_visible``.
+        """
+        if visible:
+            widget.set_no_show_all(False)
+            widget.show_all()
+        else:
+            widget.hide()
+            widget.set_no_show_all(True)
+
     def _update_advanced_tab_sensitivity(self):
         """Enable or disable advanced settings based on selected engine."""
         is_whispercpp = self._get_selected_engine() == "whisper_cpp"
@@ -4252,82 +4870,122 @@ class SettingsDialog(Gtk.Dialog):
         if engine == "whisper_cpp":
             model_name = self._get_selected_whispercpp_model()
         else:
-            model_id = self.model_combo.get_active_id()
-            if not model_id:
+            model_name = self.model_combo.get_active_id()
+            if not model_name:
                 self.model_info_card.hide()
                 return
-            model_name = model_id.lower()
 
         if engine == "whisper":
             if model_name not in WHISPER_MODEL_INFO:
                 self.model_info_card.hide()
                 return
             info = WHISPER_MODEL_INFO[model_name]
-            is_downloaded = _is_whisper_model_downloaded(model_name)
-            recommended, reason = _get_recommended_whisper_model()
+            is_downloaded = self._is_model_downloaded("whisper", model_name)
+            recommended, reason = self._get_recommended_model(engine)
             extra_info = f"Parameters: {info['params']}"
         elif engine == "whisper_cpp":
             if model_name not in WHISPERCPP_MODEL_INFO:
                 self.model_info_card.hide()
                 return
             info = WHISPERCPP_MODEL_INFO[model_name]
-            is_downloaded = is_whispercpp_model_downloaded(model_name)
+            is_downloaded = self._is_model_downloaded("whisper_cpp", model_name)
             recommended, reason = self._get_recommended_whispercpp_model_for_language()
-            backend, backend_info = detect_compute_backend()
-            extra_info = (
-                f"Parameters: {info['params']} • Backend: {get_backend_display_name(backend)}"
-            )
+            backend_display = self._backend_display or "Detecting…"
+            extra_info = f"Parameters: {info['params']} • Backend: {backend_display}"
         elif engine == "vosk":
             if model_name not in VOSK_MODEL_INFO:
                 self.model_info_card.hide()
                 return
             info = VOSK_MODEL_INFO[model_name]
-            is_downloaded = _is_vosk_model_downloaded(model_name, self.language)
-            recommended, reason = _get_recommended_vosk_model()
+            is_downloaded = self._is_model_downloaded("vosk", model_name, self.language)
+            recommended, reason = self._get_recommended_model(engine)
             extra_info = f"Size: {_format_size(info['size_mb'])}"
         else:
             self.model_info_card.hide()
             return
 
-        model_display_name = _model_display_name(model_name)
-        recommended_display_name = _model_display_name(recommended)
-
         # Update title
-        self.model_info_title.set_markup(f"<b>{model_display_name}</b>: {info['desc']}")
+        _set_markup_if_changed(
+            self.model_info_title,
+            _MARKUP_MODEL_TITLE.format(name=_model_display_name(model_name), desc=info["desc"]),
+        )
 
         # Update subtitle with status
         if is_downloaded:
-            status = "<span foreground='#26a269'>✓ Downloaded and ready</span>"
+            status = _MARKUP_MODEL_DOWNLOADED
         else:
-            status = f"<span foreground='#e5a50a'>↓ Will download ~{_format_size(info['size_mb'])}</span>"
-        self.model_info_subtitle.set_markup(f"{extra_info} • {status}")
+            status = _MARKUP_MODEL_WILL_DOWNLOAD.format(size=_format_size(info["size_mb"]))
+        _set_markup_if_changed(self.model_info_subtitle, f"{extra_info} • {status}")
 
         # Update recommendation
-        if model_name == recommended:
-            self.model_recommendation.set_markup(
-                f"<span foreground='#26a269'>★ Recommended for your system ({reason})</span>"
-            )
+        if recommended is None:
+            recommendation = _MARKUP_MODEL_DETECTING
+        elif model_name == recommended:
+            recommendation = _MARKUP_MODEL_RECOMMENDED.format(reason=reason)
         else:
-            self.model_recommendation.set_markup(
-                f"Tip: <b>{recommended_display_name}</b> is recommended for your system ({reason})"
+            recommendation = _MARKUP_MODEL_TIP.format(
+                name=_model_display_name(recommended), reason=reason
             )
+        _set_markup_if_changed(self.model_recommendation, recommendation)
 
         self._update_model_picker_tooltips()
         self.model_info_card.show_all()
 
     def _auto_apply_settings(self):
+        """Schedule an automatic apply, restarting the wait on every new change."""
+        if self._initializing or self._applying_settings:
+            return
+
+        if self._apply_timeout_id is not None:
+            GLib.source_remove(self._apply_timeout_id)
+        self._apply_timeout_id = GLib.timeout_add(
+            _AUTO_APPLY_DELAY_MS, self._auto_apply_settings_now
+        )
+
+    def _schedule_config_save(self):
+        """Save the config shortly, folding back-to-back edits into one write."""
+        if self._config_save_id is None:
+            self._config_save_id = GLib.timeout_add(_CONFIG_SAVE_DELAY_MS, self._save_config_now)
+
+    def _save_config_now(self):
+        """Write the config to disk (runs from the save timer)."""
+        self._config_save_id = None
+        self.config_manager.save_settings()
+        return False
+
+    def _flush_pending_config_save(self):
+        """Write a scheduled config save right away instead of waiting for it."""
+        if self._config_save_id is None:
+            return
+        GLib.source_remove(self._config_save_id)
+        self._save_config_now()
+
+    def _flush_pending_auto_apply(self):
+        """Run a scheduled automatic apply right away instead of waiting for it."""
+        if self._apply_timeout_id is None:
+            return
+        GLib.source_remove(self._apply_timeout_id)
+        self._auto_apply_settings_now()
+
+    def _auto_apply_settings_now(self):
         """Automatically apply settings when changed."""
+        self._apply_timeout_id = None
+        # Settings are read from the model pickers, which must match the engine
+        self._flush_pending_engine_change()
+
         if self._applying_settings:
-            return
+            return False
 
         if self._initializing:
-            return
+            return False
 
         if self._test_active:
-            return
+            return False
 
-        if self._populating_models:
-            return
+        if self._background_apply:
+            # Picked up again once the running apply finishes
+            self._reapply_after_background = True
+            return False
 
         self._applying_settings = True
         try:
@@ -4338,13 +4996,15 @@ class SettingsDialog(Gtk.Dialog):
             # Check if model needs to be downloaded
             needs_download = False
             model_info = {"size_mb": 100}  # Default
-            if engine == "whisper" and not _is_whisper_model_downloaded(model_name):
+            if engine == "whisper" and not self._is_model_downloaded(engine, model_name):
                 needs_download = True
                 model_info = WHISPER_MODEL_INFO.get(model_name, {"size_mb": 500})
-            elif engine == "whisper_cpp" and not is_whispercpp_model_downloaded(model_name):
+            elif engine == "whisper_cpp" and not self._is_model_downloaded(engine, model_name):
                 needs_download = True
                 model_info = WHISPERCPP_MODEL_INFO.get(model_name, {"size_mb": 39})
-            elif engine == "vosk" and not _is_vosk_model_downloaded(model_name, self.language):
+            elif engine == "vosk" and not self._is_model_downloaded(
+                engine, model_name, self.language
+            ):
                 needs_download = True
                 model_info = VOSK_MODEL_INFO.get(model_name, {"size_mb": 50})
 
@@ -4356,28 +5016,22 @@ class SettingsDialog(Gtk.Dialog):
                     model_info["size_mb"],
                     engine=engine,
                     language=self.language,
+                    on_cancel=self.speech_engine.cancel_download,
                 )
 
-                def progress_callback(fraction, speed, status):
-                    GLib.idle_add(download_dialog.update_progress, fraction, speed, status)
+                progress_callback = download_dialog.report_progress
+                runtime_only = self._save_for_reconfigure(settings)
 
                 def download_and_apply():
                     try:
                         self.speech_engine.set_download_progress_callback(progress_callback)
 
-                        def check_cancelled():
-                            if download_dialog.cancelled:
-                                self.speech_engine.cancel_download()
-                            return not download_dialog.cancelled
-
-                        cancel_check_id = GLib.timeout_add(100, check_cancelled)
-
                         try:
-                            self._apply_settings_internal(settings)
+                            self._apply_settings_internal(settings, runtime_only)
+                            self._forget_model_downloads()
                             GLib.idle_add(download_dialog.set_complete, True, "")
                             GLib.idle_add(self._populate_model_options)
                         finally:
-                            GLib.source_remove(cancel_check_id)
                             self.speech_engine.set_download_progress_callback(None)
 
                     except Exception as e:
@@ -4401,22 +5055,71 @@ class SettingsDialog(Gtk.Dialog):
                 threading.Thread(target=download_and_apply, daemon=True).start()
                 download_dialog.run()
                 download_dialog.destroy()
-                return
-
-            logger.info(f"Auto-applying settings: {settings}")
-
-            self._save_selected_settings(settings)
+                return False
 
-            was_running = self.speech_engine.state != RecognitionState.IDLE
-            if was_running:
-                self.speech_engine.stop_recognition()
+            if self._settings_match_config(settings):
+                logger.debug("Selected settings match the saved config; nothing to apply")
+                return False
 
-            self.speech_engine.reconfigure(**settings)
-            logger.info("Settings auto-applied successfully")
+            logger.info(f"Auto-applying settings: {settings}")
+            self._apply_in_background(settings)
         except Exception as e:
             logger.error(f"Failed to auto-apply settings: {e}")
         finally:
             self._applying_settings = False
+        return False
+
+    def _apply_in_background(self, settings: dict, on_done=None):
+        """
+        Reconfigure the engine on a worker thread so the dialog stays responsive.
+
+        ``on_done`` is called on the main loop with the error message, or None
+        on success. The test buttons stay disabled until then.
+        """
+        runtime_only = self._save_for_reconfigure(settings)
+        self._background_apply = True
+        self.test_audio_btn.set_sensitive(False)
+        self.test_audio_btn.set_label("Applying…")
+        self.test_button.set_sensitive(False)
+
+        def reconfigure_in_background():
+            error = None
+            try:
+                self._reconfigure_engine(settings, runtime_only)
+                logger.info("Settings applied successfully.")
+            except Exception as e:
+                logger.error(f"Failed to apply settings: {e}", exc_info=True)
+                error = str(e)
+            GLib.idle_add(self._finish_background_apply, error, on_done)
+
+        threading.Thread(target=reconfigure_in_background, daemon=True).start()
+
+    def _finish_background_apply(self, error: Optional[str], on_done):
+        """Re-enable the controls disabled while a background apply ran (main loop)."""
+        self._background_apply = False
+        if not self._dialog_is_alive():
+            return False
+        self.test_audio_btn.set_sensitive(True)
+        self.test_audio_btn.set_label("Test")
+        self.test_button.set_sensitive(True)
+        if on_done is not None:
+            on_done(error)
+        if self._reapply_after_background:
+            self._reapply_after_background = False
+            self._auto_apply_settings()
+        if self._test_after_background:
+            # Flushes the re-apply scheduled above before testing
+            self._test_after_background = False
+            self._on_test_clicked(self.test_button)
+        return False
+
+    def _needs_model_download(self, settings: dict) -> bool:
+        """Return True if applying ``settings`` would have to download a model first."""
+        engine = settings.get("engine", "vosk")
+        if engine not in ("whisper", "whisper_cpp", "vosk"):
+            return False
+        language = self.language if engine == "vosk" else ""
+        return not self._is_model_downloaded(engine, settings.get("model_size", "small"), language)
 
     def _save_selected_settings(self, settings: dict):
         """Persist selected settings to their appropriate config sections."""
@@ -4428,6 +5131,44 @@ class SettingsDialog(Gtk.Dialog):
             self.config_manager.set("advanced", key, value)
         self.config_manager.save_settings()
 
+    def _changed_settings(self, settings: dict) -> set:
+        """Return the keys whose selected value differs from the saved one."""
+        changed = set()
+        for key, value in settings.items():
+            section = "advanced" if key.startswith("whispercpp_") else "speech_recognition"
+            if self.config_manager.get(section, key, None) != value:
+                changed.add(key)
+        engine = settings.get("engine", "vosk")
+        if self.config_manager.get_model_size_for_engine(engine) != settings.get("model_size"):
+            changed.add("model_size")
+        return changed
+
+    def _settings_match_config(self, settings: dict) -> bool:
+        """Return True if every selected value is already the saved one."""
+        return not self._changed_settings(settings)
+
+    def _save_for_reconfigure(self, settings: dict) -> bool:
+        """
+        Save settings ahead of an engine reload, on the main loop.
+
+        The config is only written from the main loop, so this runs before any
+        worker starts. Returns True if only runtime settings changed.
+        """
+        runtime_only = self._changed_settings(settings) <= _RUNTIME_SETTINGS
+        self._save_selected_settings(settings)
+        return runtime_only
+
+    def _reconfigure_engine(self, settings: dict, runtime_only: bool):
+        """Reload the engine with already saved settings; safe to call off the UI thread."""
+        # VAD and silence timeout changes are picked up by a running session
+        was_running = not runtime_only and self.speech_engine.state != RecognitionState.IDLE
+        if was_running:
+            self.speech_engine.stop_recognition()
+            # Usually already idle; only waits if another stop is in flight
+            self.speech_engine.wait_until_idle(timeout=2.0)
+
+        self.speech_engine.reconfigure(**settings)
+
     def get_selected_settings(self) -> dict:
         """Return the currently selected settings from the UI."""
         engine_text = self.engine_combo.get_active_text()
@@ -4438,7 +5179,7 @@ class SettingsDialog(Gtk.Dialog):
         if engine == "whisper_cpp":
             model_size = self._get_selected_whispercpp_model()
         else:
-            model_size = model_id.lower() if model_id else "small"
+            model_size = model_id or "small"
         language = language_id if language_id else self._default_language_for_engine(engine)
 
         vad = int(self.vad_spin.get_value())
@@ -4484,37 +5225,58 @@ class SettingsDialog(Gtk.Dialog):
 
     def _on_test_clicked(self, widget):
         """Handle click on the test button."""
-        if self._test_active:
+        if self._test_active or self._background_apply:
             logger.warning("Test already in progress.")
             return
 
+        # Don't let a pending auto-apply be skipped while the test runs
+        self._flush_pending_engine_change()
+        self._flush_pending_auto_apply()
+        self._ensure_test_output()
+        if self._background_apply:
+            # The flushed auto-apply is reloading the engine; test once it is done
+            self._test_after_background = True
+            self.test_buffer.set_text("Applying settings...")
+            return
+
         current_config = self.config_manager.get_settings().get("speech_recognition", {})
         selected_settings = self.get_selected_settings()
 
-        settings_differ = False
-        if current_config.get("engine") != selected_settings.get("engine") or current_config.get(
-            "model_size"
-        ) != selected_settings.get("model_size"):
-            settings_differ = True
-        elif selected_settings.get("engine") == "vosk":
-            if current_config.get("vad_sensitivity") != selected_settings.get(
-                "vad_sensitivity"
-            ) or current_config.get("silence_timeout") != selected_settings.get("silence_timeout"):
-                settings_differ = True
+        keys = {"engine", "model_size"}
+        if selected_settings.get("engine") == "vosk":
+            keys |= {"vad_sensitivity", "silence_timeout"}
+        settings_differ = any(current_config.get(k) != selected_settings.get(k) for k in keys)
 
         if settings_differ:
             self.test_buffer.set_text("Applying settings...")
-            if not self.apply_settings():
+            if not self._needs_model_download(selected_settings):
+                # Start once the engine has been reloaded off the UI thread
+                self._apply_in_background(selected_settings, self._on_test_settings_applied)
+                return
+            # Downloads run behind their own modal progress dialog
+            if not self._apply_selected_settings(selected_settings):
                 self.test_buffer.set_text("Failed to apply settings. Please try again.")
                 return
             self.test_buffer.set_text("Settings applied. Starting test...")
 
+        self._start_test()
+
+    def _on_test_settings_applied(self, error: Optional[str]):
+        """Start the dictation test once its settings are applied."""
+        if error is not None:
+            self.test_buffer.set_text("Failed to apply settings. Please try again.")
+            self._show_apply_error(error)
+            return
+        self._start_test()
+
+    def _start_test(self):
+        """Listen for a few seconds and show what was recognized."""
         self._test_active = True
         self.test_button.set_sensitive(False)
         self.test_button.set_label("Testing… Speak Now!")
         self.test_output_revealer.set_reveal_child(True)
         self.test_buffer.set_text("")
-        self._test_result = ""
+        self._test_has_text = False
 
         self.connect_to_recognition_manager()
         self.update_recognition_progress("Listening", info="Starting recognition test...")
@@ -4523,29 +5285,36 @@ class SettingsDialog(Gtk.Dialog):
         self.speech_engine.set_text_callbacks([self._test_text_callback])
 
         self.speech_engine.start_recognition()
-        threading.Thread(target=self._stop_test_after_delay, args=(3,)).start()
+        if self._test_timeout_id is not None:
+            GLib.source_remove(self._test_timeout_id)
+        self._test_timeout_id = GLib.timeout_add_seconds(
+            _TEST_DURATION_SECONDS, self._finalize_test
+        )
 
     def _test_text_callback(self, text: str):
         """Callback specifically for the test recognition."""
-        GLib.idle_add(self._append_test_result, text)
+        self._post_test_text(text)
 
     def _append_test_result(self, text: str):
-        current_text = self.test_buffer.get_text(
-            self.test_buffer.get_start_iter(), self.test_buffer.get_end_iter(), False
-        )
-        separator = " " if current_text.strip() else ""
-        self.test_buffer.insert(self.test_buffer.get_end_iter(), separator + text)
-        mark = self.test_buffer.get_insert()
-        self.test_textview.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
+        """Append recognized text to the dictation test output (main loop)."""
+        test_buffer = self.test_buffer
+        # Blank results would only add whitespace, trimming and a scroll
+        if test_buffer is None or not text.strip():
+            return False
+        separator = " " if self._test_has_text else ""
+        test_buffer.insert(test_buffer.get_end_iter(), separator + text)
+        self._test_has_text = True
+
+        excess = test_buffer.get_char_count() - _TEST_OUTPUT_MAX_CHARS
+        if excess > 0:
+            test_buffer.delete(test_buffer.get_start_iter(), test_buffer.get_iter_at_offset(excess))
+        self.test_textview.scroll_to_mark(self._test_end_mark, 0.0, True, 0.0, 1.0)
         return False
 
-    def _stop_test_after_delay(self, delay: int):
-        """Stops the recognition test after a specified delay."""
-        time.sleep(delay)
-        GLib.idle_add(self._finalize_test)
-
     def _finalize_test(self):
-        """Finalize the test state and UI updates."""
+        """Finalize the test state and UI updates (runs from the test timer)."""
+        # Returning False below destroys the timer source
+        self._test_timeout_id = None
         if not self._test_active:
             return False
 
@@ -4570,50 +5339,33 @@ class SettingsDialog(Gtk.Dialog):
             self.speech_engine.set_text_callbacks(self._saved_text_callbacks)
             del self._saved_text_callbacks
 
-        # Check result after giving time for final callbacks to complete
-        GLib.timeout_add(300, self._check_test_result)
+        # One-shot check once the main loop is idle: test results are delivered
+        # through idle_add too, so any still queued are appended first.
+        GLib.idle_add(self._check_test_result)
         return False
 
     def _check_test_result(self):
         """Check if any text was captured after all callbacks have run."""
-        final_text = self.test_buffer.get_text(
-            self.test_buffer.get_start_iter(), self.test_buffer.get_end_iter(), False
-        )
-        if not final_text.strip():
+        if not self._test_has_text:
             self.test_buffer.set_text("(No speech detected during test)")
         return False
 
     def _show_whisper_install_dialog(self):
         """Show a dialog with instructions for installing Whisper."""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.WARNING,
-            buttons=Gtk.ButtonsType.OK,
-            text="Whisper Not Installed",
-        )
-
-        install_text = """Whisper AI is not installed. To use Whisper for speech recognition, you need to install it first.
-
-Installation Options:
-
-1. Using the installation script:
-   ./install.sh --with-whisper
-
-2. Manual installation in virtual environment:
-   source venv/bin/activate
-   pip install openai-whisper torch torchaudio
-
-3. If you have SSL issues, try:
-   pip install openai-whisper torch torchaudio --trusted-host pypi.org --trusted-host pypi.python.org --trusted-host files.pythonhosted.org
-
-Note: Whisper requires significant disk space (~1-3GB) and may take time to download.
-
-For now, the engine has been reverted to VOSK."""
-
-        dialog.format_secondary_text(install_text)
+        dialog = self._whisper_install_dialog
+        if dialog is None:
+            # Built once and hidden after use, since the text never changes
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                flags=0,
+                message_type=Gtk.MessageType.WARNING,
+                buttons=Gtk.ButtonsType.OK,
+                text="Whisper Not Installed",
+            )
+            dialog.format_secondary_text(_WHISPER_INSTALL_TEXT)
+            self._whisper_install_dialog = dialog
         dialog.run()
-        dialog.destroy()
+        dialog.hide()
 
         self.engine_combo.set_active_id("Vosk")
         self._populate_model_options()
@@ -4621,7 +5373,10 @@ For now, the engine has been reverted to VOSK."""
 
     def apply_settings(self):
         """Apply the selected settings."""
-        settings = self.get_selected_settings()
+        return self._apply_selected_settings(self.get_selected_settings())
+
+    def _apply_selected_settings(self, settings: dict) -> bool:
+        """Apply settings already read from the widgets, downloading the model if needed."""
         logger.info(f"Applying settings: {settings}")
 
         engine = settings.get("engine", "vosk")
@@ -4629,13 +5384,13 @@ For now, the engine has been reverted to VOSK."""
 
         needs_download = False
         model_info = {"size_mb": 100}  # Default
-        if engine == "whisper" and not _is_whisper_model_downloaded(model_name):
+        if engine == "whisper" and not self._is_model_downloaded(engine, model_name):
             needs_download = True
             model_info = WHISPER_MODEL_INFO.get(model_name, {"size_mb": 500})
-        elif engine == "whisper_cpp" and not is_whispercpp_model_downloaded(model_name):
+        elif engine == "whisper_cpp" and not self._is_model_downloaded(engine, model_name):
             needs_download = True
             model_info = WHISPERCPP_MODEL_INFO.get(model_name, {"size_mb": 39})
-        elif engine == "vosk" and not _is_vosk_model_downloaded(model_name, self.language):
+        elif engine == "vosk" and not self._is_model_downloaded(engine, model_name, self.language):
             needs_download = True
             model_info = VOSK_MODEL_INFO.get(model_name, {"size_mb": 50})
 
@@ -4646,27 +5401,21 @@ For now, the engine has been reverted to VOSK."""
                 model_info["size_mb"],
                 engine=engine,
                 language=self.language,
+                on_cancel=self.speech_engine.cancel_download,
             )
 
-            def progress_callback(fraction, speed, status):
-                GLib.idle_add(download_dialog.update_progress, fraction, speed, status)
+            progress_callback = download_dialog.report_progress
+            runtime_only = self._save_for_reconfigure(settings)
 
             def download_and_apply():
                 try:
                     self.speech_engine.set_download_progress_callback(progress_callback)
 
-                    def check_cancelled():
-                        if download_dialog.cancelled:
-                            self.speech_engine.cancel_download()
-                        return not download_dialog.cancelled
-
-                    cancel_check_id = GLib.timeout_add(100, check_cancelled)
-
                     try:
-                        self._apply_settings_internal(settings)
+                        self._apply_settings_internal(settings, runtime_only)
+                        self._forget_model_downloads()
                         GLib.idle_add(download_dialog.set_complete, True, "")
                     finally:
-                        GLib.source_remove(cancel_check_id)
                         self.speech_engine.set_download_progress_callback(None)
 
                 except Exception as e:
@@ -4686,28 +5435,34 @@ For now, the engine has been reverted to VOSK."""
             self._populate_model_options()
             return True
 
-        return self._apply_settings_internal(settings)
+        if self._settings_match_config(settings):
+            logger.info("Selected settings match the saved config; nothing to apply")
+            return True
+
+        runtime_only = self._save_for_reconfigure(settings)
+        return self._apply_settings_internal(settings, runtime_only)
 
-    def _apply_settings_internal(self, settings: dict) -> bool:
+    def _apply_settings_internal(self, settings: dict, runtime_only: bool) -> bool:
         """Internal method to apply settings."""
         try:
-            self._save_selected_settings(settings)
-
-            was_running = self.speech_engine.state != RecognitionState.IDLE
-            if was_running:
-                self.speech_engine.stop_recognition()
-                time.sleep(0.5)
-
-            self.speech_engine.reconfigure(**settings)
+            self._reconfigure_engine(settings, runtime_only)
 
             logger.info("Settings applied successfully.")
             return True
         except Exception as e:
             logger.error(f"Failed to apply settings: {e}", exc_info=True)
+            # May be running on the download worker; dialogs belong on the main loop
+            GLib.idle_add(self._show_apply_error, str(e))
+            return False
 
-            if "whisper" in str(e).lower() and "no module named" in str(e).lower():
-                self._show_whisper_install_dialog()
-            else:
+    def _show_apply_error(self, message: str):
+        """Tell the user why applying settings failed."""
+        if "whisper" in message.lower() and "no module named" in message.lower():
+            self._show_whisper_install_dialog()
+        else:
+            error_dialog = self._apply_error_dialog
+            if error_dialog is None:
+                # Built once and hidden after use; only the details change
                 error_dialog = Gtk.MessageDialog(
                     transient_for=self,
                     flags=0,
@@ -4715,21 +5470,20 @@ For now, the engine has been reverted to VOSK."""
                     buttons=Gtk.ButtonsType.OK,
                     text="Error Applying Settings",
                 )
-                error_dialog.format_secondary_text(f"Could not apply settings: {e}")
-                error_dialog.run()
-                error_dialog.destroy()
-            return False
+                self._apply_error_dialog = error_dialog
+            error_dialog.format_secondary_text(f"Could not apply settings: {message}")
+            error_dialog.run()
+            error_dialog.hide()
+        return False
 
     def _populate_gpu_devices(self):
         """Populate the GPU device dropdown with available Vulkan devices."""
-        self.gpu_device_combo.remove_all()
-        self.gpu_device_combo.append("-1", "Auto (prefer discrete GPU)")
-
-        devices = detect_vulkan_devices()
-        for device in devices:
+        rows = [("-1", "Auto (prefer discrete GPU)")]
+        for device in detect_vulkan_devices():
             type_label = device["device_type"].capitalize()
             label = f"[{device['index']}] {device['name']} ({type_label})"
-            self.gpu_device_combo.append(str(device["index"]), label)
+            rows.append((str(device["index"]), label))
+        _set_combo_rows(self.gpu_device_combo, rows)
 
         saved_device = self.config_manager.get("advanced", "whispercpp_gpu_device", None)
         if saved_device is None:
@@ -4738,22 +5492,52 @@ For now, the engine has been reverted to VOSK."""
             if not self.gpu_device_combo.set_active_id(str(saved_device)):
                 self.gpu_device_combo.set_active_id("-1")
 
-    def _populate_audio_devices(self):
-        """Populate the audio device dropdown with available input devices."""
-        from ..speech_recognition.recognition_manager import get_audio_input_devices
+    def _populate_audio_devices(self, refresh: bool = False):
+        """Populate the audio device dropdown, enumerating devices off the UI thread."""
+        devices = None if refresh else _recent_audio_input_devices()
+        if devices is not None:
+            self._apply_audio_devices(devices)
+            return
 
-        self.audio_device_combo.remove_all()
+        if not refresh:
+            # Nothing listed yet: show the default until the scan comes back
+            with _handler_blocked(self.audio_device_combo, self._audio_device_changed_id):
+                _set_combo_rows(self.audio_device_combo, [("-1", "System Default")])
+                self.audio_device_combo.set_active_id("-1")
+        self.audio_device_combo.set_sensitive(False)
+        threading.Thread(target=self._enumerate_audio_devices, args=(refresh,), daemon=True).start()
 
-        self.audio_device_combo.append("-1", "System Default")
+    def _enumerate_audio_devices(self, refresh: bool):
+        """Worker thread: list the audio input devices."""
+        GLib.idle_add(self._on_audio_devices_enumerated, _enumerate_audio_input_devices(), refresh)
 
-        devices = get_audio_input_devices()
+    def _on_audio_devices_enumerated(self, devices: list, refresh: bool):
+        """Fill the device picker with the enumerated devices (main loop)."""
+        if not self._dialog_is_alive():
+            return False
+        self.audio_device_combo.set_sensitive(True)
+        self._apply_audio_devices(devices)
+        if refresh:
+            self.audio_test_status.set_markup("<i>Device list refreshed</i>")
+        return False
 
+    def _apply_audio_devices(self, devices: list):
+        """Show the given devices and select the saved one."""
+        rows = [("-1", "System Default")]
         for device_index, device_name, is_default in devices:
             label = device_name
             if is_default:
                 label += " (default)"
-            self.audio_device_combo.append(str(device_index), label)
+            rows.append((str(device_index), label))
+
+        with _handler_blocked(self.audio_device_combo, self._audio_device_changed_id):
+            _set_combo_rows(self.audio_device_combo, rows)
+            self._select_saved_audio_device(devices)
 
+        logger.info(f"Found {len(devices)} audio input devices")
+
+    def _select_saved_audio_device(self, devices: list):
+        """Select the configured device, falling back to System Default if it is gone."""
         saved_device = self.config_manager.get_optional_int("audio", "device_index", None)
         saved_device_name = self.config_manager.get("audio", "device_name", None)
 
@@ -4770,7 +5554,7 @@ For now, the engine has been reverted to VOSK."""
                 if saved_device_name and saved_raw_name and saved_device_name != saved_raw_name:
                     self.config_manager.set("audio", "device_name", saved_raw_name)
                     self.config_manager.set("audio", "device_index", matched_index)
-                    self.config_manager.save_settings()
+                    self._schedule_config_save()
             else:
                 logger.warning(
                     f"Saved audio device {saved_device} "
@@ -4780,16 +5564,13 @@ For now, the engine has been reverted to VOSK."""
                 # Keep combo, config, and engine aligned on System Default.
                 self.config_manager.set("audio", "device_index", None)
                 self.config_manager.set("audio", "device_name", None)
-                self.config_manager.save_settings()
+                self._schedule_config_save()
                 if self.speech_engine is not None:
                     self.speech_engine.set_audio_device(None, None)
 
-        logger.info(f"Found {len(devices)} audio input devices")
-
     def _on_refresh_audio_devices(self, widget):
         """Handle refresh button click for audio devices."""
-        self._populate_audio_devices()
-        self.audio_test_status.set_markup("<i>Device list refreshed</i>")
+        self._populate_audio_devices(refresh=True)
 
     def _on_audio_device_changed(self, widget):
         """Handle changes in the selected audio device."""
@@ -4803,20 +5584,20 @@ For now, the engine has been reverted to VOSK."""
         device_index = int(device_id)
         device_label = self.audio_device_combo.get_active_text()
         device_name = _raw_audio_device_name(device_label)
-
         if device_index == -1:
-            self.config_manager.set("audio", "device_index", None)
-            self.config_manager.set("audio", "device_name", None)
-        else:
-            self.config_manager.set("audio", "device_index", device_index)
-            self.config_manager.set("audio", "device_name", device_name)
+            device_index = device_name = None
 
-        self.config_manager.save_settings()
+        # Nothing to save or reconfigure when the configured device is reselected
+        saved_index = self.config_manager.get_optional_int("audio", "device_index", None)
+        saved_name = self.config_manager.get("audio", "device_name", None)
+        if (device_index, device_name) == (saved_index, saved_name):
+            return
 
-        if device_index == -1:
-            self.speech_engine.set_audio_device(None, None)
-        else:
-            self.speech_engine.set_audio_device(device_index, device_name)
+        self.config_manager.set("audio", "device_index", device_index)
+        self.config_manager.set("audio", "device_name", device_name)
+        self._schedule_config_save()
+
+        self.speech_engine.set_audio_device(device_index, device_name)
 
         logger.info(f"Audio device changed to: [{device_index}] {device_name}")
         self.audio_test_status.set_markup(f"<i>Selected: {device_label}</i>")
@@ -4879,36 +5660,31 @@ For now, the engine has been reverted to VOSK."""
 
     def update_recognition_progress(self, state: str, audio_level: float = 0.0, info: str = ""):
         """Update the recognition progress feedback UI."""
-        self.recognition_status_label.set_text(state)
-
-        # Remove existing state classes
-        for css_class in [
-            "recognition-idle",
-            "recognition-listening",
-            "recognition-processing",
-            "recognition-error",
-        ]:
-            self.recognition_status_label.get_style_context().remove_class(css_class)
+        _set_text_if_changed(self.recognition_status_label, state)
+
+        # Swap the state class only on a transition, not on every level update
+        css_class = _RECOGNITION_STATE_CLASSES.get(state)
+        if css_class != self._recognition_state_class:
+            context = self._recognition_status_context
+            if self._recognition_state_class is not None:
+                context.remove_class(self._recognition_state_class)
+            if css_class is not None:
+                context.add_class(css_class)
+            self._recognition_state_class = css_class
 
         if state == "Listening":
             self.recognition_indicator.set_opacity(1.0)
-            self.recognition_status_label.get_style_context().add_class("recognition-listening")
-            self.progress_info_label.set_markup("<span foreground='#26a269'>● Listening...</span>")
+            _set_markup_if_changed(self.progress_info_label, _MARKUP_PROGRESS_LISTENING)
         elif state == "Processing":
             self.recognition_indicator.set_opacity(1.0)
-            self.recognition_status_label.get_style_context().add_class("recognition-processing")
-            self.progress_info_label.set_markup(
-                "<span foreground='#e5a50a'>● Processing speech...</span>"
-            )
+            _set_markup_if_changed(self.progress_info_label, _MARKUP_PROGRESS_PROCESSING)
         elif state == "Idle":
             self.recognition_indicator.set_opacity(0.3)
-            self.recognition_status_label.get_style_context().add_class("recognition-idle")
-            self.progress_info_label.set_text("")
+            _set_text_if_changed(self.progress_info_label, "")
         elif state == "Error":
             self.recognition_indicator.set_opacity(0.3)
-            self.recognition_status_label.get_style_context().add_class("recognition-error")
-            self.progress_info_label.set_markup(
-                f"<span foreground='#c01c28'>✗ Error: {info}</span>"
+            _set_markup_if_changed(
+                self.progress_info_label, _MARKUP_PROGRESS_ERROR.format(info=info)
             )
         else:
             self.recognition_indicator.set_opacity(0.3)
@@ -4917,38 +5693,66 @@ For now, the engine has been reverted to VOSK."""
 
         if audio_level > 0:
             normalized_level = min(100, max(0, audio_level))
-            self.recognition_audio_level.set_value(normalized_level)
+            # A change of under one percent does not move the bar by a pixel
+            if abs(normalized_level - self.recognition_audio_level.get_value()) >= 1.0:
+                self.recognition_audio_level.set_value(normalized_level)
         elif state == "Idle":
             self.recognition_audio_level.set_value(0)
 
+    def _update_audio_level(self, audio_level: float):
+        """Move the level bar; levels that arrive after listening stopped are dropped."""
+        if self._recognition_state_class != _RECOGNITION_STATE_CLASSES["Listening"]:
+            return
+        normalized_level = min(100, max(0, audio_level))
+        if abs(normalized_level - self.recognition_audio_level.get_value()) >= 1.0:
+            self.recognition_audio_level.set_value(normalized_level)
+
     def connect_to_recognition_manager(self):
         """Connect to speech recognition manager for progress updates."""
         if hasattr(self, "speech_engine") and self.speech_engine:
-            if not hasattr(self, "_callbacks_registered"):
+            if not getattr(self, "_callbacks_registered", False):
                 self.speech_engine.state_callbacks.append(self._on_recognition_state_changed)
                 self.speech_engine.register_audio_level_callback(self._on_audio_level_changed)
                 self._callbacks_registered = True
-                self.connect("destroy", self._on_dialog_destroy)
+
+    def disconnect_from_recognition_manager(self):
+        """Stop progress updates, e.g. while the dialog is hidden for reuse."""
+        if hasattr(self, "speech_engine") and self.speech_engine:
+            if getattr(self, "_callbacks_registered", False):
+                if self._on_recognition_state_changed in self.speech_engine.state_callbacks:
+                    self.speech_engine.state_callbacks.remove(self._on_recognition_state_changed)
+                self.speech_engine.unregister_audio_level_callback(self._on_audio_level_changed)
+                self._callbacks_registered = False
 
     def _on_dialog_destroy(self, widget):
         """Clean up callbacks when dialog is destroyed."""
-        if hasattr(self, "speech_engine") and self.speech_engine:
-            if self._on_recognition_state_changed in self.speech_engine.state_callbacks:
-                self.speech_engine.state_callbacks.remove(self._on_recognition_state_changed)
-            self.speech_engine.unregister_audio_level_callback(self._on_audio_level_changed)
+        # Edits still inside their debounce window are applied, not dropped
+        self._flush_pending_engine_change()
+        self._flush_pending_auto_apply()
+        if self._test_timeout_id is not None:
+            GLib.source_remove(self._test_timeout_id)
+            self._test_timeout_id = None
+        if self._test_active:
+            # Its timer is gone, so end the dictation test here
+            self._test_active = False
+            self.speech_engine.stop_recognition()
+        if hasattr(self, "_saved_text_callbacks"):
+            self.speech_engine.set_text_callbacks(self._saved_text_callbacks)
+            del self._saved_text_callbacks
+        if self._whisper_install_dialog is not None:
+            self._whisper_install_dialog.destroy()
+            self._whisper_install_dialog = None
+        if self._apply_error_dialog is not None:
+            self._apply_error_dialog.destroy()
+            self._apply_error_dialog = None
+        self._flush_pending_config_save()
+        self.disconnect_from_recognition_manager()
 
     def _on_recognition_state_changed(self, state):
         """Handle recognition state changes."""
-        state_map = {
-            RecognitionState.IDLE: "Idle",
-            RecognitionState.LISTENING: "Listening",
-            RecognitionState.PROCESSING: "Processing",
-            RecognitionState.ERROR: "Error",
-        }
-
-        state_str = state_map.get(state, "Unknown")
+        state_str = _RECOGNITION_STATE_NAMES.get(state, "Unknown")
         GLib.idle_add(self.update_recognition_progress, state_str)
 
     def _on_audio_level_changed(self, level: float):
         """Handle audio level changes."""
-        GLib.idle_add(self.update_recognition_progress, "Listening", level)
+        self._post_audio_level(level)
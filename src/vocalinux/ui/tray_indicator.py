@@ -147,6 +147,10 @@ class TrayIndicator:
         # Must exist before _init_indicator: tests run idle_add synchronously.
         self._pending_update: Optional[ReleaseInfo] = None
         self._update_menu_item = None
+        # Plain menu items by label, so state changes need not walk the menu
+        self._menu_items: dict[str, Gtk.MenuItem] = {}
+        # Built on first open, then hidden and reused (see _show_settings_page)
+        self._settings_dialog: Optional[SettingsDialog] = None
 
         # Initialize the indicator (in the GTK main thread)
         GLib.idle_add(self._init_indicator)
@@ -432,6 +436,7 @@ class TrayIndicator:
         item = Gtk.MenuItem.new_with_label(label)
         item.connect("activate", callback)
         self.menu.append(item)
+        self._menu_items[label] = item
         return item
 
     def _add_menu_separator(self):
@@ -543,13 +548,9 @@ class TrayIndicator:
             label: The label of the menu item
             enabled: Whether the item should be enabled
         """
-        if not hasattr(self, "menu"):
-            return
-
-        for item in self.menu.get_children():
-            if isinstance(item, Gtk.MenuItem) and item.get_label() == label:
-                item.set_sensitive(enabled)
-                break
+        item = self._menu_items.get(label)
+        if item is not None:
+            item.set_sensitive(enabled)
 
     def _on_start_clicked(self, widget):
         """Handle click on the Start Voice Typing menu item."""
@@ -567,7 +568,18 @@ class TrayIndicator:
         self._show_settings_page(None)
 
     def _show_settings_page(self, page_name: Optional[str]):
-        """Open settings, optionally focused on a specific sidebar page."""
+        """Open settings, optionally focused on a specific sidebar page.
+
+        The dialog is built once and hidden on close; later opens re-sync it
+        with the config instead of rebuilding every page.
+        """
+        if self._settings_dialog is not None:
+            self._settings_dialog.refresh(
+                initial_page=page_name, pending_update=self._pending_update
+            )
+            self._settings_dialog.present()
+            return
+
         dialog = SettingsDialog(
             parent=None,
             config_manager=self.config_manager,
@@ -581,6 +593,9 @@ class TrayIndicator:
             ),
         )
         dialog.connect("response", self._on_settings_dialog_response)
+        dialog.connect("delete-event", self._on_settings_dialog_delete)
+        dialog.connect("destroy", self._on_settings_dialog_destroy)
+        self._settings_dialog = dialog
         dialog.show()
 
     def _get_update_channel(self) -> str:
@@ -669,10 +684,25 @@ class TrayIndicator:
 
     def _on_settings_dialog_response(self, dialog, response):
         """Handle responses from the settings dialog."""
-        # With auto-apply, we just close the dialog on any response
+        # With auto-apply, we just close the dialog on any response. It is
+        # hidden rather than destroyed so the next open can reuse it.
         if response == Gtk.ResponseType.CLOSE or response == Gtk.ResponseType.DELETE_EVENT:
             logger.info("Settings dialog closed.")
-            dialog.destroy()
+            dialog.disconnect_from_recognition_manager()
+            dialog.hide()
+
+    def _on_settings_dialog_delete(self, dialog, event):
+        """Keep the settings dialog when it is closed from the title bar or with Esc.
+
+        Gtk.Dialog first turns the delete event into a DELETE_EVENT response,
+        which hides the dialog; returning True stops GTK from destroying it.
+        """
+        return True
+
+    def _on_settings_dialog_destroy(self, dialog):
+        """Forget the cached settings dialog once GTK destroys it."""
+        if self._settings_dialog is dialog:
+            self._settings_dialog = None
 
     def update_shortcut(self, shortcut: str, mode: Optional[str] = None) -> bool:
         """
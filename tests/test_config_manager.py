@@ -131,6 +131,33 @@ class TestConfigManager(unittest.TestCase):
         # Verify logger.error was called for the broken JSON
         self.mock_logger.error.assert_called()
 
+    def test_load_config_if_stale_skips_unchanged_file(self):
+        """The config file is only re-read after it changes on disk."""
+        with open(self.temp_config_file, "w") as f:
+            json.dump({"speech_recognition": {"engine": "whisper"}}, f)
+        config_manager = ConfigManager()
+
+        self.assertFalse(config_manager.load_config_if_stale())
+
+        with open(self.temp_config_file, "w") as f:
+            json.dump({"speech_recognition": {"engine": "vosk"}}, f)
+        stat = os.stat(self.temp_config_file)
+        os.utime(self.temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertTrue(config_manager.load_config_if_stale())
+        self.assertEqual(config_manager.config["speech_recognition"]["engine"], "vosk")
+        self.assertFalse(config_manager.load_config_if_stale())
+
+    def test_own_save_does_not_mark_config_stale(self):
+        """Saving from this instance does not force a reload on the next check."""
+        config_manager = ConfigManager()
+        config_manager.config["speech_recognition"]["engine"] = "whisper"
+        config_manager.save_config()
+
+        with patch.object(config_manager, "load_config") as mock_load:
+            self.assertFalse(config_manager.load_config_if_stale())
+        mock_load.assert_not_called()
+
     def test_save_config(self):
         """Test saving configuration to file."""
         config_manager = ConfigManager()
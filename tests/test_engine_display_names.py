@@ -16,3 +16,11 @@ def test_whisper_cpp_display_name():
 def test_engine_display_roundtrip():
     for engine_id in ENGINE_DISPLAY_NAMES:
         assert _engine_from_display(_engine_display_name(engine_id)) == engine_id
+
+
+def test_unknown_engine_display_name_is_capitalized():
+    assert _engine_display_name("custom") == "Custom"
+
+
+def test_unknown_display_name_falls_back_to_lowercase():
+    assert _engine_from_display("Custom") == "custom"
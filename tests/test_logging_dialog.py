@@ -142,6 +142,13 @@ class TestLoggingDialogActions(unittest.TestCase):
         """Test that _copy_logs_to_clipboard method exists."""
         self.assertIn("def _copy_logs_to_clipboard(self)", self.source_code)
 
+    def test_copy_logs_checks_char_count_before_copying_buffer(self):
+        """Test that an empty log buffer is rejected without copying its text."""
+        start = self.source_code.index("def _copy_logs_to_clipboard(self)")
+        body = self.source_code[start : self.source_code.index("def ", start + 1)]
+        self.assertIn("self.text_buffer.get_char_count() == 0", body)
+        self.assertLess(body.index("get_char_count()"), body.index("get_text("))
+
     def test_clear_logs_method_exists(self):
         """Test that _clear_logs method exists."""
         self.assertIn("def _clear_logs(self)", self.source_code)
@@ -243,6 +250,10 @@ class TestLoggingDialogToast(unittest.TestCase):
         """Test that _show_toast method exists."""
         self.assertIn("def _show_toast(self, message: str)", self.source_code)
 
+    def test_toast_hides_on_seconds_timer(self):
+        """Test that the toast hide uses a coalescable seconds-granularity timer."""
+        self.assertIn("GLib.timeout_add_seconds(2, hide_toast)", self.source_code)
+
     def test_show_message_method_exists(self):
         """Test that _show_message method exists."""
         self.assertIn("def _show_message(", self.source_code)
@@ -12,6 +12,7 @@ sys.modules["whisper"] = MagicMock()
 sys.modules["requests"] = MagicMock()
 sys.modules["pyaudio"] = MagicMock()
 sys.modules["wave"] = MagicMock()
+_real_tempfile = sys.modules.get("tempfile")
 sys.modules["tempfile"] = MagicMock()
 sys.modules["tqdm"] = MagicMock()
 sys.modules["numpy"] = MagicMock()
@@ -25,6 +26,9 @@ from vocalinux.common_types import RecognitionState  # noqa: E402
 from vocalinux.speech_recognition.command_processor import CommandProcessor  # noqa: E402
 from vocalinux.speech_recognition.recognition_manager import SpeechRecognitionManager  # noqa: E402
 
+# Later test modules need real temporary directories
+sys.modules["tempfile"] = _real_tempfile
+
 
 class TestSpeechRecognition(unittest.TestCase):
     """Test cases for the speech recognition functionality."""
@@ -1112,6 +1116,26 @@ class TestRecognitionManagerMethods(unittest.TestCase):
         callback1.assert_called_once_with(RecognitionState.PROCESSING)
         callback2.assert_called_once_with(RecognitionState.PROCESSING)
 
+    def test_wait_until_idle(self):
+        """Test wait_until_idle returns once the state goes back to IDLE."""
+        import threading
+
+        from vocalinux.common_types import RecognitionState
+        from vocalinux.speech_recognition.recognition_manager import SpeechRecognitionManager
+
+        manager = SpeechRecognitionManager(engine="vosk")
+        self.assertTrue(manager.wait_until_idle(timeout=0))
+
+        manager._update_state(RecognitionState.PROCESSING)
+        self.assertFalse(manager.wait_until_idle(timeout=0.01))
+
+        timer = threading.Timer(0.05, manager._update_state, args=(RecognitionState.IDLE,))
+        timer.start()
+        try:
+            self.assertTrue(manager.wait_until_idle(timeout=5.0))
+        finally:
+            timer.join()
+
     def test_set_download_progress_callback(self):
         """Test setting download progress callback."""
         from vocalinux.speech_recognition.recognition_manager import SpeechRecognitionManager
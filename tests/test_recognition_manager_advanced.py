@@ -633,6 +633,23 @@ class TestWhispercppModelKwargs(unittest.TestCase):
         self.assertEqual(mgr.whispercpp_initial_prompt, "hello")
         self.assertEqual(mgr.whispercpp_temperature_inc, original_temp_inc)
 
+    def test_reconfigure_unchanged_whispercpp_params_skips_reload(self):
+        mgr = _make_manager(engine="whisper_cpp")
+        with patch.object(SpeechRecognitionManager, "_init_whispercpp") as mock_init:
+            mgr.reconfigure(
+                engine="whisper_cpp",
+                model_size="small",
+                language="en-us",
+                vad_sensitivity=4,
+                whispercpp_temperature=mgr.whispercpp_temperature,
+                whispercpp_no_context=mgr.whispercpp_no_context,
+            )
+            mock_init.assert_not_called()
+
+            mgr.reconfigure(whispercpp_no_context=not mgr.whispercpp_no_context)
+            mock_init.assert_called_once()
+        self.assertEqual(mgr.vad_sensitivity, 4)
+
 
 class TestVoiceCommandsProperty(unittest.TestCase):
     def test_voice_commands_vosk_default(self):
@@ -11,7 +11,6 @@ UX Design Notes tested:
 """
 
 import sys
-import time
 import unittest
 from unittest.mock import MagicMock, Mock, call, patch
 
@@ -72,8 +71,7 @@ def apply_settings_internal(dialog, settings: dict) -> bool:
         was_running = dialog.speech_engine.state != RecognitionState.IDLE
         if was_running:
             dialog.speech_engine.stop_recognition()
-            # Give it a moment to fully stop
-            time.sleep(0.01)  # Shortened for tests
+            dialog.speech_engine.wait_until_idle(timeout=2.0)
 
         dialog.speech_engine.reconfigure(**settings)
         return True
@@ -262,6 +260,23 @@ class TestSettingsDialogCSS(unittest.TestCase):
         self.assertNotIn("border-left:", SETTINGS_CSS)
         self.assertNotIn("border-left-color:", SETTINGS_CSS)
 
+    def test_setup_css_installs_provider_once(self):
+        """The screen-wide CSS provider is parsed and added only once."""
+        from vocalinux.ui import settings_dialog
+
+        mock_gtk = MagicMock()
+        with (
+            patch.object(settings_dialog, "Gtk", mock_gtk),
+            patch.object(settings_dialog, "_css_provider", None),
+        ):
+            settings_dialog._setup_css()
+            settings_dialog._setup_css()
+
+        mock_gtk.CssProvider.return_value.load_from_data.assert_called_once_with(
+            settings_dialog.SETTINGS_CSS.encode("utf-8")
+        )
+        mock_gtk.StyleContext.add_provider_for_screen.assert_called_once()
+
 
 class TestSettingsDialogClasses(unittest.TestCase):
     """Test cases for SettingsDialog helper classes."""
@@ -289,6 +304,50 @@ class TestSettingsDialogClasses(unittest.TestCase):
 
         self.assertTrue(callable(ModelDownloadDialog))
 
+    def test_download_cancel_is_forwarded_without_polling(self):
+        """Cancelling a download notifies the engine directly instead of via a timer."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        self.assertNotIn("check_cancelled", source_code)
+        self.assertEqual(source_code.count("on_cancel=self.speech_engine.cancel_download"), 2)
+
+    def test_download_progress_resends_early_cancel(self):
+        """Progress from the download thread re-sends a cancel instead of drawing."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        self.assertIn("self.cancel_event = threading.Event()", source_code)
+        report_source = source_code[
+            source_code.index("def report_progress") : source_code.index("def update_progress")
+        ]
+        self.assertIn("if self.cancel_event.is_set():", report_source)
+        self.assertIn("self._on_cancel()", report_source)
+        self.assertIn("self._post_progress(fraction, speed_mbps, status_text)", report_source)
+        self.assertEqual(
+            source_code.count("progress_callback = download_dialog.report_progress"), 2
+        )
+
 
 class TestSettingsDialogInstantApply(unittest.TestCase):
     """Test cases for instant-apply behavior (no action buttons)."""
@@ -315,6 +374,774 @@ class TestSettingsDialogInstantApply(unittest.TestCase):
 
         self.assertIn("def _auto_apply_settings(self", source_code)
 
+    def test_auto_apply_is_debounced_and_flushed_on_close(self):
+        """Auto-apply waits for a quiet period and pending applies run on close."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        self.assertIn("_AUTO_APPLY_DELAY_MS, self._auto_apply_settings_now", source_code)
+        self.assertIn("def _auto_apply_settings_now(self", source_code)
+        response_handler = source_code[
+            source_code.index("def _on_settings_dialog_response") : source_code.index(
+                "def _on_advanced_prompt_changed"
+            )
+        ]
+        self.assertIn("self._flush_pending_auto_apply()", response_handler)
+
+    def test_config_saves_are_debounced_and_flushed_on_close(self):
+        """Toggle handlers share one delayed config write that is flushed on close."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn("_CONFIG_SAVE_DELAY_MS, self._save_config_now", source_code)
+        response_handler = source_code[
+            source_code.index("def _on_settings_dialog_response") : source_code.index(
+                "def _on_advanced_prompt_changed"
+            )
+        ]
+        self.assertIn("self._flush_pending_config_save()", response_handler)
+        # Only the timer callback and the explicit apply path write synchronously
+        self.assertEqual(source_code.count("self.config_manager.save_settings()"), 2)
+
+    def test_dictation_test_stops_from_main_loop_timer(self):
+        """The dictation test is stopped by a GLib timer rather than a sleeping thread."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        self.assertIn("_TEST_DURATION_SECONDS, self._finalize_test", source_code)
+        self.assertNotIn("_stop_test_after_delay", source_code)
+        self.assertNotIn("time.sleep(", source_code)
+        start_source = source_code[
+            source_code.index("def _start_test") : source_code.index("def _test_text_callback")
+        ]
+        self.assertNotIn("threading.Thread", start_source)
+
+        # Destroying the dialog removes the timer, so it has to end the test itself
+        destroy_source = source_code[
+            source_code.index("def _on_dialog_destroy") : source_code.index(
+                "def _on_recognition_state_changed"
+            )
+        ]
+        self.assertLess(
+            destroy_source.index("GLib.source_remove(self._test_timeout_id)"),
+            destroy_source.index("self.speech_engine.stop_recognition()"),
+        )
+        self.assertIn(
+            "self.speech_engine.set_text_callbacks(self._saved_text_callbacks)", destroy_source
+        )
+
+    def test_reselecting_configured_audio_device_is_a_no_op(self):
+        """Picking the already configured device neither saves nor reconfigures."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        handler_source = source_code[
+            source_code.index("def _on_audio_device_changed") : source_code.index(
+                "def _on_test_audio_clicked"
+            )
+        ]
+        early_return = handler_source.index(
+            "if (device_index, device_name) == (saved_index, saved_name):"
+        )
+        self.assertLess(early_return, handler_source.index("self._schedule_config_save()"))
+        self.assertLess(early_return, handler_source.index("set_audio_device("))
+
+    def test_audio_device_population_does_not_fire_change_handler(self):
+        """Filling the device picker never runs the selection handler."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        populate_source = source_code[
+            source_code.index("def _populate_audio_devices") : source_code.index(
+                "def _on_audio_device_changed"
+            )
+        ]
+        blocked = "with _handler_blocked(self.audio_device_combo, self._audio_device_changed_id):"
+        for method in ("def _populate_audio_devices", "def _apply_audio_devices"):
+            method_source = populate_source[populate_source.index(method) :]
+            self.assertLess(
+                method_source.index(blocked),
+                method_source.index("_set_combo_rows(self.audio_device_combo"),
+            )
+
+    def test_current_settings_reload_config_only_when_stale(self):
+        """Opening the dialog reuses the in-memory config unless the file changed."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        current_source = source_code[
+            source_code.index("def _get_current_settings") : source_code.index(
+                "def _get_selected_engine"
+            )
+        ]
+        self.assertIn("self.config_manager.load_config_if_stale()", current_source)
+        self.assertNotIn("self.config_manager.load_config()", current_source)
+
+    def test_unchanged_settings_are_not_applied_again(self):
+        """Applying settings identical to the saved config skips the save and reload."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        auto_apply_source = source_code[
+            source_code.index("def _auto_apply_settings_now") : source_code.index(
+                "def _apply_in_background"
+            )
+        ]
+        self.assertLess(
+            auto_apply_source.index("if self._settings_match_config(settings):"),
+            auto_apply_source.index("self._apply_in_background(settings)"),
+        )
+
+        apply_source = source_code[
+            source_code.index("    def apply_settings(self)") : source_code.index(
+                "def _apply_settings_internal"
+            )
+        ]
+        self.assertLess(
+            apply_source.index("if self._settings_match_config(settings):"),
+            apply_source.index("return self._apply_settings_internal(settings, runtime_only)"),
+        )
+
+    def test_remote_api_edits_are_not_saved_before_auto_apply(self):
+        """Remote API fields reach the engine instead of matching the saved config."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        remote_source = source_code[
+            source_code.index("def _on_remote_api_settings_changed") : source_code.index(
+                "def _on_test_remote_connection"
+            )
+        ]
+        self.assertLess(
+            remote_source.index("self._auto_apply_settings()\n            return"),
+            remote_source.index('self.config_manager.set("speech_recognition", "remote_api_url"'),
+        )
+
+    def test_runtime_only_changes_do_not_stop_recognition(self):
+        """Changing only VAD sensitivity or silence timeout keeps recognition running."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertEqual(
+            settings_dialog._RUNTIME_SETTINGS, frozenset({"vad_sensitivity", "silence_timeout"})
+        )
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        save_source = source_code[
+            source_code.index("def _save_for_reconfigure") : source_code.index(
+                "def _reconfigure_engine"
+            )
+        ]
+        self.assertLess(
+            save_source.index("self._changed_settings(settings) <= _RUNTIME_SETTINGS"),
+            save_source.index("self._save_selected_settings(settings)"),
+        )
+        reconfigure_source = source_code[
+            source_code.index("def _reconfigure_engine") : source_code.index(
+                "def get_selected_settings"
+            )
+        ]
+        self.assertIn("was_running = not runtime_only and", reconfigure_source)
+
+        match_source = source_code[
+            source_code.index("def _settings_match_config") : source_code.index(
+                "def _reconfigure_engine"
+            )
+        ]
+        self.assertIn("return not self._changed_settings(settings)", match_source)
+
+    def test_initial_population_runs_before_change_handlers_are_wired(self):
+        """Filling the pickers at open time does not run their change handlers."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn("self._load_and_apply_settings()\n        self._wire_signals()", source_code)
+
+        engine_source = source_code[
+            source_code.index("def _populate_engine_options") : source_code.index(
+                "def _get_selected_engine"
+            )
+        ]
+        blocked = "with _handler_blocked(self.engine_combo, self._engine_changed_id):"
+        self.assertLess(engine_source.index(blocked), engine_source.index("set_active_id("))
+
+    def test_model_fallback_selection_uses_precomputed_rows(self):
+        """The model picker is keyed by config sizes, so no row walking or recasing."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        populate_source = source_code[
+            source_code.index("def _populate_model_options") : source_code.index(
+                "def _populate_whispercpp_model_options"
+            )
+        ]
+        self.assertIn("rows.append((size, ", populate_source)
+        self.assertIn("self.model_combo.set_active_id(model_key)", populate_source)
+        self.assertNotIn("get_model()", populate_source)
+        self.assertNotIn(".capitalize()", populate_source)
+        # No picker in the dialog walks its tree model row by row to find a selection
+        self.assertNotIn("enumerate(model)", source_code)
+        self.assertNotIn(".get_model():", source_code)
+
+        selected_source = source_code[
+            source_code.index("def get_selected_settings") : source_code.index(
+                "language = language_id if language_id"
+            )
+        ]
+        self.assertIn('model_size = model_id or "small"', selected_source)
+
+    def test_engine_specific_widgets_are_skipped_by_show_all(self):
+        """Widgets for other engines are not mapped at open time only to be hidden."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        for widget in ("model_variant_row", "remote_server_group", "remote_status_label"):
+            self.assertIn(f"self.{widget}.set_no_show_all(True)", source_code)
+
+        update_source = source_code[
+            source_code.index("def _update_engine_specific_ui") : source_code.index(
+                "def _update_advanced_tab_sensitivity"
+            )
+        ]
+        self.assertIn(
+            'self._set_engine_widget_visible(self.model_variant_row, engine == "whisper_cpp")',
+            update_source,
+        )
+        self.assertIn(
+            "self._set_engine_widget_visible(self.remote_server_group, is_remote)", update_source
+        )
+        self.assertNotIn("self.remote_server_group.show_all()", update_source)
+        self.assertIn(
+            "self._set_engine_widget_visible(self.model_row, not is_remote)", update_source
+        )
+        self.assertNotIn("self.model_row.hide()", update_source)
+
+        # Init sets engine-driven visibility once, after the dialog-level show_all()
+        init_source = source_code[
+            source_code.index("self._load_and_apply_settings()\n        self._wire_signals()") : (
+                source_code.index("    def refresh(")
+            )
+        ]
+        self.assertEqual(init_source.count("self._update_engine_specific_ui()"), 1)
+        self.assertLess(
+            init_source.index("self.show_all()"),
+            init_source.index("self._update_engine_specific_ui()"),
+        )
+
+    def test_engine_changes_are_debounced(self):
+        """Only the engine the picker settles on rebuilds the model pickers."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertEqual(settings_dialog._ENGINE_CHANGE_DELAY_MS, 150)
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        changed_source = source_code[
+            source_code.index("def _on_engine_changed") : source_code.index(
+                "def _flush_pending_engine_change"
+            )
+        ]
+        self.assertIn("GLib.source_remove(self._engine_change_id)", changed_source)
+        self.assertIn("_ENGINE_CHANGE_DELAY_MS, self._apply_engine_change", changed_source)
+        self.assertNotIn("self._populate_model_options()", changed_source)
+
+        apply_source = source_code[
+            source_code.index("def _apply_engine_change") : source_code.index(
+                "def _update_voice_commands_for_engine"
+            )
+        ]
+        self.assertIn("self._engine_change_id = None", apply_source)
+        self.assertIn("self._populate_model_options()", apply_source)
+
+        # Anything that reads the pickers runs a pending switch first
+        auto_apply_source = source_code[
+            source_code.index("def _auto_apply_settings_now") : source_code.index(
+                "settings = self.get_selected_settings()"
+            )
+        ]
+        self.assertIn("self._flush_pending_engine_change()", auto_apply_source)
+        click_source = source_code[
+            source_code.index("def _on_test_clicked") : source_code.index(
+                "def _on_test_settings_applied"
+            )
+        ]
+        self.assertLess(
+            click_source.index("self._flush_pending_engine_change()"),
+            click_source.index("self.get_selected_settings()"),
+        )
+        destroy_source = source_code[
+            source_code.index("def _on_dialog_destroy") : source_code.index(
+                "def _on_recognition_state_changed"
+            )
+        ]
+        # Pending edits are run before the dialog goes away, in both close paths
+        self.assertLess(
+            destroy_source.index("self._flush_pending_engine_change()"),
+            destroy_source.index("self._flush_pending_auto_apply()"),
+        )
+        self.assertNotIn("GLib.source_remove(self._engine_change_id)", destroy_source)
+        self.assertNotIn("GLib.source_remove(self._apply_timeout_id)", destroy_source)
+        response_source = source_code[
+            source_code.index("def _on_settings_dialog_response") : source_code.index(
+                "def _on_advanced_prompt_changed"
+            )
+        ]
+        self.assertLess(
+            response_source.index("self._flush_pending_engine_change()"),
+            response_source.index("self._flush_pending_auto_apply()"),
+        )
+
+    def test_engine_and_size_names_are_not_recased_per_call(self):
+        """Display names come from the precomputed tables instead of per-call recasing."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn("engine_display = _engine_display_name(engine)", source_code)
+        self.assertNotIn("engine.capitalize()", source_code.split("def _engine_from_display")[1])
+
+        variant_source = source_code[
+            source_code.index("def _populate_whispercpp_variant_options") : source_code.index(
+                "def _on_engine_changed"
+            )
+        ]
+        self.assertNotIn(".lower()", variant_source)
+
+    def test_settings_pickers_are_filled_in_one_model_swap(self):
+        """No settings picker is filled one append() per row."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertNotIn("_combo.append(", source_code)
+        self.assertIn("_set_combo_rows(self.update_channel_combo, ", source_code)
+        self.assertIn("self.remote_api_endpoint_combo,\n", source_code)
+
+    def test_whispercpp_variant_picker_is_not_cleared_before_refill(self):
+        """Refilling whisper.cpp pickers with unchanged rows leaves them untouched."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        populate_source = source_code[
+            source_code.index("def _populate_model_options") : source_code.index(
+                "def _populate_whispercpp_model_options"
+            )
+        ]
+        before_engine = populate_source[: populate_source.index("engine_text = ")]
+        self.assertNotIn("_set_combo_rows(self.model_variant_combo, ())", before_engine)
+        guarded = populate_source[
+            populate_source.index('if engine != "whisper_cpp":') : populate_source.index(
+                'if engine == "remote_api":'
+            )
+        ]
+        self.assertIn("_set_combo_rows(self.model_variant_combo, ())", guarded)
+
+        combo = MagicMock()
+        rows = (("tiny", "Tiny"), ("base", "Base"))
+        with patch.object(settings_dialog, "Gtk", MagicMock()):
+            settings_dialog._set_combo_rows(combo, rows)
+            settings_dialog._set_combo_rows(combo, rows)
+        combo.set_model.assert_called_once()
+
+    def test_settings_load_reads_config_once(self):
+        """Opening the dialog checks the config file once and reuses the parsed config."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        load_source = source_code[
+            source_code.index("def _load_and_apply_settings") : source_code.index(
+                "def _populate_engine_options"
+            )
+        ]
+        self.assertEqual(load_source.count("self.config_manager.get_settings()"), 1)
+        self.assertNotIn("load_config", load_source)
+
+    def test_engine_fallback_selection_uses_index_lookup(self):
+        """A missed engine id falls back by a precomputed index, not by walking rows."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        engine_source = source_code[
+            source_code.index("def _populate_engine_options") : source_code.index(
+                "def _wire_signals"
+            )
+        ]
+        self.assertIn("if not self.engine_combo.set_active_id(engine_text):", engine_source)
+        self.assertIn(
+            "self.engine_combo.set_active(engine_id_to_index.get(self.current_engine, 0))",
+            engine_source,
+        )
+        self.assertNotIn("get_model()", engine_source)
+        self.assertNotIn("get_active_id() !=", engine_source)
+
+    def test_about_logo_is_rasterized_at_display_size(self):
+        """The About logo SVG is rendered once at 48 px, without a rescale pass."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        about_source = source_code[
+            source_code.index("def _build_about_section") : source_code.index(
+                "app_group = PreferencesGroup("
+            )
+        ]
+        self.assertIn("GdkPixbuf.Pixbuf.new_from_file_at_size(logo_path, 48, 48)", about_source)
+        self.assertNotIn("scale_simple(", about_source)
+
+    def test_model_pickers_are_filled_with_change_handlers_blocked(self):
+        """Refilling the model pickers does not run their change handlers."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        populate_source = source_code[
+            source_code.index("def _populate_model_options") : source_code.index(
+                "def _populate_whispercpp_model_options"
+            )
+        ]
+        # Parenthesized multi-item with statements need Python 3.10
+        self.assertNotIn("with (\n", populate_source)
+        blocked_models = "_handler_blocked(self.model_combo, self._model_changed_id)"
+        blocked_variants = "self.model_variant_combo, self._model_variant_changed_id"
+        self.assertLess(
+            populate_source.index(blocked_models),
+            populate_source.index("_set_combo_rows(self.model_combo, rows)"),
+        )
+        self.assertLess(
+            populate_source.index(blocked_variants),
+            populate_source.index("self._populate_whispercpp_model_options("),
+        )
+
+    def test_apply_settings_uses_remembered_download_state(self):
+        """Apply reuses the download checks made while filling the model pickers."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        apply_source = source_code[
+            source_code.index("    def apply_settings(self)") : source_code.index(
+                "def _apply_settings_internal"
+            )
+        ]
+        self.assertIn("self._is_model_downloaded(engine, model_name)", apply_source)
+        self.assertNotIn("_is_whisper_model_downloaded(", apply_source)
+        self.assertNotIn("_is_vosk_model_downloaded(", apply_source)
+        self.assertNotIn("is_whispercpp_model_downloaded(", apply_source)
+
+    def test_auto_apply_reconfigures_off_the_ui_thread(self):
+        """Auto-apply hands the engine reload to a worker and finishes on the main loop."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        auto_apply_source = source_code[
+            source_code.index("def _auto_apply_settings_now") : source_code.index(
+                "def _apply_in_background"
+            )
+        ]
+        self.assertIn("self._apply_in_background(settings)", auto_apply_source)
+        self.assertNotIn("self.speech_engine.reconfigure(", auto_apply_source)
+        # Early returns must not leave auto-apply switched off
+        self.assertIn("finally:\n            self._applying_settings = False", auto_apply_source)
+
+        background_source = source_code[
+            source_code.index("def _apply_in_background") : source_code.index(
+                "def _finish_background_apply"
+            )
+        ]
+        self.assertIn("self._reconfigure_engine(settings, runtime_only)", background_source)
+        # The config is written on the main loop, before the worker starts
+        self.assertLess(
+            background_source.index("runtime_only = self._save_for_reconfigure(settings)"),
+            background_source.index("threading.Thread("),
+        )
+        self.assertIn(
+            "GLib.idle_add(self._finish_background_apply, error, on_done)", background_source
+        )
+        self.assertIn("target=reconfigure_in_background", background_source)
+        self.assertIn('self.test_audio_btn.set_label("Applying…")', background_source)
+
+        internal_source = source_code[
+            source_code.index("def _apply_settings_internal") : source_code.index(
+                "def _show_apply_error"
+            )
+        ]
+        self.assertIn("GLib.idle_add(self._show_apply_error, str(e))", internal_source)
+        self.assertNotIn("Gtk.MessageDialog(", internal_source)
+
+        # The worker waits for the stop to complete instead of sleeping a fixed time
+        reconfigure_source = source_code[
+            source_code.index("def _reconfigure_engine") : source_code.index(
+                "def get_selected_settings"
+            )
+        ]
+        self.assertLess(
+            reconfigure_source.index("self.speech_engine.wait_until_idle(timeout=2.0)"),
+            reconfigure_source.index("self.speech_engine.reconfigure(**settings)"),
+        )
+        self.assertNotIn("sleep(", reconfigure_source)
+        self.assertNotIn("config_manager", reconfigure_source)
+        self.assertNotIn("_save_selected_settings", reconfigure_source)
+
+    def test_dictation_test_applies_settings_off_the_ui_thread(self):
+        """Changed settings are applied in the background before the test starts."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        click_source = source_code[
+            source_code.index("def _on_test_clicked") : source_code.index(
+                "def _on_test_settings_applied"
+            )
+        ]
+        self.assertIn(
+            "self._apply_in_background(selected_settings, self._on_test_settings_applied)",
+            click_source,
+        )
+        self.assertLess(
+            click_source.index("if not self._needs_model_download(selected_settings):"),
+            click_source.index("if not self._apply_selected_settings(selected_settings):"),
+        )
+        # The widgets are read once per click
+        self.assertEqual(click_source.count("self.get_selected_settings()"), 1)
+
+        finish_source = source_code[
+            source_code.index("def _finish_background_apply") : source_code.index(
+                "def _needs_model_download"
+            )
+        ]
+        self.assertIn("on_done(error)", finish_source)
+        self.assertIn("self._auto_apply_settings()", finish_source)
+
+    def test_background_apply_does_not_block_edits(self):
+        """Edits made while the engine reloads are kept, and a closed dialog is left alone."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        background_source = source_code[
+            source_code.index("def _apply_in_background") : source_code.index(
+                "def _finish_background_apply"
+            )
+        ]
+        # The handlers' guard flag is cleared before the worker runs
+        self.assertNotIn("_applying_settings", background_source)
+
+        auto_apply_source = source_code[
+            source_code.index("def _auto_apply_settings_now") : source_code.index(
+                "def _apply_in_background"
+            )
+        ]
+        self.assertLess(
+            auto_apply_source.index("if self._background_apply:"),
+            auto_apply_source.index("self._applying_settings = True"),
+        )
+        self.assertIn("self._reapply_after_background = True", auto_apply_source)
+
+        finish_source = source_code[
+            source_code.index("def _finish_background_apply") : source_code.index(
+                "def _needs_model_download"
+            )
+        ]
+        self.assertLess(
+            finish_source.index("if not self._dialog_is_alive():"),
+            finish_source.index("self.test_audio_btn"),
+        )
+
+    def test_dictation_test_output_is_built_on_first_test(self):
+        """The test transcription view is only created once a test is started."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        footer_source = source_code[
+            source_code.index("self.test_output_revealer = Gtk.Revealer()") : source_code.index(
+                "def _ensure_test_output"
+            )
+        ]
+        self.assertNotIn("Gtk.TextView(", footer_source)
+
+        ensure_source = source_code[
+            source_code.index("def _ensure_test_output") : source_code.index(
+                "def _on_close_clicked"
+            )
+        ]
+        self.assertIn("if self.test_buffer is not None:", ensure_source)
+        self.assertIn("self.test_textview = Gtk.TextView(", ensure_source)
+
+        click_source = source_code[
+            source_code.index("def _on_test_clicked") : source_code.index("def _test_text_callback")
+        ]
+        self.assertLess(
+            click_source.index("self._ensure_test_output()"),
+            click_source.index("self.test_buffer.set_text("),
+        )
+
+    def test_dictation_test_output_sets_properties_at_construction(self):
+        """The test output widgets get their properties in the constructor call."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        ensure_source = source_code[
+            source_code.index("def _ensure_test_output") : source_code.index(
+                "def _on_close_clicked"
+            )
+        ]
+        self.assertIn("editable=False, cursor_visible=False", ensure_source)
+        self.assertIn("min_content_height=60", ensure_source)
+        self.assertNotIn("self.test_textview.set_", ensure_source)
+        self.assertNotIn("scrolled_window.set_", ensure_source)
+
+    def test_dictation_test_compares_settings_by_key_set(self):
+        """The test button compares one set of keys instead of nested conditions."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        click_source = source_code[
+            source_code.index("def _on_test_clicked") : source_code.index(
+                "def _on_test_settings_applied"
+            )
+        ]
+        self.assertIn('keys |= {"vad_sensitivity", "silence_timeout"}', click_source)
+        self.assertIn(
+            "settings_differ = any("
+            "current_config.get(k) != selected_settings.get(k) for k in keys)",
+            click_source,
+        )
+        self.assertEqual(click_source.count("settings_differ ="), 1)
+        # The saved side comes from the in-memory config, fetched once per click
+        self.assertEqual(click_source.count("self.config_manager.get_settings()"), 1)
+        self.assertNotIn("load_config", click_source)
+
+    def test_dictation_test_append_does_not_copy_buffer(self):
+        """Appending a result picks its separator from a flag, not the buffer text."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        append_source = source_code[
+            source_code.index("def _append_test_result") : source_code.index("def _finalize_test")
+        ]
+        self.assertIn('separator = " " if self._test_has_text else ""', append_source)
+        self.assertNotIn("get_text(", append_source)
+        self.assertIn("scroll_to_mark(self._test_end_mark,", append_source)
+        self.assertNotIn("get_insert()", append_source)
+        # The buffer is looked up on self once per append
+        self.assertEqual(append_source.count("self.test_buffer"), 1)
+        # Blank results return before touching the buffer
+        self.assertLess(
+            append_source.index("if test_buffer is None or not text.strip():"),
+            append_source.index("test_buffer.insert("),
+        )
+
+        start_source = source_code[
+            source_code.index("def _start_test") : source_code.index("def _test_text_callback")
+        ]
+        self.assertIn("self._test_has_text = False", start_source)
+
+    def test_dictation_test_result_check_does_not_copy_buffer(self):
+        """The empty-result check reads a flag instead of copying the buffer text."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        check_source = source_code[
+            source_code.index("def _check_test_result") : source_code.index(
+                "def _show_whisper_install_dialog"
+            )
+        ]
+        self.assertIn("if not self._test_has_text:", check_source)
+        self.assertNotIn("get_text(", check_source)
+
+    def test_whisper_install_dialog_is_reused(self):
+        """The Whisper install help dialog is built once and hidden after each use."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertIn("./install.sh --with-whisper", settings_dialog._WHISPER_INSTALL_TEXT)
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        show_source = source_code[
+            source_code.index("def _show_whisper_install_dialog") : source_code.index(
+                "def apply_settings"
+            )
+        ]
+        self.assertIn("if dialog is None:", show_source)
+        self.assertIn("dialog.hide()", show_source)
+        self.assertNotIn("dialog.destroy()", show_source)
+
+    def test_apply_error_dialog_is_reused(self):
+        """The apply error dialog is built once and only its details are updated."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        error_source = source_code[
+            source_code.index("def _show_apply_error") : source_code.index(
+                "def _populate_gpu_devices"
+            )
+        ]
+        self.assertIn("if error_dialog is None:", error_source)
+        self.assertIn("error_dialog.hide()", error_source)
+        self.assertNotIn("error_dialog.destroy()", error_source)
+
+        destroy_source = source_code[
+            source_code.index("def _on_dialog_destroy") : source_code.index(
+                "def _on_recognition_state_changed"
+            )
+        ]
+        self.assertIn("self._apply_error_dialog.destroy()", destroy_source)
+
+    def test_dictation_test_result_is_checked_when_idle(self):
+        """The empty-result check is a one-shot idle callback, not another timer."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        self.assertIn("GLib.idle_add(self._check_test_result)", source_code)
+        self.assertNotIn("GLib.timeout_add(300, self._check_test_result)", source_code)
+
     def test_settings_dialog_has_close_button_only(self):
         """Test that SettingsDialog has a Close button but no Apply button.
 
@@ -485,6 +1312,54 @@ class TestSettingsDialogInstantApply(unittest.TestCase):
         self.assertIn('close_button.connect("clicked", self._on_close_clicked)', source_code)
         self.assertIn("self.response(Gtk.ResponseType.CLOSE)", source_code)
 
+    def test_about_page_is_built_on_first_visit(self):
+        """The About page is registered as a deferred builder, not built in __init__."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        init_source = source_code[
+            source_code.index("class SettingsDialog") : source_code.index("def navigate_to_page")
+        ]
+        self.assertIn('self._page_builders = {"about": self._build_about_page}', init_source)
+        self.assertNotIn("self._build_about_section()", init_source)
+        self.assertIn("self._ensure_page_built(visible)", source_code)
+
+    def test_language_change_only_repopulates_language_dependent_models(self):
+        """Switching language leaves the Whisper and Remote API model pickers alone."""
+        import os
+
+        source_path = os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "src",
+            "vocalinux",
+            "ui",
+            "settings_dialog.py",
+        )
+        with open(source_path, "r") as f:
+            source_code = f.read()
+
+        handler_source = source_code[
+            source_code.index("def _on_language_changed") : source_code.index(
+                "def _update_engine_specific_ui"
+            )
+        ]
+        self.assertIn(
+            'if _engine_from_display(engine_text) in ("vosk", "whisper_cpp"):\n'
+            "                self._populate_model_options()",
+            handler_source,
+        )
+
     def test_advanced_disclaimer_appears_before_controls(self):
         import os
 
@@ -596,6 +1471,456 @@ class TestSettingsDialogHelperFunctions(unittest.TestCase):
 
         self.assertTrue(callable(_get_recommended_vosk_model))
 
+    def test_is_vosk_model_downloaded_checks_directory_listing(self):
+        """Test that VOSK download checks look up model names in directory listings."""
+        from vocalinux.ui import settings_dialog
+
+        model_name = settings_dialog.VOSK_MODEL_INFO["small"]["languages"]["en-us"]
+        listings = {"/user/models": frozenset(), "/system/models": frozenset({model_name})}
+
+        with (
+            patch.object(settings_dialog, "_ALL_MODEL_DIRS", tuple(listings)),
+            patch.object(
+                settings_dialog, "_dir_entries", side_effect=listings.__getitem__
+            ) as dir_entries,
+        ):
+            self.assertTrue(settings_dialog._is_vosk_model_downloaded("small", "en-us"))
+            self.assertFalse(settings_dialog._is_vosk_model_downloaded("large", "en-us"))
+            dir_entries.assert_any_call("/system/models")
+
+    def test_is_whisper_model_downloaded_skips_missing_cache_dirs(self):
+        """Test that Whisper checks only list cache directories that exist."""
+        from vocalinux.ui import settings_dialog
+
+        with (
+            patch.object(settings_dialog, "_whisper_cache_dirs", return_value=()),
+            patch.object(settings_dialog, "_dir_entries") as dir_entries,
+        ):
+            self.assertFalse(settings_dialog._is_whisper_model_downloaded("base"))
+            dir_entries.assert_not_called()
+
+        with (
+            patch.object(settings_dialog, "_whisper_cache_dirs", return_value=("/cache/whisper",)),
+            patch.object(settings_dialog, "_dir_entries", return_value=frozenset({"base.pt"})),
+        ):
+            self.assertTrue(settings_dialog._is_whisper_model_downloaded("base"))
+            self.assertFalse(settings_dialog._is_whisper_model_downloaded("small"))
+
+    def test_dir_entries_lists_directory_once(self):
+        """Test that directory listings are cached until explicitly cleared."""
+        import os
+
+        from vocalinux.ui.settings_dialog import _dir_entries
+
+        tests_dir = os.path.dirname(os.path.abspath(__file__))
+        _dir_entries.cache_clear()
+        self.assertIn("conftest.py", _dir_entries(tests_dir))
+        self.assertIs(_dir_entries(tests_dir), _dir_entries(tests_dir))
+        self.assertEqual(_dir_entries("/nonexistent/vocalinux/models"), frozenset())
+
+    def test_coalesce_idle_delivers_latest_call_once(self):
+        """Calls made before the idle callback runs collapse into one delivery."""
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        received = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._coalesce_idle(lambda *args: received.append(args))
+            post(0.1, 1.0, "a")
+            post(0.2, 2.0, "b")
+            post(0.3, 3.0, "c")
+
+            mock_glib.idle_add.assert_called_once()
+            flush = mock_glib.idle_add.call_args[0][0]
+            self.assertFalse(flush())
+            self.assertEqual(received, [(0.3, 3.0, "c")])
+
+            post(0.4, 4.0, "d")
+            self.assertEqual(mock_glib.idle_add.call_count, 2)
+
+    def test_recognition_state_names_cover_every_state(self):
+        """Every engine state has a footer label with a matching status class."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertEqual(set(settings_dialog._RECOGNITION_STATE_NAMES), set(RecognitionState))
+        for name in settings_dialog._RECOGNITION_STATE_NAMES.values():
+            self.assertIn(name, settings_dialog._RECOGNITION_STATE_CLASSES)
+
+    def test_recognition_state_classes(self):
+        """Each footer state maps to a single status CSS class."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertEqual(
+            settings_dialog._RECOGNITION_STATE_CLASSES,
+            {
+                "Idle": "recognition-idle",
+                "Listening": "recognition-listening",
+                "Processing": "recognition-processing",
+                "Error": "recognition-error",
+            },
+        )
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        update_source = source_code[
+            source_code.index("def update_recognition_progress") : source_code.index(
+                "def connect_to_recognition_manager"
+            )
+        ]
+        self.assertIn("if css_class != self._recognition_state_class:", update_source)
+        self.assertIn(
+            "if abs(normalized_level - self.recognition_audio_level.get_value()) >= 1.0:",
+            update_source,
+        )
+        self.assertNotIn("remove_class(css_class)", update_source)
+        self.assertNotIn("get_style_context()", update_source)
+        self.assertIn(
+            "_set_markup_if_changed(self.progress_info_label, _MARKUP_PROGRESS_LISTENING)",
+            update_source,
+        )
+        self.assertNotIn("progress_info_label.set_markup(", update_source)
+
+    def test_late_audio_levels_do_not_reset_the_recognition_state(self):
+        """A level flush queued behind a state change only moves the level bar."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn("self._update_audio_level, priority=GLib.PRIORITY_LOW", source_code)
+        self.assertIn("self._post_audio_level(level)", source_code)
+
+        level_source = source_code[
+            source_code.index("def _update_audio_level") : source_code.index(
+                "def connect_to_recognition_manager"
+            )
+        ]
+        self.assertNotIn("update_recognition_progress", level_source)
+        self.assertLess(
+            level_source.index('!= _RECOGNITION_STATE_CLASSES["Listening"]:\n            return'),
+            level_source.index("self.recognition_audio_level.set_value("),
+        )
+
+    def test_audio_device_enumeration_is_reused_briefly(self):
+        """A fresh device enumeration is reused, and expires after a few seconds."""
+        from vocalinux.speech_recognition import recognition_manager
+        from vocalinux.ui import settings_dialog
+
+        devices = [(0, "USB Mic", True)]
+        with (
+            patch.object(recognition_manager, "get_audio_input_devices", return_value=devices),
+            patch.object(settings_dialog.time, "monotonic", return_value=100.0),
+        ):
+            self.assertEqual(settings_dialog._enumerate_audio_input_devices(), devices)
+            self.assertEqual(settings_dialog._recent_audio_input_devices(), devices)
+
+        expired = 100.0 + settings_dialog._AUDIO_DEVICE_CACHE_SECONDS
+        with patch.object(settings_dialog.time, "monotonic", return_value=expired):
+            self.assertIsNone(settings_dialog._recent_audio_input_devices())
+
+    def test_coalesce_idle_with_delay_uses_one_timeout(self):
+        """A delayed coalescer caps deliveries with a single pending timeout."""
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        received = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._coalesce_idle(lambda *args: received.append(args), 33)
+            for fraction in (0.1, 0.2, 0.3):
+                post(fraction, 1.0, "Downloading")
+
+            mock_glib.idle_add.assert_not_called()
+            mock_glib.timeout_add.assert_called_once()
+            delay, flush = mock_glib.timeout_add.call_args[0]
+            self.assertEqual(delay, 33)
+            self.assertFalse(flush())
+        self.assertEqual(received, [(0.3, 1.0, "Downloading")])
+
+    def test_coalesce_idle_passes_priority_to_idle_source(self):
+        """A coalescer created with a priority schedules its idle at that priority."""
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        received = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._coalesce_idle(
+                lambda *args: received.append(args), priority=mock_glib.PRIORITY_LOW
+            )
+            post(0.5, 5.0, "Listening")
+
+            mock_glib.idle_add.assert_called_once()
+            self.assertEqual(mock_glib.idle_add.call_args[1], {"priority": mock_glib.PRIORITY_LOW})
+            self.assertFalse(mock_glib.idle_add.call_args[0][0]())
+        self.assertEqual(received, [(0.5, 5.0, "Listening")])
+
+    def test_batch_idle_delivers_queued_items_together(self):
+        """Items posted before the idle callback runs arrive as one ordered batch."""
+        import threading
+
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        batches = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._batch_idle(batches.append)
+            worker = threading.Thread(target=lambda: [post(t) for t in ("hello", "there")])
+            worker.start()
+            worker.join()
+            # Queued behind the pending batch even though it is posted on the main thread
+            post("world")
+
+            mock_glib.idle_add.assert_called_once()
+            flush = mock_glib.idle_add.call_args[0][0]
+            self.assertFalse(flush())
+            self.assertEqual(batches, [["hello", "there", "world"]])
+
+            worker = threading.Thread(target=post, args=("again",))
+            worker.start()
+            worker.join()
+            self.assertEqual(mock_glib.idle_add.call_count, 2)
+
+    def test_dictation_test_results_share_one_append_per_batch(self):
+        """Results that arrive together are inserted and scrolled to once."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn(
+            "self._post_test_text = _batch_idle("
+            'lambda texts: self._append_test_result(" ".join(texts)))',
+            source_code,
+        )
+        callback_source = source_code[
+            source_code.index("def _test_text_callback") : source_code.index(
+                "def _append_test_result"
+            )
+        ]
+        self.assertIn("self._post_test_text(text)", callback_source)
+        self.assertNotIn("GLib.idle_add", callback_source)
+
+    def test_batch_idle_delivers_directly_on_main_thread(self):
+        """An item posted on the main thread with nothing queued skips the idle source."""
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        batches = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._batch_idle(batches.append)
+            post("hello")
+            post("world")
+
+        mock_glib.idle_add.assert_not_called()
+        self.assertEqual(batches, [["hello"], ["world"]])
+
+    def test_coalesce_idle_schedules_once_across_threads(self):
+        """A burst of calls from worker threads queues a single idle callback."""
+        import threading
+
+        from vocalinux.ui import settings_dialog
+
+        mock_glib = MagicMock()
+        received = []
+        with patch.object(settings_dialog, "GLib", mock_glib):
+            post = settings_dialog._coalesce_idle(lambda *args: received.append(args))
+            workers = [
+                threading.Thread(target=lambda: [post("Listening", i) for i in range(200)])
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            mock_glib.idle_add.assert_called_once()
+            mock_glib.idle_add.call_args[0][0]()
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0], "Listening")
+
+    def test_handler_blocked_blocks_and_restores_handler(self):
+        """The changed handler is blocked, and notify batched, for the block's span."""
+        from vocalinux.ui import settings_dialog
+
+        combo = MagicMock()
+        with settings_dialog._handler_blocked(combo, 42):
+            combo.handler_block.assert_called_once_with(42)
+            combo.handler_unblock.assert_not_called()
+        combo.handler_unblock.assert_called_once_with(42)
+        combo.freeze_notify.assert_called_once()
+        combo.thaw_notify.assert_called_once()
+
+    def test_handler_blocked_before_signals_are_wired(self):
+        """Without a handler id only property notifications are frozen."""
+        from vocalinux.ui import settings_dialog
+
+        combo = MagicMock()
+        with settings_dialog._handler_blocked(combo, None):
+            pass
+        combo.handler_block.assert_not_called()
+        combo.handler_unblock.assert_not_called()
+        combo.thaw_notify.assert_called_once()
+
+    def test_static_picker_rows(self):
+        """Shortcut and language rows are precomputed with the expected markers."""
+        from vocalinux.ui import settings_dialog
+
+        self.assertEqual(
+            settings_dialog._SHORTCUT_COMBO_ROWS[-1], ("__custom__", "Custom Shortcut")
+        )
+        whisper_rows = dict(settings_dialog._WHISPER_LANGUAGE_ROWS)
+        self.assertTrue(whisper_rows["auto"].endswith(" ⚠"))
+        self.assertTrue(settings_dialog._WHISPER_ENGLISH_LANGUAGE_ROWS)
+        for code, _ in settings_dialog._WHISPER_ENGLISH_LANGUAGE_ROWS:
+            self.assertTrue(settings_dialog._language_is_english(code))
+        self.assertNotIn("auto", dict(settings_dialog._VOSK_LANGUAGES))
+
+    def test_set_combo_rows_swaps_in_one_model(self):
+        """Combo rows are stored as (text, id) and attached in one call."""
+        from vocalinux.ui import settings_dialog
+
+        mock_gtk = MagicMock()
+        combo = MagicMock()
+        with patch.object(settings_dialog, "Gtk", mock_gtk):
+            settings_dialog._set_combo_rows(combo, [("en-us", "English (US)"), ("fr", "French")])
+
+        store = mock_gtk.ListStore.return_value
+        mock_gtk.ListStore.assert_called_once_with(str, str)
+        store.append.assert_any_call(("English (US)", "en-us"))
+        store.append.assert_any_call(("French", "fr"))
+        combo.set_model.assert_called_once_with(store)
+        combo.append.assert_not_called()
+
+    def test_static_pickers_are_filled_in_one_model_swap(self):
+        """Pickers with a fixed list of rows are filled through _set_combo_rows too."""
+        from vocalinux.ui import settings_dialog
+
+        with open(settings_dialog.__file__, "r") as f:
+            source_code = f.read()
+        self.assertIn(
+            "_set_combo_rows(self.shortcut_mode_combo, SHORTCUT_MODES.items())", source_code
+        )
+        self.assertIn(
+            "_set_combo_rows(\n            self.model_keepalive_timeout_combo,", source_code
+        )
+        self.assertNotIn("self.model_keepalive_timeout_combo.append(", source_code)
+
+    def test_model_rows_are_precomputed(self):
+        """Model picker labels are built once; only status markers are added per dialog."""
+        from vocalinux.ui import settings_dialog
+
+        whisper_rows = settings_dialog._MODEL_ROWS["whisper"]
+        self.assertEqual([row[0] for row in whisper_rows], settings_dialog.ENGINE_MODELS["whisper"])
+        self.assertIn(("tiny", "Tiny (75 MB)"), whisper_rows)
+        self.assertIn(("large", "Large v3 (2.9 GB)"), whisper_rows)
+        self.assertEqual(
+            [row[0] for row in settings_dialog._MODEL_ROWS["vosk"]],
+            settings_dialog.ENGINE_MODELS["vosk"],
+        )
+        self.assertEqual(
+            set(settings_dialog._WHISPERCPP_VARIANT_LABELS),
+            set(settings_dialog.WHISPERCPP_MODEL_INFO),
+        )
+
+    def test_set_markup_if_changed_skips_identical_markup(self):
+        """Label markup is only re-parsed when it actually changes."""
+        from vocalinux.ui import settings_dialog
+
+        label = MagicMock()
+        label.get_use_markup.return_value = True
+        label.get_label.return_value = "<b>Small</b>"
+
+        settings_dialog._set_markup_if_changed(label, "<b>Small</b>")
+        label.set_markup.assert_not_called()
+
+        settings_dialog._set_markup_if_changed(label, "<b>Base</b>")
+        label.set_markup.assert_called_once_with("<b>Base</b>")
+
+    def test_set_markup_if_changed_replaces_plain_text(self):
+        """Identical text set earlier without markup is still re-set as markup."""
+        from vocalinux.ui import settings_dialog
+
+        label = MagicMock()
+        label.get_use_markup.return_value = False
+        label.get_label.return_value = "Idle"
+
+        settings_dialog._set_markup_if_changed(label, "Idle")
+        label.set_markup.assert_called_once_with("Idle")
+
+        settings_dialog._set_text_if_changed(label, "Idle")
+        label.set_text.assert_not_called()
+
+    def test_add_classes_fetches_style_context_once(self):
+        """Several style classes are added through a single style context lookup."""
+        from vocalinux.ui import settings_dialog
+
+        widget = MagicMock()
+        settings_dialog._add_classes(widget, "info-box", "tip-label")
+
+        widget.get_style_context.assert_called_once_with()
+        context = widget.get_style_context.return_value
+        context.add_class.assert_any_call("info-box")
+        context.add_class.assert_any_call("tip-label")
+
+    def test_set_combo_rows_skips_unchanged_rows(self):
+        """Refilling a combo with the rows it already shows keeps its model."""
+        from vocalinux.ui import settings_dialog
+
+        mock_gtk = MagicMock()
+        combo = MagicMock()
+        rows = [("-1", "System Default"), ("2", "USB Mic (default)")]
+        with patch.object(settings_dialog, "Gtk", mock_gtk):
+            settings_dialog._set_combo_rows(combo, rows)
+            settings_dialog._set_combo_rows(combo, list(rows))
+            combo.set_model.assert_called_once()
+
+            settings_dialog._set_combo_rows(combo, rows[:1])
+        self.assertEqual(combo.set_model.call_count, 2)
+
+    def test_screen_geometry_is_cached(self):
+        """Test that monitor geometry is queried once and falls back without a display."""
+        from vocalinux.ui import settings_dialog
+
+        mock_gdk = MagicMock()
+        monitor = mock_gdk.Display.get_default.return_value.get_primary_monitor.return_value
+        monitor.get_geometry.return_value = Mock(width=2560, height=1440)
+        with patch.object(settings_dialog, "Gdk", mock_gdk):
+            settings_dialog._reset_screen_geometry()
+            self.assertEqual(settings_dialog._get_screen_geometry(), (2560, 1440))
+            self.assertEqual(settings_dialog._get_screen_geometry(), (2560, 1440))
+            mock_gdk.Display.get_default.assert_called_once()
+
+            mock_gdk.Display.get_default.return_value = None
+            settings_dialog._reset_screen_geometry()
+            self.assertEqual(settings_dialog._get_screen_geometry(), (1920, 1080))
+        settings_dialog._reset_screen_geometry()
+
+    def test_cuda_memory_detection_uses_nvidia_smi(self):
+        """Test that the Whisper GPU probe queries nvidia-smi instead of torch."""
+        from vocalinux.ui import settings_dialog
+
+        smi_result = Mock(returncode=0, stdout="8192\n")
+        with (
+            patch.dict(sys.modules, {"pynvml": None}),
+            patch.object(settings_dialog.os.path, "exists", return_value=True),
+            patch.object(settings_dialog.subprocess, "run", return_value=smi_result) as run,
+        ):
+            settings_dialog._detect_cuda_memory_gb.cache_clear()
+            self.assertEqual(settings_dialog._detect_cuda_memory_gb(), 8)
+            self.assertEqual(settings_dialog._detect_cuda_memory_gb(), 8)
+            run.assert_called_once()
+        settings_dialog._detect_cuda_memory_gb.cache_clear()
+
+    def test_cuda_memory_detection_without_driver(self):
+        """Test that no NVIDIA driver means no GPU and no subprocess."""
+        from vocalinux.ui import settings_dialog
+
+        with (
+            patch.dict(sys.modules, {"pynvml": None}),
+            patch.object(settings_dialog.os.path, "exists", return_value=False),
+            patch.object(settings_dialog.subprocess, "run") as run,
+        ):
+            settings_dialog._detect_cuda_memory_gb.cache_clear()
+            self.assertEqual(settings_dialog._detect_cuda_memory_gb(), 0)
+            run.assert_not_called()
+        settings_dialog._detect_cuda_memory_gb.cache_clear()
+
     def test_whispercpp_settings_use_size_buckets(self):
         """Test that whisper.cpp settings split size from specialization."""
         from vocalinux.ui.settings_dialog import ENGINE_MODELS, WHISPERCPP_MODEL_INFO
@@ -52,10 +52,11 @@ class TestSettingsDialogShortcutsSection(unittest.TestCase):
     def test_shortcut_options_populated(self):
         """Test that shortcut options are populated from SHORTCUT_DISPLAY_NAMES."""
         self.assertIn("for group_label, shortcut_ids in SHORTCUT_GROUPS.items()", self.source_code)
+        self.assertIn('rows.append((separator_id, f"── {group_label} ──"))', self.source_code)
+        self.assertIn("for shortcut_id in shortcut_ids", self.source_code)
         self.assertIn(
-            'self.shortcut_combo.append(separator_id, f"── {group_label} ──")', self.source_code
+            "_set_combo_rows(self.shortcut_combo, _SHORTCUT_COMBO_ROWS)", self.source_code
         )
-        self.assertIn("for shortcut_id in shortcut_ids", self.source_code)
 
     def test_shortcut_config_read(self):
         """Test that shortcut is read from config."""
@@ -74,7 +75,11 @@ class TestSettingsDialogShortcutsSection(unittest.TestCase):
 
     def test_shortcut_change_triggers_save(self):
         """Test that shortcut change triggers config save."""
-        # After setting the shortcut, save_settings should be called
+        # After setting the shortcut, a (debounced) config save is scheduled
+        handler_start = self.source_code.index("def _on_shortcut_changed")
+        handler_end = self.source_code.index("\n    def ", handler_start)
+        handler_source = self.source_code[handler_start:handler_end]
+        self.assertIn("self._schedule_config_save()", handler_source)
         self.assertIn("self.config_manager.save_settings()", self.source_code)
 
     def test_shortcut_preference_row_title(self):
@@ -101,7 +106,7 @@ class TestSettingsDialogShortcutsSection(unittest.TestCase):
 
     def test_shortcut_info_box_styling(self):
         """Test that info box has proper styling."""
-        self.assertIn('get_style_context().add_class("info-box")', self.source_code)
+        self.assertIn('_add_classes(info_box, "info-box")', self.source_code)
 
     def test_shortcut_group_title(self):
         """Test that shortcuts group has proper title."""
@@ -117,9 +122,7 @@ class TestSettingsDialogShortcutsSection(unittest.TestCase):
 
     def test_custom_shortcut_option_in_combo(self):
         """Preset combo includes a Custom Shortcut sentinel for non-presets."""
-        self.assertIn(
-            'self.shortcut_combo.append("__custom__", "Custom Shortcut")', self.source_code
-        )
+        self.assertIn('rows.append(("__custom__", "Custom Shortcut"))', self.source_code)
         self.assertIn("def _sync_shortcut_selection_ui(self, shortcut: str)", self.source_code)
 
     def test_preset_selection_clears_custom_entry(self):
@@ -54,6 +54,7 @@ mock_temp_file.name = "/tmp/tmpfile.wav"
 mock_temp_file.__enter__ = MagicMock(return_value=mock_temp_file)
 mock_temp_file.__exit__ = MagicMock(return_value=None)
 mock_tempfile.NamedTemporaryFile = MagicMock(return_value=mock_temp_file)
+_real_tempfile = sys.modules.get("tempfile")
 sys.modules["tempfile"] = mock_tempfile
 
 mock_wave = MagicMock()
@@ -71,6 +72,9 @@ from vocalinux.common_types import RecognitionState  # noqa: E402
 from vocalinux.speech_recognition.recognition_manager import SpeechRecognitionManager  # noqa: E402
 from vocalinux.utils.vosk_model_info import VOSK_MODEL_INFO  # noqa: E402
 
+# Later test modules need real temporary directories
+sys.modules["tempfile"] = _real_tempfile
+
 
 class TestSpeechRecognition(unittest.TestCase):
     """Test cases for the speech recognition functionality."""
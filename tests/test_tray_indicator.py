@@ -542,6 +542,19 @@ class TestTrayIndicator(unittest.TestCase):
 
             mock_menu_item.set_sensitive.assert_called_with(False)
 
+    def test_set_menu_item_enabled_uses_recorded_items(self):
+        """Menu items are looked up by label without walking the menu."""
+        self.tray_indicator.menu = MagicMock()
+        with patch("vocalinux.ui.tray_indicator.Gtk.MenuItem.new_with_label") as new_item:
+            new_item.return_value = MagicMock()
+            item = self.tray_indicator._add_menu_item("Start Voice Typing", MagicMock())
+        self.assertIs(self.tray_indicator._menu_items["Start Voice Typing"], item)
+
+        self.tray_indicator._set_menu_item_enabled("Start Voice Typing", False)
+        item.set_sensitive.assert_called_once_with(False)
+        self.tray_indicator._set_menu_item_enabled("Not A Menu Item", True)
+        self.tray_indicator.menu.get_children.assert_not_called()
+
     def test_on_logs_clicked(self):
         """Test View Logs menu item click handler."""
         # The LoggingDialog is imported inside the method, so we need to patch
@@ -567,7 +580,9 @@ class TestTrayIndicator(unittest.TestCase):
 
             mock_dialog = MagicMock()
             self.tray_indicator._on_settings_dialog_response(mock_dialog, 1)  # CLOSE
-            mock_dialog.destroy.assert_called_once()
+            mock_dialog.disconnect_from_recognition_manager.assert_called_once()
+            mock_dialog.hide.assert_called_once()
+            mock_dialog.destroy.assert_not_called()
 
     def test_on_settings_dialog_response_delete_event(self):
         """Test settings dialog response handler for DELETE_EVENT."""
@@ -577,7 +592,65 @@ class TestTrayIndicator(unittest.TestCase):
 
             mock_dialog = MagicMock()
             self.tray_indicator._on_settings_dialog_response(mock_dialog, 2)  # DELETE_EVENT
-            mock_dialog.destroy.assert_called_once()
+            mock_dialog.hide.assert_called_once()
+            mock_dialog.destroy.assert_not_called()
+
+    def test_settings_dialog_is_reused(self):
+        """A second open refreshes and presents the cached dialog instead of rebuilding."""
+        with patch("vocalinux.ui.tray_indicator.SettingsDialog") as mock_dialog_class:
+            mock_dialog_instance = MagicMock()
+            mock_dialog_class.return_value = mock_dialog_instance
+
+            self.tray_indicator._on_settings_clicked(None)
+            self.tray_indicator._on_about_clicked(None)
+
+            mock_dialog_class.assert_called_once()
+            mock_dialog_instance.refresh.assert_called_once_with(
+                initial_page="about", pending_update=None
+            )
+            mock_dialog_instance.present.assert_called_once()
+
+    def test_deleted_settings_dialog_is_kept_for_reuse(self):
+        """Closing from the title bar or Esc hides the dialog; the next open reuses it."""
+        with patch("vocalinux.ui.tray_indicator.SettingsDialog") as mock_dialog_class:
+            mock_dialog_instance = MagicMock()
+            mock_dialog_class.return_value = mock_dialog_instance
+
+            self.tray_indicator._on_settings_clicked(None)
+            mock_dialog_instance.connect.assert_any_call(
+                "delete-event", self.tray_indicator._on_settings_dialog_delete
+            )
+            # Gtk.Dialog emits the DELETE_EVENT response, then runs delete-event handlers
+            with patch("vocalinux.ui.tray_indicator.Gtk") as patched_gtk:
+                patched_gtk.ResponseType.CLOSE = 1
+                patched_gtk.ResponseType.DELETE_EVENT = 2
+                self.tray_indicator._on_settings_dialog_response(mock_dialog_instance, 2)
+            self.assertTrue(
+                self.tray_indicator._on_settings_dialog_delete(mock_dialog_instance, MagicMock())
+            )
+            mock_dialog_instance.destroy.assert_not_called()
+            self.assertIs(self.tray_indicator._settings_dialog, mock_dialog_instance)
+
+            self.tray_indicator._on_settings_clicked(None)
+
+            mock_dialog_class.assert_called_once()
+            mock_dialog_instance.refresh.assert_called_once_with(
+                initial_page=None, pending_update=None
+            )
+            mock_dialog_instance.present.assert_called_once()
+
+    def test_destroyed_settings_dialog_is_forgotten(self):
+        """Destroying the cached dialog makes the next open build a new one."""
+        with patch("vocalinux.ui.tray_indicator.SettingsDialog") as mock_dialog_class:
+            first, second = MagicMock(), MagicMock()
+            mock_dialog_class.side_effect = [first, second]
+
+            self.tray_indicator._on_settings_clicked(None)
+            self.tray_indicator._on_settings_dialog_destroy(first)
+            self.tray_indicator._on_settings_clicked(None)
+
+            self.assertEqual(mock_dialog_class.call_count, 2)
+            self.assertIs(self.tray_indicator._settings_dialog, second)
 
     def test_on_quit_clicked(self):
         """Test Quit menu item click handler."""